@@ -5,15 +5,32 @@ from __future__ import annotations
 import gzip
 import hashlib
 import json
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal
 
 import diskcache
+import lz4.frame
 import structlog
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = structlog.get_logger()
 
+CompressionCodec = Literal["lz4", "gzip", "none"]
+_CODECS: frozenset[str] = frozenset({"lz4", "gzip", "none"})
+_LZ4_MAGIC = b"LZ4\x00"
+_GZIP_MAGIC = b"\x1f\x8b"
+# Payloads at or below this size are stored raw; framing overhead outweighs savings.
+COMPRESSION_MIN_BYTES = 1024
+# Weight of the latest lookup in the exponentially smoothed hit rate (~100-lookup window).
+HIT_RATE_EWMA_ALPHA = 0.01
+# Written into cache directories whose entries are all tagged with their source.
+TAGGED_MARKER = ".source-tags"
+
 
 @dataclass
 class CacheConfig:
@@ -23,7 +40,7 @@ class CacheConfig:
     cache_dir: Path = Path(".cache")
     size_limit: int = 50 * 1024**3  # 50 GB
     eviction_policy: str = "least-recently-used"
-    compression: bool = True
+    compression: CompressionCodec | bool = "lz4"  # True -> "lz4", False -> "none"
     default_ttl: int = 86400  # 24 hours in seconds
 
     # TTL per data source (in seconds)
@@ -35,6 +52,12 @@ class CacheConfig:
     ttl_routing: int = 30 * 86400  # 30 days
     ttl_overture: int = 90 * 86400  # 90 days (quarterly releases)
 
+    def __post_init__(self) -> None:
+        if isinstance(self.compression, bool):
+            self.compression = "lz4" if self.compression else "none"
+        if self.compression not in _CODECS:
+            raise ValueError(f"Unknown compression codec: {self.compression}")
+
 
 class CacheManager:
     """Manage caching for API responses and computed results."""
@@ -48,7 +71,9 @@ class CacheManager:
         """
         self.config = config or CacheConfig()
         self.cache = self._initialize_backend()
+        self._untagged_entries = self._detect_untagged_entries()
         self.stats = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0}
+        self._hit_ewma = 0.5
 
     def _initialize_backend(self) -> diskcache.Cache:
         """Initialize the cache backend."""
@@ -58,6 +83,7 @@ class CacheManager:
                 str(self.config.cache_dir),
                 size_limit=self.config.size_limit,
                 eviction_policy=self.config.eviction_policy,
+                tag_index=True,
             )
         elif self.config.backend == "redis":
             # Redis backend would go here
@@ -65,6 +91,39 @@ class CacheManager:
         else:
             raise ValueError(f"Unknown cache backend: {self.config.backend}")
 
+    def _detect_untagged_entries(self) -> bool:
+        """Return whether the cache may hold entries written before source tagging."""
+        marker = self.config.cache_dir / TAGGED_MARKER
+        if marker.exists():
+            return False
+        if len(self.cache) == 0:
+            marker.touch()
+            return False
+        return True
+
+    def _retag_legacy_entries(self) -> int:
+        """Tag entries written before source tagging with their source, once.
+
+        Afterwards the marker is written, so later invalidations never scan.
+        """
+        retagged = 0
+        now = time.time()
+        for key in list(self.cache.iterkeys()):
+            if not isinstance(key, str) or ":" not in key:
+                continue
+            value, expire_time, tag = self.cache.get(key, expire_time=True, tag=True)
+            if tag is not None or value is None:
+                continue
+            if expire_time is not None and expire_time <= now:
+                continue
+            remaining = None if expire_time is None else expire_time - now
+            self.cache.set(key, value, expire=remaining, tag=key.partition(":")[0])
+            retagged += 1
+        (self.config.cache_dir / TAGGED_MARKER).touch()
+        self._untagged_entries = False
+        logger.info("cache_legacy_entries_retagged", count=retagged)
+        return retagged
+
     def _make_key(self, source: str, entity_type: str, entity_id: str) -> str:
         """
         Create a cache key.
@@ -77,24 +136,33 @@ class CacheManager:
         Returns:
             Cache key string
         """
-        # Hash entity_id if it's very long (e.g., coordinates, complex queries)
+        # Hash entity_id if it's very long (e.g., coordinates, complex queries). The key
+        # is not security sensitive, so an 8-byte BLAKE2b digest replaces truncated SHA-256.
         if len(entity_id) > 100:
-            entity_id_hash = hashlib.sha256(entity_id.encode()).hexdigest()[:16]
+            entity_id_hash = hashlib.blake2b(entity_id.encode(), digest_size=8).hexdigest()
             return f"{source}:{entity_type}:{entity_id_hash}"
 
         return f"{source}:{entity_type}:{entity_id}"
 
     def _compress(self, data: bytes) -> bytes:
-        """Compress data using gzip."""
-        if not self.config.compression:
+        """Compress data with the configured codec, tagging LZ4 frames with a magic prefix."""
+        if self.config.compression == "none" or len(data) <= COMPRESSION_MIN_BYTES:
             return data
+        if self.config.compression == "lz4":
+            return _LZ4_MAGIC + lz4.frame.compress(data, compression_level=0)
         return gzip.compress(data, compresslevel=6)
 
     def _decompress(self, data: bytes) -> bytes:
-        """Decompress gzipped data."""
-        if not self.config.compression:
-            return data
-        return gzip.decompress(data)
+        """Decompress data based on its prefix so entries survive codec changes."""
+        if data.startswith(_LZ4_MAGIC):
+            return lz4.frame.decompress(memoryview(data)[len(_LZ4_MAGIC) :])
+        if data.startswith(_GZIP_MAGIC):
+            return gzip.decompress(data)
+        return data
+
+    def _encode(self, value: Any) -> bytes:
+        """Serialize a value to JSON and compress it for storage."""
+        return self._compress(json.dumps(value).encode("utf-8"))
 
     def get(self, source: str, entity_type: str, entity_id: str, default: Any = None) -> Any | None:
         """
@@ -115,15 +183,17 @@ class CacheManager:
             compressed_data = self.cache.get(key)
             if compressed_data is None:
                 self.stats["misses"] += 1
+                self._hit_ewma -= HIT_RATE_EWMA_ALPHA * self._hit_ewma
                 logger.debug("cache_miss", key=key)
                 return default
 
             self.stats["hits"] += 1
+            self._hit_ewma += HIT_RATE_EWMA_ALPHA * (1.0 - self._hit_ewma)
             logger.debug("cache_hit", key=key)
 
             # Decompress and deserialize
             data_bytes = self._decompress(compressed_data)
-            return json.loads(data_bytes.decode("utf-8"))
+            return json.loads(data_bytes)
 
         except Exception as e:
             logger.error("cache_get_error", key=key, error=str(e))
@@ -158,11 +228,10 @@ class CacheManager:
 
         try:
             # Serialize and compress
-            data_bytes = json.dumps(value).encode("utf-8")
-            compressed_data = self._compress(data_bytes)
+            compressed_data = self._encode(value)
 
             # Set with expiration
-            self.cache.set(key, compressed_data, expire=ttl)
+            self.cache.set(key, compressed_data, expire=ttl, tag=source)
             self.stats["sets"] += 1
             logger.debug("cache_set", key=key, size=len(compressed_data), ttl=ttl)
             return True
@@ -189,6 +258,11 @@ class CacheManager:
         """
         Invalidate cache entries.
 
+        Entries are tagged with their source, so source-wide invalidation is a
+        single indexed delete. A cache directory that predates tagging is
+        re-tagged by one key scan on first use. Filtering by entity type still
+        scans keys.
+
         Args:
             source: Data source to invalidate
             entity_type: Optional entity type filter
@@ -199,12 +273,16 @@ class CacheManager:
         count = 0
 
         try:
-            for key in list(self.cache.iterkeys()):
-                if key.startswith(f"{source}:") and (
-                    entity_type is None or f":{entity_type}:" in key
-                ):
-                    self.cache.delete(key)
-                    count += 1
+            if self._untagged_entries:
+                self._retag_legacy_entries()
+            if entity_type is None:
+                count = self.cache.evict(source, retry=True)
+            else:
+                prefix = f"{source}:{entity_type}:"
+                for key in list(self.cache.iterkeys()):
+                    if isinstance(key, str) and key.startswith(prefix):
+                        self.cache.delete(key)
+                        count += 1
 
             logger.info("cache_invalidated", source=source, entity_type=entity_type, count=count)
             return count
@@ -216,12 +294,17 @@ class CacheManager:
     def clear(self) -> None:
         """Clear all cache entries."""
         self.cache.clear()
+        (self.config.cache_dir / TAGGED_MARKER).touch()
+        self._untagged_entries = False
         logger.info("cache_cleared")
 
     def get_stats(self) -> dict[str, Any]:
         """
         Get cache statistics.
 
+        ``hit_rate`` is exact over the manager's lifetime; ``hit_rate_ewma`` is
+        an exponentially smoothed rate that tracks recent lookups.
+
         Returns:
             Dictionary with cache stats
         """
@@ -233,24 +316,60 @@ class CacheManager:
             "misses": self.stats["misses"],
             "sets": self.stats["sets"],
             "hit_rate": hit_rate,
+            "hit_rate_ewma": self._hit_ewma * 100,
             "total_size": self.cache.volume(),
             "entry_count": len(self.cache),
         }
 
-    def warm_cache(self, entries: list[tuple[str, str, str, Any]]) -> int:
+    def warm_cache(self, entries: Iterable[tuple[str, str, str, Any]]) -> int:
         """
         Pre-populate cache with common queries.
 
+        All entries are written inside a single diskcache transaction so bulk
+        warming pays for one SQLite commit instead of one per entry. Entries
+        that fail to serialize are skipped; a backend failure rolls back the
+        whole batch.
+
         Args:
-            entries: List of (source, entity_type, entity_id, value) tuples
+            entries: Iterable of (source, entity_type, entity_id, value) tuples
 
         Returns:
             Number of entries warmed
         """
         count = 0
-        for source, entity_type, entity_id, value in entries:
-            if self.set(source, entity_type, entity_id, value):
-                count += 1
+        try:
+            with self.cache.transact(retry=True):
+                for source, entity_type, entity_id, value in entries:
+                    key = self._make_key(source, entity_type, entity_id)
+                    try:
+                        payload = self._encode(value)
+                    except (TypeError, ValueError) as e:
+                        logger.error("cache_set_error", key=key, error=str(e))
+                        continue
+                    self.cache.set(
+                        key, payload, expire=self._get_ttl_for_source(source), tag=source
+                    )
+                    count += 1
+        except Exception as e:
+            logger.error("cache_warm_error", error=str(e))
+            return 0
 
+        self.stats["sets"] += count
         logger.info("cache_warmed", count=count)
         return count
+
+    def warm_cache_from_arrow(self, table: pa.Table) -> int:
+        """
+        Pre-populate cache from an Arrow table.
+
+        Args:
+            table: Table with ``source``, ``entity_type``, ``entity_id`` and ``value`` columns
+
+        Returns:
+            Number of entries warmed
+        """
+        columns = [
+            table.column(name).to_pylist()
+            for name in ("source", "entity_type", "entity_id", "value")
+        ]
+        return self.warm_cache(zip(*columns, strict=True))
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import cast
 
 import numpy as np
+import orjson
 import pandas as pd
 import typer
 
@@ -489,7 +490,9 @@ def cli_export(
         )
     collection = {"type": "FeatureCollection", "features": features}
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(collection, indent=2), encoding="utf-8")
+    # orjson encodes the collection straight to UTF-8 bytes, and writes NaN
+    # properties as null rather than emitting invalid JSON.
+    output.write_bytes(orjson.dumps(collection, option=orjson.OPT_INDENT_2))
     typer.echo(f"Wrote GeoJSON to {output}")
 
 
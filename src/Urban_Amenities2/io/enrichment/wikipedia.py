@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import hashlib
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, Protocol, cast
 
 import pandas as pd
 import requests
+from cachetools import LRUCache
 from diskcache import Cache
 
 from ...logging_utils import get_logger
@@ -76,8 +77,25 @@ class SessionProtocol(Protocol):
         ...
 
 
+# Titles with their own circuit breaker state; the least recently fetched are dropped.
+BREAKER_CACHE_SIZE = 1024
+
+
+def _default_breaker() -> CircuitBreakerProtocol:
+    return CircuitBreaker(
+        failure_threshold=5,
+        recovery_timeout=60.0,
+        expected_exceptions=(requests.RequestException,),
+    )
+
+
 class WikipediaClient:
-    """Client with rate limiting, caching, and graceful fallbacks."""
+    """Client with rate limiting, caching, and graceful fallbacks.
+
+    Unless a shared ``circuit_breaker`` is supplied, each title gets its own
+    breaker from ``circuit_breaker_factory``, so one failing article fails fast
+    without blocking fetches for the others.
+    """
 
     def __init__(
         self,
@@ -89,6 +107,7 @@ class WikipediaClient:
         session: SessionProtocol | None = None,
         rate_limiter: RateLimiterProtocol | None = None,
         circuit_breaker: CircuitBreakerProtocol | None = None,
+        circuit_breaker_factory: Callable[[], CircuitBreakerProtocol] | None = None,
     ) -> None:
         self.project = project
         self.session = cast(SessionProtocol, session or requests.Session())
@@ -100,15 +119,9 @@ class WikipediaClient:
             RateLimiterProtocol,
             rate_limiter or RateLimiter(max_requests_per_sec, per=1.0),
         )
-        self.circuit_breaker = cast(
-            CircuitBreakerProtocol,
-            circuit_breaker
-            or CircuitBreaker(
-                failure_threshold=5,
-                recovery_timeout=60.0,
-                expected_exceptions=(requests.RequestException,),
-            ),
-        )
+        self.circuit_breaker = circuit_breaker
+        self.circuit_breaker_factory = circuit_breaker_factory or _default_breaker
+        self._breakers: LRUCache[str, CircuitBreakerProtocol] = LRUCache(maxsize=BREAKER_CACHE_SIZE)
 
     def fetch(
         self,
@@ -119,16 +132,19 @@ class WikipediaClient:
         """Fetch pageview history for a title, falling back to cached data."""
 
         key = self._cache_key(title, months)
-        cached = self.cache.get(key)
+        # The cached copy is only a fallback, so it is read (and unpickled) only
+        # once the remote fetch has failed.
         try:
             data = self._fetch_remote(title, months)
         except CircuitBreakerOpenError:
             LOGGER.error("wikipedia_circuit_open", title=self._safe_title(title))
+            cached = self.cache.get(key)
             if cached is not None:
                 return self._to_frame(cached)
             raise
         except requests.RequestException as exc:
             LOGGER.warning("wikipedia_fetch_failed", title=self._safe_title(title), error=str(exc))
+            cached = self.cache.get(key)
             if cached is not None:
                 return self._to_frame(cached)
             raise
@@ -168,7 +184,16 @@ class WikipediaClient:
                 exceptions=(requests.RequestException,),
             )
 
-        return self.circuit_breaker.call(_wrapped)
+        return self._breaker_for(title).call(_wrapped)
+
+    def _breaker_for(self, title: str) -> CircuitBreakerProtocol:
+        if self.circuit_breaker is not None:
+            return self.circuit_breaker
+        breaker = self._breakers.get(title)
+        if breaker is None:
+            breaker = self.circuit_breaker_factory()
+            self._breakers[title] = breaker
+        return breaker
 
     def _normalise_records(self, records: list[dict[str, object]]) -> pd.DataFrame:
         if not records:
@@ -48,8 +48,17 @@ class SnapshotRegistry:
         return records
 
     def latest_for(self, source: str) -> SnapshotRecord | None:
-        records = [record for record in self.list_snapshots() if record.source == source]
-        return records[-1] if records else None
+        # Called before every append, so only parse lines that can mention the source.
+        needle = json.dumps(source)
+        latest: SnapshotRecord | None = None
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if needle not in line:
+                    continue
+                record = SnapshotRecord(**json.loads(line))
+                if record.source == source:
+                    latest = record
+        return latest
 
     def has_changed(self, source: str, data: bytes) -> bool:
         sha = hashlib.sha256(data).hexdigest()
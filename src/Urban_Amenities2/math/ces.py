@@ -115,7 +115,12 @@ def compute_z(
 
 
 def _geometric_mean(product: NDArray[np.float64], axis: int) -> NDArray[np.float64]:
-    log_values = np.log(np.clip(product, EPSILON, None))
+    if np.all(product >= EPSILON):
+        log_values = np.log(product)
+    else:
+        # Zeros are possible: clip into a fresh buffer and take the log in place.
+        log_values = np.clip(product, EPSILON, None)
+        np.log(log_values, out=log_values)
     return np.asarray(np.exp(log_values.mean(axis=axis)), dtype=float)
 
 
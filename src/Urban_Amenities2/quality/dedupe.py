@@ -6,6 +6,7 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 from numpy.typing import NDArray
+from scipy.spatial import cKDTree
 
 EARTH_RADIUS_M = 6_371_000.0
 LOGGER = logging.getLogger("aucs.quality.dedupe")
@@ -55,14 +56,7 @@ def apply_brand_dedupe(
         if len(group) < 2:
             continue
         coords = group[[config.lat_column, config.lon_column]].to_numpy(dtype=float)
-        distances = _pairwise_distance(coords)
-        nearest = np.where(
-            (distances > 0) & (distances <= config.distance_threshold_m),
-            distances,
-            np.nan,
-        )
-        penalty = np.nanmin(nearest, axis=1)
-        penalty = np.where(np.isfinite(penalty), penalty, np.nan)
+        penalty = _nearest_within(coords, config.distance_threshold_m)
         factors = np.ones(len(group), dtype=float)
         close_mask = np.isfinite(penalty)
         if np.any(close_mask):
@@ -107,17 +101,43 @@ def apply_brand_dedupe(
     return frame.drop(columns=["brand_weight_raw"]), stats
 
 
-def _pairwise_distance(coords: NDArray[np.float64]) -> NDArray[np.float64]:
-    if coords.size == 0:
-        return np.zeros((0, 0), dtype=float)
+def _unit_vectors(coords: NDArray[np.float64]) -> NDArray[np.float64]:
     lat = np.radians(coords[:, 0])
     lon = np.radians(coords[:, 1])
-    delta_lat = lat[:, None] - lat[None, :]
-    delta_lon = lon[:, None] - lon[None, :]
-    a = (
-        np.sin(delta_lat / 2) ** 2
-        + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(delta_lon / 2) ** 2
-    )
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def _nearest_within(coords: NDArray[np.float64], threshold_m: float) -> NDArray[np.float64]:
+    """Distance to the nearest distinct neighbour within ``threshold_m`` (NaN if none).
+
+    Neighbours are found with a KD-tree over unit-sphere vectors, so only pairs
+    inside the chord radius are materialised instead of the full O(n²) matrix.
+    """
+
+    if len(coords) < 2 or threshold_m <= 0:
+        return np.full(len(coords), np.nan, dtype=float)
+    nearest = np.full(len(coords), np.inf, dtype=float)
+    angle = min(threshold_m / EARTH_RADIUS_M, np.pi)
+    # Pad the chord radius slightly; exact haversine distances are filtered below.
+    chord = 2.0 * np.sin(angle / 2.0) * (1.0 + 1e-9)
+    tree = cKDTree(_unit_vectors(coords))
+    pairs = tree.query_pairs(chord, output_type="ndarray")
+    if len(pairs):
+        left, right = pairs[:, 0], pairs[:, 1]
+        distances = _haversine(coords[left], coords[right])
+        keep = (distances > 0) & (distances <= threshold_m)
+        np.minimum.at(nearest, left[keep], distances[keep])
+        np.minimum.at(nearest, right[keep], distances[keep])
+    return np.where(np.isfinite(nearest), nearest, np.nan)
+
+
+def _haversine(origin: NDArray[np.float64], target: NDArray[np.float64]) -> NDArray[np.float64]:
+    lat1 = np.radians(origin[:, 0])
+    lat2 = np.radians(target[:, 0])
+    delta_lat = lat2 - lat1
+    delta_lon = np.radians(target[:, 1] - origin[:, 1])
+    a = np.sin(delta_lat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(delta_lon / 2) ** 2
     distances = 2 * EARTH_RADIUS_M * np.arcsin(np.clip(np.sqrt(a), 0, 1))
     return np.asarray(distances, dtype=float)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections.abc import Iterable, Mapping, Sequence
 from pathlib import Path
 from typing import Any, cast
@@ -23,6 +24,10 @@ from .scores_controls import SUBSCORE_DESCRIPTIONS
 
 OVERLAY_IDS: frozenset[OverlayId] = frozenset(option["value"] for option in OVERLAY_OPTIONS)
 
+# Upper zoom bound (inclusive) for each H3 resolution; deeper zooms use the last entry.
+_ZOOM_THRESHOLDS = (5.0, 8.0, 11.0)
+_ZOOM_RESOLUTIONS = (6, 7, 8, 9)
+
 
 def _normalise_filters(values: Iterable[str] | str | None) -> list[str]:
     if values is None:
@@ -33,20 +38,18 @@ def _normalise_filters(values: Iterable[str] | str | None) -> list[str]:
 
 
 def _normalise_overlays(values: Iterable[str] | str | None) -> list[OverlayId]:
-    candidates = _normalise_filters(values)
-    return [cast(OverlayId, value) for value in candidates if value in OVERLAY_IDS]
+    if values is None:
+        return []
+    if isinstance(values, str):
+        values = (values,)
+    # Empty strings are never overlay ids, so one membership test covers both filters.
+    return cast(list[OverlayId], [value for value in values if value in OVERLAY_IDS])
 
 
 def _resolution_for_zoom(zoom: float | None) -> int:
     if zoom is None:
         return 8
-    if zoom <= 5:
-        return 6
-    if zoom <= 8:
-        return 7
-    if zoom <= 11:
-        return 8
-    return 9
+    return _ZOOM_RESOLUTIONS[bisect_left(_ZOOM_THRESHOLDS, zoom)]
 
 
 def _extract_viewport_bounds(
@@ -173,6 +176,7 @@ def register_callbacks(app: Dash, data_context: DataContext, settings: UISetting
             _normalise_overlays(overlay_values),
             data_context,
             opacity=overlay_opacity if overlay_opacity is not None else 0.35,
+            zoom=zoom_value,
         )
         figure = create_choropleth(
             geojson=geojson,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
+from functools import lru_cache
 from typing import Any, cast
 
 from dash import dcc, html
@@ -11,8 +12,21 @@ from ..types import SliderTooltip
 
 
 def build_filter_panel(
-    states: Sequence[str], metros: Sequence[str], counties: Sequence[str]
+    states: Sequence[str] = (),
+    metros: Sequence[str] = (),
+    counties: Sequence[str] = (),
+    *,
+    options: Mapping[str, Sequence[Mapping[str, str]]] | None = None,
 ) -> html.Div:
+    """Build the filter sidebar.
+
+    ``options`` accepts the precomputed ``DataContext.filter_options()`` mapping and takes
+    precedence over the raw value lists, which are passed to the dropdowns unchanged.
+    """
+
+    state_options: Sequence[Any] = options.get("states", ()) if options is not None else states
+    metro_options: Sequence[Any] = options.get("metros", ()) if options is not None else metros
+    county_options: Sequence[Any] = options.get("counties", ()) if options is not None else counties
     return html.Div(
         className="filter-panel",
         children=[
@@ -21,13 +35,19 @@ def build_filter_panel(
                 children=[
                     html.Summary("Filters"),
                     dcc.Dropdown(
-                        states, multi=True, id="state-filter", placeholder="Select states"
+                        state_options, multi=True, id="state-filter", placeholder="Select states"
                     ),
                     dcc.Dropdown(
-                        metros, multi=True, id="metro-filter", placeholder="Select metro areas"
+                        metro_options,
+                        multi=True,
+                        id="metro-filter",
+                        placeholder="Select metro areas",
                     ),
                     dcc.Dropdown(
-                        counties, multi=True, id="county-filter", placeholder="Select counties"
+                        county_options,
+                        multi=True,
+                        id="county-filter",
+                        placeholder="Select counties",
                     ),
                     dcc.RangeSlider(0, 100, step=1, value=[0, 100], id="score-range"),
                     html.Div(
@@ -46,9 +66,10 @@ def build_filter_panel(
     )
 
 
-def build_parameter_panel(default_weights: Mapping[str, float]) -> html.Div:
+@lru_cache(maxsize=64)
+def _build_parameter_panel(weights: tuple[tuple[str, float], ...]) -> html.Div:
     sliders = []
-    for key, value in default_weights.items():
+    for key, value in weights:
         tooltip_config: SliderTooltip = {"placement": "bottom", "always_visible": False}
         sliders.append(
             html.Div(
@@ -90,4 +111,16 @@ def build_parameter_panel(default_weights: Mapping[str, float]) -> html.Div:
     )
 
 
+def build_parameter_panel(default_weights: Mapping[str, float]) -> html.Div:
+    """Return the weight sliders for ``default_weights``, in mapping order.
+
+    The tree is cached per weight set and shared by every layout; callers must not
+    mutate it. Callbacks update slider values through their outputs, which never
+    touch this server-side tree.
+    """
+
+    key = tuple((str(name), float(value)) for name, value in default_weights.items())
+    return _build_parameter_panel(key)
+
+
 __all__ = ["build_filter_panel", "build_parameter_panel"]
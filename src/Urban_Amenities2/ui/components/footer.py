@@ -3,18 +3,29 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from functools import lru_cache
 
 from dash import html
 
 
-def build_footer() -> html.Footer:
+@lru_cache(maxsize=2)
+def _build_footer(year: int) -> html.Footer:
     return html.Footer(
         className="app-footer",
         children=[
-            html.Span(f"© {datetime.now(UTC):%Y} Urban Amenities Initiative"),
+            html.Span(f"© {year} Urban Amenities Initiative"),
             html.Span("Build: v1.0"),
         ],
     )
 
 
+def build_footer() -> html.Footer:
+    """Return the footer for the current year.
+
+    The tree is cached and shared by every layout; callers must not mutate it.
+    """
+
+    return _build_footer(datetime.now(UTC).year)
+
+
 __all__ = ["build_footer"]
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from dash import html
 
 from ..config import UISettings
 
 
-def build_header(settings: UISettings) -> html.Header:
+@lru_cache(maxsize=8)
+def _build_header(title: str) -> html.Header:
     return html.Header(
         className="app-header",
         children=[
@@ -15,7 +18,7 @@ def build_header(settings: UISettings) -> html.Header:
                 className="brand",
                 children=[
                     html.Img(src="/assets/logo.svg", className="logo"),
-                    html.H1(settings.title),
+                    html.H1(title),
                 ],
             ),
             html.Div(
@@ -31,4 +34,13 @@ def build_header(settings: UISettings) -> html.Header:
     )
 
 
+def build_header(settings: UISettings) -> html.Header:
+    """Return the header for ``settings.title``.
+
+    The tree is cached and shared by every layout; callers must not mutate it.
+    """
+
+    return _build_header(settings.title)
+
+
 __all__ = ["build_header"]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from dash import dcc, html
 
 PAGES = [
@@ -12,7 +14,8 @@ PAGES = [
 ]
 
 
-def build_sidebar() -> html.Aside:
+@lru_cache(maxsize=1)
+def _build_sidebar() -> html.Aside:
     links = []
     for page in PAGES:
         links.append(
@@ -25,4 +28,13 @@ def build_sidebar() -> html.Aside:
     return html.Aside(className="app-sidebar", children=links)
 
 
+def build_sidebar() -> html.Aside:
+    """Return the sidebar navigation.
+
+    The tree is cached and shared by every layout; callers must not mutate it.
+    """
+
+    return _build_sidebar()
+
+
 __all__ = ["build_sidebar"]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import Any, cast
+from typing import Any, Final, cast
 
 from dash import dcc, html
 
@@ -27,9 +27,7 @@ def _as_checklist_options(options: Sequence[OverlayOption]) -> list[dict[str, An
     return [{"label": option["label"], "value": option["value"]} for option in options]
 
 
-def build_overlay_panel() -> html.Div:
-    """Render the overlay control panel."""
-
+def _construct_overlay_panel() -> html.Div:
     option_payloads = _as_checklist_options(OVERLAY_OPTIONS)
     return html.Div(
         className="overlay-panel",
@@ -67,4 +65,18 @@ def build_overlay_panel() -> html.Div:
     )
 
 
+_OVERLAY_PANEL: Final[html.Div] = _construct_overlay_panel()
+
+
+def build_overlay_panel() -> html.Div:
+    """Return the overlay control panel.
+
+    The panel has no inputs, so it is built once at import and shared. Callers
+    must not mutate it in place; callbacks update the checklist through
+    ``Output("overlay-layers", "value")``.
+    """
+
+    return _OVERLAY_PANEL
+
+
 __all__ = ["build_overlay_panel", "DEFAULT_OVERLAYS", "OVERLAY_OPTIONS"]
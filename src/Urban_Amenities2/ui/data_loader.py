@@ -2,21 +2,28 @@
 
 from __future__ import annotations
 
-import json
+import warnings
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Final, cast
 
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from numpy.typing import NDArray
 
 from ..logging_utils import get_logger
 from .config import UISettings
 from .export import build_feature_collection
+from .export import export_geojson as stream_geojson
 from .export_types import GeoJSONFeature, GeoJSONFeatureCollection, GeoJSONGeometry, TabularData
-from .hexes import HexGeometryCache, build_hex_index
+from .hexes import HexGeometryCache, build_hex_index, parents_for_resolution
 
 LOGGER = get_logger("ui.data")
 
@@ -26,6 +33,20 @@ REQUIRED_COLUMNS: dict[str, set[str]] = {
 }
 
 
+# Boundary simplification tolerances (degrees) per overlay zoom tier, coarsest first.
+OVERLAY_SIMPLIFY_TOLERANCES: Final[tuple[float, ...]] = (0.01, 0.001, 0.0001)
+# Dissolved boundary sets kept across version switches, keyed by their input digest.
+OVERLAY_BOUNDARY_CACHE_SIZE: Final = 4
+
+
+def _overlay_zoom_bucket(zoom: float | None) -> int:
+    if zoom is None or zoom <= 6:
+        return 0
+    if zoom <= 10:
+        return 1
+    return 2
+
+
 def _require_columns(frame: TabularData, required: Iterable[str]) -> None:
     missing = [column for column in required if column not in frame.columns]
     if missing:
@@ -37,6 +58,7 @@ def _import_h3() -> Any:
     return import_module("h3")
 
 
+@lru_cache(maxsize=1)
 def _import_shapely_modules() -> (
     tuple[Any, Callable[[object], dict[str, object]], Callable[[Sequence[object]], object]]
 ):
@@ -101,6 +123,27 @@ class DataContext:
     overlays: dict[str, GeoJSONFeatureCollection] = field(default_factory=dict)
     _overlay_version: str | None = None
     _available_versions: list[DatasetVersion] = field(default_factory=list)
+    _hex_shapes: tuple[pd.Index, NDArray[np.object_]] | None = None
+    _hex_shapes_source: TabularData | None = None
+    _filter_options: dict[str, list[dict[str, str]]] | None = None
+    _overlay_boundaries: dict[str, list[tuple[Any, Any]]] = field(default_factory=dict)
+    _boundary_cache: dict[
+        tuple[tuple[str, int], ...], dict[str, list[tuple[Any, Any]]]
+    ] = field(default_factory=dict)
+    _overlay_cache: dict[tuple[str | None, int], dict[str, GeoJSONFeatureCollection]] = field(
+        default_factory=dict
+    )
+    _overlay_file_cache: dict[Path, tuple[tuple[int, int], GeoJSONFeatureCollection]] = field(
+        default_factory=dict
+    )
+    _geometry_lookup_cache: (
+        tuple[TabularData, TabularData, pd.Index, dict[str, NDArray[Any]]] | None
+    ) = None
+    _parent_cache: dict[int, pd.Categorical] = field(default_factory=dict)
+    _parent_source: TabularData | None = None
+    _hex_index_cache: dict[int, Mapping[str, list[str]]] = field(default_factory=dict)
+    _hex_index_source: TabularData | None = None
+    _viewport_index_cache: tuple[TabularData, NDArray[np.float64], NDArray[np.intp]] | None = None
 
     @classmethod
     def from_settings(cls, settings: UISettings) -> DataContext:
@@ -128,9 +171,12 @@ class DataContext:
             self.metadata = pd.DataFrame()
             self.geometries = pd.DataFrame()
             self.overlays.clear()
+            self._overlay_boundaries = {}
+            self._overlay_cache.clear()
             self._aggregation_cache.clear()
             self._aggregation_version = None
             self._overlay_version = None
+            self._filter_options = None
             self.base_resolution = None
             self.bounds = None
             return
@@ -143,7 +189,8 @@ class DataContext:
                 available=[candidate.identifier for candidate in versions],
             )
             return
-        if not force and self.version is not None and self.version.identifier == target.identifier:
+        reloading = self.version is not None and self.version.identifier == target.identifier
+        if reloading and not force:
             return
 
         LOGGER.info("ui_loading_dataset", version=target.identifier)
@@ -159,10 +206,13 @@ class DataContext:
         self.version = target
         self._aggregation_cache.clear()
         self._aggregation_version = target.identifier
+        self._filter_options = None
         self._prepare_geometries()
         self.validate_geometries()
         self._record_base_resolution()
-        self._build_overlays(force=True, version=target)
+        # A forced reload of the same version recomputes boundaries; switching versions
+        # may reuse them when the underlying files are unchanged.
+        self._build_overlays(force=True, version=target, reuse_boundaries=not reloading)
 
     def available_versions(self) -> list[DatasetVersion]:
         return list(self._available_versions)
@@ -193,11 +243,58 @@ class DataContext:
         self.hex_cache.validate(self.scores["hex_id"].astype(str).tolist())
 
     def _load_parquet(self, path: Path, columns: Iterable[str] | None = None) -> TabularData:
-        frame = pd.read_parquet(path, columns=list(columns) if columns else None)
-        if "hex_id" in frame.columns:
+        # Decode hex_id straight into a dictionary column so repeated ids are never
+        # materialised as per-row Python strings; to_pandas maps it to a categorical.
+        # Memory-mapping lets large score files be decoded without an extra read copy.
+        # Repeated column names would otherwise be decoded once per occurrence.
+        table = pq.read_table(
+            path,
+            columns=list(dict.fromkeys(columns)) if columns else None,
+            read_dictionary=["hex_id"],
+            use_threads=True,
+            memory_map=True,
+        )
+        # Release each Arrow column as soon as it is converted to keep peak memory
+        # near one copy of the frame rather than two.
+        frame = table.to_pandas(split_blocks=True, self_destruct=True)
+        del table
+        if "hex_id" in frame.columns and not isinstance(frame["hex_id"].dtype, pd.CategoricalDtype):
             frame["hex_id"] = frame["hex_id"].astype("category")
         return cast(TabularData, frame)
 
+    def hex_index(self) -> pa.DictionaryArray:
+        """Return the scores ``hex_id`` column as an Arrow dictionary array (int32 codes)."""
+
+        if "hex_id" not in self.scores.columns:
+            return pa.DictionaryArray.from_arrays(
+                pa.array([], pa.int32()), pa.array([], pa.string())
+            )
+        hex_ids = self.scores["hex_id"]
+        if not isinstance(hex_ids.dtype, pd.CategoricalDtype):
+            hex_ids = hex_ids.astype(str).astype("category")
+        codes = hex_ids.cat.codes.to_numpy(dtype=np.int32)
+        return pa.DictionaryArray.from_arrays(
+            pa.array(codes, mask=codes < 0),
+            pa.array(hex_ids.cat.categories.astype(str), pa.string()),
+        )
+
+    def filter_options(self) -> dict[str, list[dict[str, str]]]:
+        """Return sorted dropdown options for the state, metro and county filters.
+
+        The lists are built once per loaded version and shared by every page render.
+        """
+
+        if self._filter_options is None:
+            options: dict[str, list[dict[str, str]]] = {}
+            for column, key in (("state", "states"), ("metro", "metros"), ("county", "counties")):
+                if column in self.scores.columns:
+                    values = sorted(str(value) for value in self.scores[column].dropna().unique())
+                else:
+                    values = []
+                options[key] = [{"label": value, "value": value} for value in values]
+            self._filter_options = options
+        return self._filter_options
+
     def load_subset(self, columns: Iterable[str]) -> TabularData:
         if len(self.scores) == 0:
             return self.scores
@@ -231,42 +328,83 @@ class DataContext:
     def summarise(self, columns: Iterable[str] | None = None) -> TabularData:
         if len(self.scores) == 0:
             return cast(TabularData, pd.DataFrame())
-        columns = (
+        requested = (
             list(columns)
             if columns
             else ["aucs", "EA", "LCA", "MUHAA", "JEA", "MORR", "CTE", "SOU"]
         )
-        summary: dict[str, dict[str, float]] = {}
-        percentiles = [p / 100.0 for p in self.settings.summary_percentiles]
-        for column in columns:
-            if column not in self.scores.columns:
-                continue
-            series = self.scores[column]
-            stats: dict[str, float] = {
-                "min": float(series.min()),
-                "max": float(series.max()),
-                "mean": float(series.mean()),
+        present = [column for column in dict.fromkeys(requested) if column in self.scores.columns]
+        if not present:
+            return cast(TabularData, pd.DataFrame())
+        # One contiguous block and one reduction per statistic across all columns. The
+        # NaN-aware reductions copy and mask the block, so only pay for them when needed.
+        values = self.scores[present].to_numpy(dtype=np.float64)
+        percentiles = list(self.settings.summary_percentiles)
+        if np.isnan(values).any():
+            reduce_min, reduce_max, reduce_mean, reduce_quantile = (
+                np.nanmin,
+                np.nanmax,
+                np.nanmean,
+                np.nanquantile,
+            )
+        else:
+            reduce_min, reduce_max, reduce_mean, reduce_quantile = (
+                np.min,
+                np.max,
+                np.mean,
+                np.quantile,
+            )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            stats: dict[str, NDArray[np.float64]] = {
+                "min": reduce_min(values, axis=0),
+                "max": reduce_max(values, axis=0),
+                "mean": reduce_mean(values, axis=0),
             }
-            for percentile in percentiles:
-                label = f"p{int(percentile * 100)}"
-                stats[label] = float(series.quantile(percentile))
-            summary[column] = stats
-        return cast(TabularData, pd.DataFrame(summary).T)
+            if percentiles:
+                quantiles = reduce_quantile(values, [p / 100.0 for p in percentiles], axis=0)
+                for percentile, row in zip(percentiles, quantiles, strict=True):
+                    stats[f"p{int(percentile)}"] = row
+        return cast(TabularData, pd.DataFrame(stats, index=present))
 
     def export_geojson(self, path: Path, columns: Iterable[str] | None = None) -> Path:
         columns = list(columns) if columns else ["hex_id", "aucs"]
         frame = self.load_subset(columns + ["hex_id"])
-        collection = build_feature_collection(frame)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(collection))
-        return path
+        # Streams one encoded feature at a time rather than building the collection.
+        return stream_geojson(frame, path)
 
     def to_geojson(self, frame: TabularData) -> GeoJSONFeatureCollection:
+        """Build a FeatureCollection for ``frame`` using the cached hex geometries.
+
+        Feature properties are the columns of ``frame`` itself. Geometry table
+        columns (``geometry_wkt``, centroids, ``resolution``) are only included when
+        the caller attached them, e.g. via :meth:`attach_geometries`.
+        """
+
         geometries = self.geometries
         if len(geometries) == 0:
             raise RuntimeError("Hex geometries not initialised")
-        merged = frame.merge(geometries, on="hex_id", how="left")
-        return build_feature_collection(cast(TabularData, merged))
+        if len(frame) == 0:
+            # Filters that exclude every hex are common; skip the merge and serialisation.
+            return {"type": "FeatureCollection", "features": []}
+        properties = [column for column in frame.columns if column != "geometry"]
+        index, values = self._geometry_lookup(["geometry"])
+        positions = index.get_indexer(frame["hex_id"].astype(str))
+        merged = frame[properties].reset_index(drop=True)
+        merged["geometry"] = pd.api.extensions.take(values["geometry"], positions, allow_fill=True)
+        return build_feature_collection(
+            cast(TabularData, merged),
+            properties=properties,
+            geometry_column="geometry",
+        )
+
+    def to_geojson_bytes(self, frame: TabularData) -> bytes:
+        """Serialise :meth:`to_geojson` output for HTTP responses."""
+
+        return orjson.dumps(
+            self.to_geojson(frame),
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
 
     def export_csv(self, path: Path, columns: Iterable[str] | None = None) -> Path:
         columns = list(columns) if columns else ["hex_id", "aucs", "EA", "LCA"]
@@ -295,7 +433,15 @@ class DataContext:
     def get_hex_index(self, resolution: int) -> Mapping[str, list[str]]:
         if len(self.geometries) == 0:
             return {}
-        return build_hex_index(self.geometries, resolution)
+        # The rollup needs an H3 call per cell, so keep it per resolution until the
+        # geometries frame is replaced; callers get their own lists.
+        if self._hex_index_source is not self.geometries:
+            self._hex_index_cache.clear()
+            self._hex_index_source = self.geometries
+        index = self._hex_index_cache.get(resolution)
+        if index is None:
+            index = self._hex_index_cache[resolution] = build_hex_index(self.geometries, resolution)
+        return {parent: list(children) for parent, children in index.items()}
 
     def aggregate_by_resolution(
         self, resolution: int, columns: Iterable[str] | None = None
@@ -303,22 +449,14 @@ class DataContext:
         if len(self.scores) == 0:
             return cast(TabularData, pd.DataFrame())
         columns = list(dict.fromkeys(columns or ["aucs"]))
-        subset_columns = ["hex_id", *columns]
-        subset = self.scores[subset_columns].copy()
-        if len(subset) == 0:
-            return subset
-        subset["hex_id"] = subset["hex_id"].astype(str)
-        h3 = _import_h3()
-        subset["parent_hex"] = [
-            cast(str, h3.cell_to_parent(hex_id, resolution)) for hex_id in subset["hex_id"]
-        ]
-        aggregations = {column: "mean" for column in columns if column in subset.columns}
+        aggregations = {column: "mean" for column in columns if column != "hex_id"}
         aggregations["hex_id"] = "count"
-        frame = (
-            subset.groupby("parent_hex", as_index=False)
-            .agg(aggregations)
-            .rename(columns={"parent_hex": "hex_id", "hex_id": "count"})
-        )
+        parents = self._parent_ids(resolution, self.scores["hex_id"])
+        # Grouping by the categorical parents works on integer codes, with no copy of
+        # the scores subset and no per-row string hashing.
+        grouped = self.scores[list(aggregations)].groupby(parents, observed=True).agg(aggregations)
+        grouped.index = grouped.index.astype(str)
+        frame = grouped.rename(columns={"hex_id": "count"}).rename_axis("hex_id").reset_index()
         if len(frame) == 0:
             return cast(TabularData, frame)
         new_geoms = self.hex_cache.ensure_geometries(frame["hex_id"].astype(str).tolist())
@@ -334,6 +472,23 @@ class DataContext:
         self._update_bounds()
         return cast(TabularData, frame)
 
+    def _parent_ids(self, resolution: int, hex_ids: pd.Series) -> pd.Categorical:
+        """Map score hexes to their parents, reusing the mapping per resolution.
+
+        Subscore switches re-aggregate the same scores with different columns, so
+        the per-hex H3 parent lookup only runs once per resolution and scores frame.
+        Parents are interned as a categorical so repeat aggregations group on codes.
+        """
+
+        if self._parent_source is not self.scores:
+            self._parent_cache.clear()
+            self._parent_source = self.scores
+        parents = self._parent_cache.get(resolution)
+        if parents is None or len(parents) != len(hex_ids):
+            parents = pd.Categorical(parents_for_resolution(hex_ids.astype(str), resolution))
+            self._parent_cache[resolution] = parents
+        return parents
+
     def _record_base_resolution(self) -> None:
         if len(self.scores) == 0:
             self.base_resolution = None
@@ -382,15 +537,28 @@ class DataContext:
         lon_max += buffer
         lat_max += buffer
         frame = self.geometries
-        mask = (
-            (frame["centroid_lon"] >= lon_min)
-            & (frame["centroid_lon"] <= lon_max)
-            & (frame["centroid_lat"] >= lat_min)
-            & (frame["centroid_lat"] <= lat_max)
-        )
+        sorted_lons, order = self._viewport_index()
+        # Binary-search the longitude band, then test latitude only on that slice.
+        start = int(np.searchsorted(sorted_lons, lon_min, side="left"))
+        stop = int(np.searchsorted(sorted_lons, lon_max, side="right"))
+        positions = np.sort(order[start:stop])
+        lats = frame["centroid_lat"].to_numpy()[positions]
+        keep = (lats >= lat_min) & (lats <= lat_max)
         if resolution is not None and "resolution" in frame.columns:
-            mask &= frame["resolution"] == resolution
-        return [str(value) for value in frame.loc[mask, "hex_id"].astype(str).tolist()]
+            keep &= frame["resolution"].to_numpy()[positions] == resolution
+        return [str(value) for value in frame["hex_id"].to_numpy()[positions[keep]]]
+
+    def _viewport_index(self) -> tuple[NDArray[np.float64], NDArray[np.intp]]:
+        """Return centroid longitudes sorted once per geometries frame, with row order."""
+
+        geometries = self.geometries
+        cached = self._viewport_index_cache
+        if cached is None or cached[0] is not geometries:
+            lons = geometries["centroid_lon"].to_numpy(dtype=np.float64)
+            order = np.argsort(lons, kind="stable")
+            cached = (geometries, lons[order], order)
+            self._viewport_index_cache = cached
+        return cached[1], cached[2]
 
     def apply_viewport(
         self,
@@ -414,30 +582,79 @@ class DataContext:
             columns.append("geometry_wkt")
         if "resolution" in self.geometries.columns:
             columns.append("resolution")
-        merged = frame.merge(
-            self.geometries[columns].drop_duplicates("hex_id"),
-            on="hex_id",
-            how="left",
-        )
-        return cast(TabularData, merged)
+        if any(column in frame.columns for column in columns[1:]):
+            # Overlapping columns need merge's suffixing semantics.
+            merged = frame.merge(
+                self.geometries[columns].drop_duplicates("hex_id"),
+                on="hex_id",
+                how="left",
+            )
+            return cast(TabularData, merged)
+        index, values = self._geometry_lookup(columns[1:])
+        positions = index.get_indexer(frame["hex_id"])
+        attached = frame.reset_index(drop=True)
+        for column, array in values.items():
+            attached[column] = pd.api.extensions.take(array, positions, allow_fill=True)
+        return cast(TabularData, attached)
+
+    def _geometry_lookup(self, columns: Sequence[str]) -> tuple[pd.Index, dict[str, NDArray[Any]]]:
+        """Index the deduplicated geometry columns once per geometries frame.
+
+        Column arrays are extracted on first use and kept, so callers asking for
+        different columns (map attributes vs. GeoJSON shapes) share one index.
+        """
+
+        geometries = self.geometries
+        cached = self._geometry_lookup_cache
+        if cached is None or cached[0] is not geometries:
+            unique = geometries.drop_duplicates("hex_id")
+            cached = (geometries, unique, pd.Index(unique["hex_id"].astype(str)), {})
+            self._geometry_lookup_cache = cached
+        _, unique, index, arrays = cached
+        for column in columns:
+            if column not in arrays:
+                arrays[column] = unique[column].to_numpy()
+        return index, {column: arrays[column] for column in columns}
 
     def rebuild_overlays(self, force: bool = False) -> None:
         self._build_overlays(force=force, version=self.version)
 
-    def get_overlay(self, key: str) -> GeoJSONFeatureCollection:
-        payload = self.overlays.get(key)
+    def get_overlay(self, key: str, zoom: float | None = None) -> GeoJSONFeatureCollection:
+        overlays = self.overlays if zoom is None else self.overlays_for_zoom(zoom)
+        payload = overlays.get(key)
         if payload:
             return payload
         return {"type": "FeatureCollection", "features": []}
 
+    def overlays_for_zoom(self, zoom: float | None) -> dict[str, GeoJSONFeatureCollection]:
+        """Return boundary overlays simplified for ``zoom``, cached per version and tier."""
+
+        bucket = _overlay_zoom_bucket(zoom)
+        cache_key = (self._overlay_version, bucket)
+        cached = self._overlay_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if not self._overlay_boundaries:
+            return self.overlays
+        _, shapely_mapping, _ = _import_shapely_modules()
+        overlays = dict(self.overlays)
+        overlays.update(
+            self._simplify_boundaries(OVERLAY_SIMPLIFY_TOLERANCES[bucket], shapely_mapping)
+        )
+        self._overlay_cache[cache_key] = overlays
+        return overlays
+
     def _build_overlays(
         self,
         *,
         force: bool = False,
         version: DatasetVersion | None = None,
+        reuse_boundaries: bool = False,
     ) -> None:
         if not force and self._overlay_version == self._aggregation_version:
             return
+        self._overlay_boundaries = {}
+        self._overlay_cache.clear()
         if len(self.scores) == 0 or len(self.geometries) == 0:
             self.overlays.clear()
             self._overlay_version = self._aggregation_version
@@ -453,40 +670,101 @@ class DataContext:
             self._overlay_version = self._aggregation_version
             return
 
-        merged = self.scores.merge(
-            self.geometries[["hex_id", "geometry_wkt"]],
-            on="hex_id",
-            how="left",
-        )
-        overlays: dict[str, GeoJSONFeatureCollection] = {}
+        boundary_key = self._boundary_key(version)
+        boundaries = self._boundary_cache.pop(boundary_key, None)
+        if boundaries is None or not reuse_boundaries:
+            boundaries = self._dissolve_boundaries(shapely_wkt, unary_union)
+        if boundary_key:
+            # Re-insert so the dict stays in least-recently-used order.
+            self._boundary_cache[boundary_key] = boundaries
+            while len(self._boundary_cache) > OVERLAY_BOUNDARY_CACHE_SIZE:
+                self._boundary_cache.pop(next(iter(self._boundary_cache)))
+        self._overlay_boundaries = boundaries
+
+        overlays = self._simplify_boundaries(OVERLAY_SIMPLIFY_TOLERANCES[0], shapely_mapping)
+        overlays.update(self._load_external_overlays(version))
+        self.overlays = overlays
+        self._overlay_version = self._aggregation_version
+        self._overlay_cache[(self._overlay_version, 0)] = overlays
+
+    def _boundary_key(self, version: DatasetVersion | None) -> tuple[tuple[str, int], ...]:
+        """Identify the files the boundary dissolve was built from by path and mtime.
+
+        Returns an empty key when there is no version on disk to identify.
+        """
+
+        if version is None:
+            return ()
+        paths = [
+            version.path,
+            *version.matching_metadata_candidates(),
+            self.settings.data_path / "metadata.parquet",
+        ]
+        key: list[tuple[str, int]] = []
+        for path in dict.fromkeys(paths):
+            try:
+                key.append((str(path), path.stat().st_mtime_ns))
+            except FileNotFoundError:
+                continue
+        return tuple(key)
+
+    def _dissolve_boundaries(
+        self, shapely_wkt: Any, unary_union: Callable[[Sequence[object]], object]
+    ) -> dict[str, list[tuple[Any, Any]]]:
+        shape_index, shapes = self._parsed_hex_shapes(shapely_wkt)
+        positions = shape_index.get_indexer(self.scores["hex_id"].astype(str))
+        boundaries: dict[str, list[tuple[Any, Any]]] = {}
         for column, key in (("state", "states"), ("county", "counties"), ("metro", "metros")):
-            if column not in merged.columns:
+            if column not in self.scores.columns:
                 continue
-            features: list[GeoJSONFeature] = []
-            for value, group in merged.groupby(column):
-                if not value or len(group) == 0:
-                    continue
-                shapes = [shapely_wkt.loads(wkt) for wkt in group["geometry_wkt"].dropna().unique()]
-                if not shapes:
+            members = pd.DataFrame({"value": self.scores[column].to_numpy(), "pos": positions})
+            members = members[members["pos"] >= 0].drop_duplicates()
+            dissolved: list[tuple[Any, Any]] = []
+            for value, group in members.groupby("value", sort=True)["pos"]:
+                if not value:
                     continue
-                geometry = unary_union(shapes)
+                geometry = unary_union(shapes[group.to_numpy()])
                 if geometry.is_empty:
                     continue
-                simplified = geometry.simplify(0.01, preserve_topology=True)
-                geometry_payload = cast(GeoJSONGeometry, shapely_mapping(simplified))
+                dissolved.append((value, geometry))
+            if dissolved:
+                boundaries[key] = dissolved
+        return boundaries
+
+    def _simplify_boundaries(
+        self, tolerance: float, shapely_mapping: Callable[[object], dict[str, object]]
+    ) -> dict[str, GeoJSONFeatureCollection]:
+        overlays: dict[str, GeoJSONFeatureCollection] = {}
+        for key, dissolved in self._overlay_boundaries.items():
+            features: list[GeoJSONFeature] = []
+            for value, geometry in dissolved:
+                simplified = geometry.simplify(tolerance, preserve_topology=True)
                 features.append(
                     {
                         "type": "Feature",
-                        "geometry": geometry_payload,
+                        "geometry": cast(GeoJSONGeometry, shapely_mapping(simplified)),
                         "properties": {"label": value},
                     }
                 )
-            if features:
-                overlays[key] = {"type": "FeatureCollection", "features": features}
+            overlays[key] = {"type": "FeatureCollection", "features": features}
+        return overlays
 
-        overlays.update(self._load_external_overlays(version))
-        self.overlays = overlays
-        self._overlay_version = self._aggregation_version
+    def _parsed_hex_shapes(self, shapely_wkt: Any) -> tuple[pd.Index, NDArray[np.object_]]:
+        """Parse hex WKT once per geometries frame and reuse it across overlay rebuilds.
+
+        Shapely 2 parses the whole WKT column in a single vectorised call; the result is
+        an object array aligned with the returned hex index.
+        """
+
+        geometries = self.geometries
+        if self._hex_shapes is None or self._hex_shapes_source is not geometries:
+            frame = geometries[["hex_id", "geometry_wkt"]].dropna().drop_duplicates("hex_id")
+            shapes = np.asarray(
+                shapely_wkt.loads(frame["geometry_wkt"].to_numpy(dtype=object)), dtype=object
+            )
+            self._hex_shapes = (pd.Index(frame["hex_id"].astype(str)), shapes)
+            self._hex_shapes_source = geometries
+        return self._hex_shapes
 
     def _load_external_overlays(
         self, version: DatasetVersion | None = None
@@ -508,28 +786,40 @@ class DataContext:
                 path = base / f"{name}.geojson"
                 if not path.exists():
                     continue
-                try:
-                    payload = json.loads(path.read_text())
-                except json.JSONDecodeError as exc:
-                    LOGGER.warning("ui_overlay_invalid", name=name, error=str(exc))
-                    continue
-                if payload.get("type") != "FeatureCollection":
-                    LOGGER.warning("ui_overlay_invalid_type", name=name)
-                    continue
-                features = payload.get("features")
-                if not isinstance(features, list):
-                    LOGGER.warning("ui_overlay_invalid_features", name=name)
-                    continue
-                typed_features: list[GeoJSONFeature] = []
-                for feature in features:
-                    if isinstance(feature, dict):
-                        typed_features.append(cast(GeoJSONFeature, feature))
-                result[name] = {
-                    "type": "FeatureCollection",
-                    "features": typed_features,
-                }
+                collection = self._read_overlay_file(path, name)
+                if collection is not None:
+                    result[name] = collection
         return result
 
+    def _read_overlay_file(self, path: Path, name: str) -> GeoJSONFeatureCollection | None:
+        """Parse an overlay file, reusing the last parse while its mtime and size match."""
+
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._overlay_file_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        try:
+            payload = orjson.loads(path.read_bytes())
+        except orjson.JSONDecodeError as exc:
+            LOGGER.warning("ui_overlay_invalid", name=name, error=str(exc))
+            return None
+        if not isinstance(payload, dict) or payload.get("type") != "FeatureCollection":
+            LOGGER.warning("ui_overlay_invalid_type", name=name)
+            return None
+        features = payload.get("features")
+        if not isinstance(features, list):
+            LOGGER.warning("ui_overlay_invalid_features", name=name)
+            return None
+        collection: GeoJSONFeatureCollection = {
+            "type": "FeatureCollection",
+            "features": [
+                cast(GeoJSONFeature, feature) for feature in features if isinstance(feature, dict)
+            ],
+        }
+        self._overlay_file_cache[path] = (signature, collection)
+        return collection
+
     def _discover_versions(self, data_path: Path) -> list[DatasetVersion]:
         candidates: list[DatasetVersion] = []
         parquet_files = sorted(
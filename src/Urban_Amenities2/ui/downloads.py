@@ -2,14 +2,31 @@
 
 from __future__ import annotations
 
-import base64
+import mmap
 from pathlib import Path
 from typing import cast
 
+import pybase64
 from dash import dcc
 
 from .contracts import DownloadPayload
 
+# Files above this size are memory-mapped so encoding avoids an intermediate bytes copy.
+MMAP_THRESHOLD_BYTES = 1 << 20
+
+# Resolved once so bulk exports skip the ``dcc`` attribute lookup on every call.
+_SEND_FILE = dcc.send_file
+
+
+def _encode_file(path: Path) -> bytes:
+    if path.stat().st_size <= MMAP_THRESHOLD_BYTES:
+        return pybase64.b64encode(path.read_bytes())
+    with (
+        path.open("rb") as handle,
+        mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        return pybase64.b64encode(mapped)
+
 
 def build_file_download(
     path: Path,
@@ -22,7 +39,7 @@ def build_file_download(
     payload: DownloadPayload = cast(
         DownloadPayload,
         {
-            "content": base64.b64encode(path.read_bytes()).decode("ascii"),
+            "content": _encode_file(path).decode("ascii"),
             "filename": filename or path.name,
             "type": mimetype,
             "base64": True,
@@ -41,7 +58,7 @@ def send_file(
 
     return cast(
         DownloadPayload,
-        dcc.send_file(str(path), filename=filename, type=content_type),
+        _SEND_FILE(str(path), filename=filename, type=content_type),
     )
 
 
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from importlib import import_module
 from pathlib import Path
 from typing import Any, cast
+from urllib.parse import urlencode
 
+import orjson
 import structlog
 
 from .export_types import (
@@ -66,22 +67,36 @@ def _normalise_value(value: object) -> JsonValue:
     return str(value)
 
 
-def _record_to_feature(record: Mapping[str, object]) -> GeoJSONFeature | None:
+def _cached_geometry(value: object) -> GeoJSONGeometry | None:
+    if isinstance(value, (str, bytes)):
+        return cast(GeoJSONGeometry, orjson.loads(value))
+    if isinstance(value, Mapping):
+        return cast(GeoJSONGeometry, dict(value))
+    return None
+
+
+def _record_to_feature(
+    record: Mapping[str, object],
+    geometry_column: str | None = None,
+) -> GeoJSONFeature | None:
     hex_raw = record.get("hex_id")
     if not isinstance(hex_raw, str):
         return None
-    boundary = _hex_boundary(hex_raw)
-    coordinates = [_boundary_ring(boundary)]
+    geometry = _cached_geometry(record.get(geometry_column)) if geometry_column else None
+    if geometry is None:
+        boundary = _hex_boundary(hex_raw)
+        geometry = {
+            "type": "Polygon",
+            "coordinates": [_boundary_ring(boundary)],
+        }
     properties: dict[str, JsonValue] = {}
     for key, value in record.items():
+        if key == geometry_column:
+            continue
         if key == "hex_id":
             properties[key] = hex_raw
             continue
         properties[key] = _normalise_value(value)
-    geometry: GeoJSONGeometry = {
-        "type": "Polygon",
-        "coordinates": coordinates,
-    }
     return {
         "type": "Feature",
         "geometry": geometry,
@@ -89,24 +104,40 @@ def _record_to_feature(record: Mapping[str, object]) -> GeoJSONFeature | None:
     }
 
 
-def build_feature_collection(
+def _iter_features(
     frame: TabularData,
-    properties: Sequence[str] | None = None,
-) -> GeoJSONFeatureCollection:
+    properties: Sequence[str] | None,
+    geometry_column: str | None,
+) -> Iterator[GeoJSONFeature]:
     requested = (
         list(properties)
         if properties
         else [column for column in frame.columns if column != "hex_id"]
     )
-    columns = ["hex_id", *requested]
+    columns = list(dict.fromkeys(["hex_id", *requested]))
+    if geometry_column is not None and geometry_column not in columns:
+        columns.append(geometry_column)
     subset_obj = frame[[column for column in columns if column in frame.columns]]
     subset = cast(TabularData, subset_obj)
-    records = subset.to_dict("records")
-    features: list[GeoJSONFeature] = []
-    for record in records:
-        feature = _record_to_feature(record)
+    for record in subset.to_dict("records"):
+        feature = _record_to_feature(record, geometry_column)
         if feature is not None:
-            features.append(feature)
+            yield feature
+
+
+def build_feature_collection(
+    frame: TabularData,
+    properties: Sequence[str] | None = None,
+    *,
+    geometry_column: str | None = None,
+) -> GeoJSONFeatureCollection:
+    """Build a FeatureCollection keyed by ``hex_id``.
+
+    When ``geometry_column`` names a column of cached GeoJSON geometries (strings
+    or mappings), those are reused; rows without one fall back to the H3 boundary.
+    """
+
+    features = list(_iter_features(frame, properties, geometry_column))
     return {"type": "FeatureCollection", "features": features}
 
 
@@ -116,9 +147,16 @@ def export_geojson(
     properties: Sequence[str] | None = None,
 ) -> Path:
     logger.info("export_geojson_start", rows=len(frame), output=str(output_path))
-    collection = build_feature_collection(frame, properties=properties)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(collection))
+    # Stream one serialised feature at a time instead of materialising the whole
+    # collection and its JSON text in memory.
+    with output_path.open("wb") as handle:
+        handle.write(b'{"type":"FeatureCollection","features":[')
+        for index, feature in enumerate(_iter_features(frame, properties, None)):
+            if index:
+                handle.write(b",")
+            handle.write(orjson.dumps(feature))
+        handle.write(b"]}")
     logger.info("export_geojson_complete", path=str(output_path))
     return output_path
 
@@ -130,11 +168,12 @@ def export_csv(
     include_geometry: bool = False,
 ) -> Path:
     logger.info("export_csv_start", rows=len(frame), output=str(output_path))
-    export_frame = frame.copy()
+    export_frame = frame
     if include_geometry and "lat" not in export_frame.columns:
         centroids = [
             _hex_centroid(str(hex_id)) for hex_id in cast(Iterable[Any], export_frame["hex_id"])
         ]
+        export_frame = frame.copy()
         export_frame["lat"] = [lat for lat, _ in centroids]
         export_frame["lon"] = [lon for _, lon in centroids]
     export_frame.to_csv(str(output_path), index=False)
@@ -175,8 +214,6 @@ def create_shareable_url(
     center_lat: float | None = None,
     center_lon: float | None = None,
 ) -> str:
-    from urllib.parse import urlencode
-
     params: dict[str, str | int | float] = {}
 
     if state:
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import weakref
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+# id(frame) -> (weak reference, row count, options); entries go when the frame is collected.
+_OPTIONS_CACHE: dict[int, tuple[weakref.ref[pd.DataFrame], int, dict[str, Any]]] = {}
+
 
 @dataclass
 class FilterConfig:
@@ -30,65 +35,95 @@ def apply_filters(df: pd.DataFrame, config: FilterConfig) -> pd.DataFrame:
         config: Filter configuration
 
     Returns:
-        Filtered DataFrame
+        Filtered DataFrame; ``df`` itself when every row matches
     """
-    filtered = df.copy()
-
-    if config.state is not None:
-        filtered = filtered[filtered["state"].isin(config.state)]
-
-    if config.metro is not None:
-        filtered = filtered[filtered["metro"].isin(config.metro)]
-
-    if config.score_min is not None:
-        filtered = filtered[filtered["aucs"] >= config.score_min]
-
-    if config.score_max is not None:
-        filtered = filtered[filtered["aucs"] <= config.score_max]
-
-    if config.population_density_min is not None:
-        filtered = filtered[filtered["pop_density"] >= config.population_density_min]
-
-    if config.population_density_max is not None:
-        filtered = filtered[filtered["pop_density"] <= config.population_density_max]
-
-    if config.land_use is not None:
-        filtered = filtered[filtered["land_use"].isin(config.land_use)]
-
-    return filtered
+    # Combine every predicate into one ndarray mask and take the matching rows once,
+    # instead of materialising an intermediate frame per filter.
+    mask = np.ones(len(df), dtype=bool)
+
+    for column, values in (
+        ("state", config.state),
+        ("metro", config.metro),
+        ("land_use", config.land_use),
+    ):
+        if values is not None:
+            mask &= df[column].isin(values).to_numpy(dtype=bool)
+
+    for column, lower, upper in (
+        ("aucs", config.score_min, config.score_max),
+        ("pop_density", config.population_density_min, config.population_density_max),
+    ):
+        if lower is None and upper is None:
+            continue
+        numbers = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        if lower is not None:
+            mask &= numbers >= lower
+        if upper is not None:
+            mask &= numbers <= upper
+
+    if mask.all():
+        return df
+    return df.iloc[np.flatnonzero(mask)]
+
+
+def _distinct(series: pd.Series) -> list[Any]:
+    # Missing values are never offered. Categorical columns resolve the observed
+    # categories from their integer codes, where missing is code -1.
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        return sorted(series.cat.categories[np.unique(codes[codes >= 0])].tolist())
+    return sorted(series.dropna().unique().tolist())
+
+
+def _value_range(series: pd.Series) -> tuple[float, float]:
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return float(np.nanmin(values)), float(np.nanmax(values))
 
 
 def get_filter_options(df: pd.DataFrame) -> dict[str, Any]:
     """
     Extract available filter options from the dataset.
 
+    Results are cached per frame object and row count, so repeat calls on the same
+    frame are free. A frame edited in place keeps its cached options; pass a new
+    frame instead.
+
     Args:
         df: DataFrame with hex-level scores
 
     Returns:
         Dictionary with available filter values
     """
+    key = id(df)
+    cached = _OPTIONS_CACHE.get(key)
+    if cached is None or cached[0]() is not df or cached[1] != len(df):
+        options = _build_filter_options(df)
+
+        def _forget(ref: weakref.ref[pd.DataFrame], key: int = key) -> None:
+            entry = _OPTIONS_CACHE.get(key)
+            if entry is not None and entry[0] is ref:
+                del _OPTIONS_CACHE[key]
+
+        cached = _OPTIONS_CACHE[key] = (weakref.ref(df, _forget), len(df), options)
+    return {
+        name: list(value) if isinstance(value, list) else value for name, value in cached[2].items()
+    }
+
+
+def _build_filter_options(df: pd.DataFrame) -> dict[str, Any]:
     options: dict[str, Any] = {
-        "states": sorted(df["state"].unique().tolist()) if "state" in df.columns else [],
-        "metros": sorted(df["metro"].unique().tolist()) if "metro" in df.columns else [],
+        "states": _distinct(df["state"]) if "state" in df.columns else [],
+        "metros": _distinct(df["metro"]) if "metro" in df.columns else [],
         "score_range": (
-            (
-                float(df["aucs"].min()),
-                float(df["aucs"].max()),
-            )
-            if "aucs" in df.columns and not df.empty
-            else (0.0, 0.0)
+            _value_range(df["aucs"]) if "aucs" in df.columns and not df.empty else (0.0, 0.0)
         ),
-        "land_uses": sorted(df["land_use"].unique().tolist()) if "land_use" in df.columns else [],
+        "land_uses": _distinct(df["land_use"]) if "land_use" in df.columns else [],
         "population_density_range": (
-            (
-                float(df["pop_density"].min()),
-                float(df["pop_density"].max()),
-            )
+            _value_range(df["pop_density"])
             if "pop_density" in df.columns and not df.empty
             else (0.0, 0.0)
         ),
     }
     if "county" in df.columns:
-        options["counties"] = sorted(df["county"].unique().tolist())
+        options["counties"] = _distinct(df["county"])
     return options
@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from importlib import import_module
 from typing import Any, cast
 
+import numpy as np
 import pandas as pd
 import structlog
 
@@ -52,8 +53,10 @@ class HexDetails:
         Returns:
             HexDetails instance
         """
+        # One conversion up front; every field below is then a plain dict lookup.
+        values = row.to_dict()
         amenities: list[AmenityEntry] = []
-        raw_amenities = row.get("top_amenities", [])
+        raw_amenities = values.get("top_amenities", [])
         if isinstance(raw_amenities, list):
             for item in raw_amenities:
                 if not isinstance(item, dict):
@@ -65,7 +68,7 @@ class HexDetails:
                 amenities.append(AmenityEntry(name=name, category=category, score=score))
 
         modes: ModeShareMap = {}
-        raw_modes = row.get("top_modes", {})
+        raw_modes = values.get("top_modes", {})
         if isinstance(raw_modes, dict):
             for mode, value in raw_modes.items():
                 if isinstance(mode, str) and isinstance(value, (int, float)):
@@ -74,29 +77,29 @@ class HexDetails:
         def _coerce_float(value: Any, fallback: float = 0.0) -> float:
             return float(value) if isinstance(value, (int, float)) else fallback
 
-        population_raw = row.get("population")
+        population_raw = values.get("population")
 
-        ea_raw = row.get("ea", row.get("EA", 0.0))
-        lca_raw = row.get("lca", row.get("LCA", 0.0))
-        muhaa_raw = row.get("muhaa", row.get("MUHAA", 0.0))
-        jea_raw = row.get("jea", row.get("JEA", 0.0))
-        morr_raw = row.get("morr", row.get("MORR", 0.0))
-        cte_raw = row.get("cte", row.get("CTE", 0.0))
-        sou_raw = row.get("sou", row.get("SOU", 0.0))
+        ea_raw = values.get("ea", values.get("EA", 0.0))
+        lca_raw = values.get("lca", values.get("LCA", 0.0))
+        muhaa_raw = values.get("muhaa", values.get("MUHAA", 0.0))
+        jea_raw = values.get("jea", values.get("JEA", 0.0))
+        morr_raw = values.get("morr", values.get("MORR", 0.0))
+        cte_raw = values.get("cte", values.get("CTE", 0.0))
+        sou_raw = values.get("sou", values.get("SOU", 0.0))
 
         return cls(
-            hex_id=str(row.get("hex_id", "")),
-            lat=_coerce_float(row.get("lat", row.get("centroid_lat", 0.0))),
-            lon=_coerce_float(row.get("lon", row.get("centroid_lon", 0.0))),
-            state=str(row.get("state", "")),
-            metro=row.get("metro"),
-            county=row.get("county"),
+            hex_id=str(values.get("hex_id", "")),
+            lat=_coerce_float(values.get("lat", values.get("centroid_lat", 0.0))),
+            lon=_coerce_float(values.get("lon", values.get("centroid_lon", 0.0))),
+            state=str(values.get("state", "")),
+            metro=values.get("metro"),
+            county=values.get("county"),
             population=(
                 _coerce_float(population_raw, fallback=0.0)
                 if isinstance(population_raw, (int, float))
                 else None
             ),
-            aucs=_coerce_float(row.get("aucs", 0.0)),
+            aucs=_coerce_float(values.get("aucs", 0.0)),
             ea=_coerce_float(ea_raw),
             lca=_coerce_float(lca_raw),
             muhaa=_coerce_float(muhaa_raw),
@@ -122,6 +125,25 @@ class HexSelector:
         self.df = df
         self.selected_hexes: list[str] = []
         self.max_selection = 5
+        self._hex_index: pd.Index | None = None
+        self._hex_index_source: pd.DataFrame | None = None
+
+    def _positions(self) -> pd.Index:
+        """Index ``df["hex_id"]`` once per frame so id lookups avoid a full scan."""
+
+        if self._hex_index is None or self._hex_index_source is not self.df:
+            self._hex_index = pd.Index(self.df["hex_id"])
+            self._hex_index_source = self.df
+        return self._hex_index
+
+    def _rows_for(self, hex_ids: Sequence[str]) -> pd.DataFrame:
+        """Return rows whose hex id is in ``hex_ids``, in frame order."""
+
+        index = self._positions()
+        if not index.is_unique:
+            return self.df[self.df["hex_id"].isin(hex_ids)].copy()
+        positions = index.get_indexer(hex_ids)
+        return self.df.iloc[np.sort(positions[positions >= 0])].copy()
 
     def select_hex(self, hex_id: str) -> bool:
         """
@@ -171,7 +193,7 @@ class HexSelector:
         Returns:
             HexDetails or None if hex not found
         """
-        row = self.df[self.df["hex_id"] == hex_id]
+        row = self._rows_for([hex_id])
         if row.empty:
             logger.warning("hex_not_found", hex_id=hex_id)
             return None
@@ -188,7 +210,22 @@ class HexSelector:
         if not self.selected_hexes:
             return pd.DataFrame()
 
-        return self.df[self.df["hex_id"].isin(self.selected_hexes)].copy()
+        return self._rows_for(self.selected_hexes)
+
+    def get_neighbor_ids(self, hex_id: str, k: int = 6) -> list[str]:
+        """
+        Get ids of neighboring hexes present in the dataset (by H3 ring).
+
+        Args:
+            hex_id: Center hex ID
+            k: Number of rings
+
+        Returns:
+            Hex IDs in ring order, without building a DataFrame
+        """
+        h3 = _import_h3()
+        index = self._positions()
+        return [cell for cell in cast(Sequence[str], h3.grid_disk(hex_id, k)) if cell in index]
 
     def get_neighbors(self, hex_id: str, k: int = 6) -> pd.DataFrame:
         """
@@ -201,10 +238,4 @@ class HexSelector:
         Returns:
             DataFrame with neighboring hexes
         """
-        h3 = _import_h3()
-        neighbor_ids = cast(Sequence[str], h3.k_ring(hex_id, k=k))
-
-        # Filter to neighbors in dataset
-        neighbors = self.df[self.df["hex_id"].isin(neighbor_ids)].copy()
-
-        return neighbors
+        return self._rows_for(self.get_neighbor_ids(hex_id, k))
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import importlib
-import json
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from functools import lru_cache
+from threading import Lock
 from typing import Any, cast
 
+import numpy as np
+import orjson
 import pandas as pd
+from numpy.typing import NDArray
 
 from ..logging_utils import get_logger
 from .types import GeometryCacheEntry
@@ -17,114 +20,260 @@ from .types import GeometryCacheEntry
 LOGGER = get_logger("ui.hexes")
 
 
+# Roughly one state-wide resolution-9 dataset.
+DEFAULT_MAX_ENTRIES = 200_000
+# Bound for the per-hex record memo shared across the process.
+SHARED_MAX_ENTRIES = 10_000
+
+
 def _load_h3() -> Any:
     return importlib.import_module("h3")
 
 
-@lru_cache(maxsize=10_000)
-def _hex_boundary_geojson(hex_id: str) -> str:
-    h3 = _load_h3()
+def _closed_ring(h3: Any, hex_id: str) -> list[tuple[float, float]]:
     boundary_raw = cast(Sequence[Sequence[float]], h3.cell_to_boundary(hex_id))
     coordinates = [(float(lon), float(lat)) for lat, lon in boundary_raw]
     if coordinates and coordinates[0] != coordinates[-1]:
         coordinates.append(coordinates[0])
-    return json.dumps({"type": "Polygon", "coordinates": [coordinates]})
+    return coordinates
 
 
-@lru_cache(maxsize=10_000)
-def _hex_boundary_wkt(hex_id: str) -> str:
-    h3 = _load_h3()
-    boundary_raw = cast(Sequence[Sequence[float]], h3.cell_to_boundary(hex_id))
-    coordinates = [(float(lon), float(lat)) for lat, lon in boundary_raw]
-    if coordinates and coordinates[0] != coordinates[-1]:
-        coordinates.append(coordinates[0])
+def _ring_to_geojson(coordinates: list[tuple[float, float]]) -> str:
+    return orjson.dumps({"type": "Polygon", "coordinates": [coordinates]}).decode()
+
+
+def _ring_to_wkt(coordinates: list[tuple[float, float]]) -> str:
     coords = ",".join(f"{lon} {lat}" for lon, lat in coordinates)
     return f"POLYGON(({coords}))"
 
 
-@lru_cache(maxsize=10_000)
-def _hex_centroid(hex_id: str) -> tuple[float, float]:
+@lru_cache(maxsize=SHARED_MAX_ENTRIES)
+def _hex_record(hex_id: str) -> tuple[str, str, float, float, int]:
+    """Return ``(geojson, wkt, lon, lat, resolution)`` for one hex.
+
+    H3 conversion is deterministic, so records are shared by every
+    :class:`HexGeometryCache` in the process and by the single-hex helpers below,
+    rather than recomputed per instance or per representation. A miss costs one
+    conversion and, at capacity, one O(1) LRU eviction.
+    """
+
     h3 = _load_h3()
+    ring = _closed_ring(h3, hex_id)
     lat, lon = cast(tuple[float, float], h3.cell_to_latlng(hex_id))
-    return float(lon), float(lat)
+    resolution = int(h3.get_resolution(hex_id))
+    return _ring_to_geojson(ring), _ring_to_wkt(ring), float(lon), float(lat), resolution
 
 
 def hex_to_geojson(hex_id: str) -> dict[str, object]:
-    return cast(dict[str, object], json.loads(_hex_boundary_geojson(hex_id)))
+    return cast(dict[str, object], orjson.loads(_hex_record(hex_id)[0]))
 
 
 def hex_to_wkt(hex_id: str) -> str:
-    return _hex_boundary_wkt(hex_id)
+    return _hex_record(hex_id)[1]
 
 
 def hex_centroid(hex_id: str) -> tuple[float, float]:
-    return _hex_centroid(hex_id)
+    _, _, lon, lat, _ = _hex_record(hex_id)
+    return lon, lat
+
+
+def _empty_objects() -> NDArray[np.object_]:
+    return np.empty(0, dtype=object)
+
+
+def _empty_floats() -> NDArray[np.float64]:
+    return np.empty(0, dtype=np.float64)
+
+
+def _empty_resolutions() -> NDArray[np.int8]:
+    return np.empty(0, dtype=np.int8)
+
+
+def _empty_ticks() -> NDArray[np.int64]:
+    return np.empty(0, dtype=np.int64)
 
 
 @dataclass(slots=True)
 class HexGeometryCache:
-    """Cache hexagon geometries and derived attributes."""
-
-    store: dict[str, GeometryCacheEntry] = field(default_factory=dict)
+    """Cache hexagon geometries and derived attributes.
+
+    Entries are held as parallel column arrays (struct-of-arrays) with a
+    ``hex_id -> row`` index, so cache hits are served by a single fancy-index
+    per column rather than rebuilding per-hex records.
+
+    The cache holds at most ``max_entries`` hexes. When a batch of misses would
+    overflow it, the least recently requested entries are dropped, but never
+    those requested by the current call.
+
+    Dash serves callbacks from several threads, so lookups, appends and
+    evictions all run under one lock; the index and the column arrays are
+    never observed out of step.
+    """
+
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    _index: dict[str, int] = field(default_factory=dict)
+    _hex_ids: NDArray[np.object_] = field(default_factory=_empty_objects)
+    _geometry: NDArray[np.object_] = field(default_factory=_empty_objects)
+    _geometry_wkt: NDArray[np.object_] = field(default_factory=_empty_objects)
+    _centroid_lon: NDArray[np.float64] = field(default_factory=_empty_floats)
+    _centroid_lat: NDArray[np.float64] = field(default_factory=_empty_floats)
+    _resolution: NDArray[np.int8] = field(default_factory=_empty_resolutions)
+    _last_used: NDArray[np.int64] = field(default_factory=_empty_ticks)
+    _clock: int = 0
+    _lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, hex_id: object) -> bool:
+        return hex_id in self._index
 
     def ensure_geometries(self, hex_ids: Sequence[str]) -> pd.DataFrame:
-        records: list[dict[str, object]] = []
-        h3 = _load_h3()
-        for hex_id in hex_ids:
-            if hex_id not in self.store:
-                geometry = _hex_boundary_geojson(hex_id)
-                wkt = _hex_boundary_wkt(hex_id)
-                lon, lat = _hex_centroid(hex_id)
-                resolution = int(h3.get_resolution(hex_id))
-                self.store[hex_id] = GeometryCacheEntry(
-                    hex_id=hex_id,
-                    geometry=geometry,
-                    geometry_wkt=wkt,
-                    centroid_lon=lon,
-                    centroid_lat=lat,
-                    resolution=resolution,
-                )
-            records.append(self.store[hex_id].as_record())
-        return pd.DataFrame.from_records(records)
+        with self._lock:
+            requested = dict.fromkeys(hex_ids)
+            missing = [hex_id for hex_id in requested if hex_id not in self._index]
+            if missing:
+                if len(self._index) + len(missing) > self.max_entries:
+                    self._evict(requested, incoming=len(missing))
+                self._append(missing)
+            positions = np.fromiter(
+                (self._index[hex_id] for hex_id in hex_ids), dtype=np.intp, count=len(hex_ids)
+            )
+            self._clock += 1
+            self._last_used[positions] = self._clock
+            return pd.DataFrame(
+                {
+                    "hex_id": self._hex_ids[positions],
+                    "geometry": self._geometry[positions],
+                    "geometry_wkt": self._geometry_wkt[positions],
+                    "centroid_lon": self._centroid_lon[positions],
+                    "centroid_lat": self._centroid_lat[positions],
+                    "resolution": self._resolution[positions],
+                }
+            )
+
+    def _append(self, hex_ids: list[str]) -> None:
+        count = len(hex_ids)
+        # Transpose the per-hex records into columns in one pass.
+        geojson, wkt, lons, lats, resolutions = zip(
+            *(_hex_record(hex_id) for hex_id in hex_ids), strict=True
+        )
+        geometry = np.empty(count, dtype=object)
+        geometry[:] = geojson
+        geometry_wkt = np.empty(count, dtype=object)
+        geometry_wkt[:] = wkt
+        centroid_lon = np.fromiter(lons, dtype=np.float64, count=count)
+        centroid_lat = np.fromiter(lats, dtype=np.float64, count=count)
+        resolution = np.fromiter(resolutions, dtype=np.int8, count=count)
+        start = len(self._index)
+        self._index.update(zip(hex_ids, range(start, start + count), strict=True))
+        self._hex_ids = np.concatenate([self._hex_ids, np.asarray(hex_ids, dtype=object)])
+        self._geometry = np.concatenate([self._geometry, geometry])
+        self._geometry_wkt = np.concatenate([self._geometry_wkt, geometry_wkt])
+        self._centroid_lon = np.concatenate([self._centroid_lon, centroid_lon])
+        self._centroid_lat = np.concatenate([self._centroid_lat, centroid_lat])
+        self._resolution = np.concatenate([self._resolution, resolution])
+        self._last_used = np.concatenate([self._last_used, np.zeros(count, dtype=np.int64)])
+
+    def _evict(self, requested: Mapping[str, object], *, incoming: int) -> None:
+        budget = max(self.max_entries - incoming, 0)
+        pinned = np.zeros(len(self._index), dtype=bool)
+        pinned_positions = [self._index[hex_id] for hex_id in requested if hex_id in self._index]
+        pinned[pinned_positions] = True
+        spare = max(budget - len(pinned_positions), 0)
+        candidates = np.flatnonzero(~pinned)
+        if spare < len(candidates):
+            # Keep the most recently requested unpinned rows that still fit.
+            recent = np.argsort(self._last_used[candidates], kind="stable")[::-1][:spare]
+            candidates = candidates[recent]
+        keep = np.sort(np.concatenate([np.flatnonzero(pinned), candidates]))
+        evicted = len(self._index) - len(keep)
+        self._hex_ids = self._hex_ids[keep]
+        self._geometry = self._geometry[keep]
+        self._geometry_wkt = self._geometry_wkt[keep]
+        self._centroid_lon = self._centroid_lon[keep]
+        self._centroid_lat = self._centroid_lat[keep]
+        self._resolution = self._resolution[keep]
+        self._last_used = self._last_used[keep]
+        self._index = {str(hex_id): row for row, hex_id in enumerate(self._hex_ids)}
+        LOGGER.debug("hex_cache_evicted", evicted=evicted, retained=len(keep))
+
+    @property
+    def store(self) -> Mapping[str, GeometryCacheEntry]:
+        """Read-only ``hex_id -> GeometryCacheEntry`` view of the cached rows."""
+
+        return _GeometryStoreView(self)
 
     def validate(self, hex_ids: Sequence[str]) -> None:
-        missing = [hex_id for hex_id in hex_ids if hex_id not in self.store]
+        with self._lock:
+            missing = [hex_id for hex_id in hex_ids if hex_id not in self._index]
         if missing:
             msg = f"Missing geometries for {len(missing)} hexes"
             raise ValueError(msg)
 
 
+class _GeometryStoreView(Mapping[str, GeometryCacheEntry]):
+    """Mapping over a :class:`HexGeometryCache` that builds entries on access."""
+
+    __slots__ = ("_cache",)
+
+    def __init__(self, cache: HexGeometryCache) -> None:
+        self._cache = cache
+
+    def __getitem__(self, hex_id: str) -> GeometryCacheEntry:
+        cache = self._cache
+        with cache._lock:
+            row = cache._index[hex_id]
+            return GeometryCacheEntry(
+                hex_id=hex_id,
+                geometry=cast(str, cache._geometry[row]),
+                geometry_wkt=cast(str, cache._geometry_wkt[row]),
+                centroid_lon=float(cache._centroid_lon[row]),
+                centroid_lat=float(cache._centroid_lat[row]),
+                resolution=int(cache._resolution[row]),
+            )
+
+    def __iter__(self) -> Iterator[str]:
+        with self._cache._lock:
+            return iter(list(self._cache._index))
+
+    def __len__(self) -> int:
+        return len(self._cache._index)
+
+    def __contains__(self, hex_id: object) -> bool:
+        return hex_id in self._cache._index
+
+
+def parents_for_resolution(hex_ids: Sequence[str], resolution: int) -> NDArray[np.object_]:
+    """Return the ``resolution`` parent of each hex id, aligned with the input.
+
+    Ids are factorised first so every distinct cell costs one H3 call however
+    often it repeats.
+    """
+
+    codes, uniques = pd.factorize(np.asarray(hex_ids, dtype=object))
+    h3 = _load_h3()
+    parents = np.fromiter(
+        (cast(str, h3.cell_to_parent(hex_id, resolution)) for hex_id in uniques),
+        dtype=object,
+        count=len(uniques),
+    )
+    return cast(NDArray[np.object_], parents[codes])
+
+
 def build_hex_index(geometries: pd.DataFrame, resolution: int) -> Mapping[str, list[str]]:
     """Aggregate fine geometries into coarser resolution buckets."""
 
-    h3 = _load_h3()
     if geometries.empty:
         return {}
     if "hex_id" not in geometries.columns:
         raise KeyError("Geometries frame must contain hex_id column")
-    coarse_map: dict[str, list[str]] = {}
+    hex_ids = geometries["hex_id"].astype(str)
     if "resolution" in geometries.columns:
-        geoms = geometries[geometries["resolution"].astype(int) >= int(resolution)]
-    else:
-        geoms = geometries
-    resolution_series = geoms.get("resolution")
-    if resolution_series is None:
-        iterator: Iterable[tuple[str, int | None]] = (
-            (hex_id, None) for hex_id in geoms["hex_id"].astype(str)
-        )
-    else:
-        iterator = cast(
-            Iterable[tuple[str, int | None]],
-            zip(
-                geoms["hex_id"].astype(str),
-                resolution_series.astype(int),
-                strict=False,
-            ),
-        )
-    for hex_id, cell_resolution in iterator:
-        if cell_resolution is not None and int(cell_resolution) < int(resolution):
-            continue
-        parent = h3.cell_to_parent(hex_id, resolution)
+        hex_ids = hex_ids[geometries["resolution"].astype(int) >= int(resolution)]
+    coarse_map: dict[str, list[str]] = {}
+    parents = parents_for_resolution(hex_ids.tolist(), resolution)
+    for parent, hex_id in zip(parents, hex_ids, strict=True):
         coarse_map.setdefault(parent, []).append(hex_id)
     return coarse_map
 
@@ -135,23 +284,25 @@ class HexSpatialIndex:
 
     geometries: pd.DataFrame
     _tree: Any | None = field(init=False, default=None)
-    _geom_map: dict[Any, str] = field(init=False, default_factory=dict)
+    _hex_ids: NDArray[np.object_] = field(init=False, default_factory=_empty_objects)
+    _members: frozenset[str] = field(init=False, default=frozenset())
     _box: Callable[[float, float, float, float], Any] | None = field(init=False, default=None)
 
     def __post_init__(self) -> None:
+        self._hex_ids = self.geometries["hex_id"].astype(str).to_numpy(dtype=object)
+        self._members = frozenset(self._hex_ids)
         try:
-            from shapely import wkt as shapely_wkt
+            import shapely
             from shapely.geometry import box
-            from shapely.strtree import STRtree
         except ImportError:  # pragma: no cover - optional dependency
             self._tree = None
             LOGGER.warning(
                 "shapely_missing", msg="Shapely not installed; viewport queries use bbox fallback"
             )
             return
-        geometries = [shapely_wkt.loads(wkt) for wkt in self.geometries["geometry_wkt"]]
-        self._tree = STRtree(geometries)
-        self._geom_map = dict(zip(geometries, self.geometries["hex_id"], strict=False))
+        # Parse every polygon in one call and bulk-load the tree from the array.
+        shapes = shapely.from_wkt(self.geometries["geometry_wkt"].to_numpy(dtype=object))
+        self._tree = shapely.STRtree(shapes)
         self._box = box
 
     def query_bbox(
@@ -167,19 +318,21 @@ class HexSpatialIndex:
             )
             return frame.loc[mask, "hex_id"].astype(str).tolist()
         envelope = self._box(lon_min, lat_min, lon_max, lat_max)
-        matches = self._tree.query(envelope)
-        return [self._geom_map[geom] for geom in matches if geom in self._geom_map]
+        # STRtree.query returns positions into the bulk-loaded array.
+        matches = self._tree.query(envelope, predicate="intersects")
+        return cast(list[str], self._hex_ids[np.sort(matches)].tolist())
 
     def neighbours(self, hex_id: str, k: int = 1) -> list[str]:
         h3 = _load_h3()
         neighbours = cast(Sequence[str], h3.grid_disk(hex_id, k))
-        return [cell for cell in neighbours if cell in self.geometries["hex_id"].values]
+        return [cell for cell in neighbours if cell in self._members]
 
 
 __all__ = [
     "HexGeometryCache",
     "HexSpatialIndex",
     "build_hex_index",
+    "parents_for_resolution",
     "hex_to_geojson",
     "hex_to_wkt",
     "hex_centroid",
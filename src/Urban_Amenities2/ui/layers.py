@@ -135,13 +135,49 @@ def _rgba(color: str, alpha: float) -> str:
     return f"rgba({r},{g},{b},{alpha:.3f})"
 
 
+def _point_columns(
+    features: Sequence[Mapping[str, object]], name: str
+) -> tuple[list[float], list[float], list[str]]:
+    """Split point features into lon, lat and label columns, skipping non-points."""
+
+    lon: list[float] = []
+    lat: list[float] = []
+    labels: list[str] = []
+    for feature in features:
+        geometry = feature.get("geometry")
+        if not isinstance(geometry, Mapping) or geometry.get("type") != "Point":
+            continue
+        coords = geometry.get("coordinates")
+        if not (isinstance(coords, Sequence) and len(coords) >= 2):
+            continue
+        lon.append(float(coords[0]))
+        lat.append(float(coords[1]))
+        properties = feature.get("properties")
+        label = ""
+        if isinstance(properties, Mapping):
+            raw_label = properties.get("label")
+            if isinstance(raw_label, str):
+                label = raw_label
+        labels.append(label or name)
+    return lon, lat, labels
+
+
+# The label overlays are static, so their columns are extracted once at import.
+_CITY_POINTS = _point_columns(_CITY_FEATURES, "City labels")
+_LANDMARK_POINTS = _point_columns(_LANDMARK_FEATURES, "Landmarks")
+
+
 def build_overlay_payload(
     selected: Iterable[OverlayId],
     context: DataContext,
     *,
     opacity: float = 0.35,
+    zoom: float | None = None,
 ) -> OverlayPayload:
-    """Build mapbox layers and Plotly traces for the selected overlays."""
+    """Build mapbox layers and Plotly traces for the selected overlays.
+
+    When ``zoom`` is given, boundary overlays use the context's tier simplified for it.
+    """
 
     selected_set: set[OverlayId] = {value for value in selected or [] if value}
     layers: list[MapboxLayer] = []
@@ -151,7 +187,7 @@ def build_overlay_payload(
     def _boundary_layers(key: OverlayId, name: str, alpha_multiplier: float = 0.35) -> None:
         if key not in selected_set:
             return
-        geojson = context.get_overlay(key)
+        geojson = context.get_overlay(key, zoom)
         features = geojson.get("features") if isinstance(geojson, Mapping) else None
         if not features:
             return
@@ -212,33 +248,13 @@ def build_overlay_payload(
             )
 
     def _point_trace(
-        features: Sequence[Mapping[str, object]],
+        points: tuple[list[float], list[float], list[str]],
         name: str,
         marker: Mapping[str, Any],
         *,
         text_only: bool = False,
     ) -> None:
-        if not features:
-            return
-        lon: list[float] = []
-        lat: list[float] = []
-        labels: list[str] = []
-        for feature in features:
-            geometry = feature.get("geometry")
-            if not isinstance(geometry, Mapping) or geometry.get("type") != "Point":
-                continue
-            coords = geometry.get("coordinates")
-            if not (isinstance(coords, Sequence) and len(coords) >= 2):
-                continue
-            lon.append(float(coords[0]))
-            lat.append(float(coords[1]))
-            properties = feature.get("properties")
-            label = ""
-            if isinstance(properties, Mapping):
-                raw_label = properties.get("label")
-                if isinstance(raw_label, str):
-                    label = raw_label
-            labels.append(label or name)
+        lon, lat, labels = points
         if not lon:
             return
         mode = "text" if text_only else "markers+text"
@@ -260,12 +276,14 @@ def build_overlay_payload(
         features = stops.get("features") if isinstance(stops, Mapping) else None
         if isinstance(features, Sequence):
             _point_trace(
-                features, "Transit stops", {"size": 9, "color": "#0ea5e9", "opacity": 0.85}
+                _point_columns(features, "Transit stops"),
+                "Transit stops",
+                {"size": 9, "color": "#0ea5e9", "opacity": 0.85},
             )
 
     if "city_labels" in selected_set:
         _point_trace(
-            _CITY_FEATURES,
+            _CITY_POINTS,
             "City labels",
             {"size": 1, "color": "rgba(0,0,0,0)", "opacity": 0.0},
             text_only=True,
@@ -273,7 +291,7 @@ def build_overlay_payload(
 
     if "landmark_labels" in selected_set:
         _point_trace(
-            _LANDMARK_FEATURES,
+            _LANDMARK_POINTS,
             "Landmarks",
             {"size": 1, "color": "rgba(0,0,0,0)", "opacity": 0.0},
             text_only=True,
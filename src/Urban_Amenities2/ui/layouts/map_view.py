@@ -32,21 +32,7 @@ def _as_dropdown_options(options: Sequence[Mapping[str, object]]) -> list[dict[s
 def layout(**_: Any) -> html.Div:
     context = DATA_CONTEXT
     settings = SETTINGS or UISettings.from_environment()
-    states = (
-        sorted(context.scores["state"].dropna().unique())
-        if context is not None and "state" in context.scores
-        else []
-    )
-    metros = (
-        sorted(context.scores["metro"].dropna().unique())
-        if context is not None and "metro" in context.scores
-        else []
-    )
-    counties = (
-        sorted(context.scores["county"].dropna().unique())
-        if context is not None and "county" in context.scores
-        else []
-    )
+    filter_options = context.filter_options() if context is not None else None
     default_weights: dict[str, float] = {
         str(option["value"]): 100.0 / len(SUBSCORE_OPTIONS) for option in SUBSCORE_OPTIONS
     }
@@ -63,7 +49,7 @@ def layout(**_: Any) -> html.Div:
             html.Div(
                 className="map-controls",
                 children=[
-                    build_filter_panel(states, metros, counties),
+                    build_filter_panel(options=filter_options),
                     build_parameter_panel(default_weights),
                     html.Label("Subscore"),
                     dcc.Dropdown(
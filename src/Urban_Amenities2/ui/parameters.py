@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping, MutableMapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
+import numpy as np
 import structlog
+from numpy.typing import NDArray
 
 from Urban_Amenities2.config.params import AUCSParams, ModeConfig
 
 logger = structlog.get_logger()
 
+SUBSCORE_WEIGHTS = {
+    "weight_ea": "EA",
+    "weight_lca": "LCA",
+    "weight_muhaa": "MUHAA",
+    "weight_jea": "JEA",
+    "weight_morr": "MORR",
+    "weight_cte": "CTE",
+    "weight_sou": "SOU",
+}
+
 
 @dataclass
 class ParameterDiff:
@@ -20,18 +34,53 @@ class ParameterDiff:
     changed_keys: list[str] = field(default_factory=list)
 
     def __post_init__(self):
-        """Identify changed parameters."""
-        self.changed_keys = [
-            key for key in self.modified if self.original.get(key) != self.modified.get(key)
-        ]
+        """Identify changed parameters unless the caller already has."""
+        if not self.changed_keys:
+            self.changed_keys = [
+                key for key in self.modified if self.original.get(key) != self.modified.get(key)
+            ]
 
     def has_changes(self) -> bool:
         """Check if any parameters have changed."""
         return len(self.changed_keys) > 0
 
 
+class _ModifiedParamsView(MutableMapping[str, float]):
+    """Write-through mapping over a :class:`ParameterAdjuster`'s modified values."""
+
+    __slots__ = ("_adjuster",)
+
+    def __init__(self, adjuster: ParameterAdjuster) -> None:
+        self._adjuster = adjuster
+
+    def __getitem__(self, key: str) -> float:
+        adjuster = self._adjuster
+        return float(adjuster._modified[adjuster._positions[key]])
+
+    def __setitem__(self, key: str, value: float) -> None:
+        if key not in self._adjuster._positions:
+            raise KeyError(key)
+        self._adjuster.update_parameter(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("Adjustable parameters cannot be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._adjuster._keys)
+
+    def __len__(self) -> int:
+        return len(self._adjuster._keys)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
 class ParameterAdjuster:
-    """Manage parameter adjustments in the UI."""
+    """Manage parameter adjustments in the UI.
+
+    Values are held in two float64 arrays aligned with a fixed key order, so
+    validation and diffs are single vector operations.
+    """
 
     def __init__(self, params: AUCSParams):
         """
@@ -41,22 +90,37 @@ class ParameterAdjuster:
             params: Base AUCS parameters
         """
         self.params = params
-        self.original_params = self._extract_adjustable_params()
-        self.modified_params = self.original_params.copy()
+        adjustable = self._extract_adjustable_params()
+        self._keys = tuple(adjustable)
+        self._positions = {key: index for index, key in enumerate(self._keys)}
+        self._weight_positions = np.array([self._positions[key] for key in SUBSCORE_WEIGHTS])
+        self._original: NDArray[np.float64] = np.fromiter(
+            adjustable.values(), dtype=np.float64, count=len(adjustable)
+        )
+        self._modified = self._original.copy()
+        self._original_view = MappingProxyType(
+            dict(zip(self._keys, self._original.tolist(), strict=True))
+        )
+
+    @property
+    def original_params(self) -> Mapping[str, float]:
+        """Read-only view of the original parameter values."""
+        return self._original_view
+
+    @property
+    def modified_params(self) -> MutableMapping[str, float]:
+        """Live view of the current values; item assignment updates the adjuster."""
+        return _ModifiedParamsView(self)
+
+    @modified_params.setter
+    def modified_params(self, values: Mapping[str, float]) -> None:
+        self._modified = np.array([values[key] for key in self._keys], dtype=np.float64)
 
     def _extract_adjustable_params(self) -> dict[str, float]:
         """Extract parameters that can be adjusted in the UI."""
-        adjustable = {}
-
         # Subscore weights
         subscores = self.params.subscores
-        adjustable["weight_ea"] = subscores.EA
-        adjustable["weight_lca"] = subscores.LCA
-        adjustable["weight_muhaa"] = subscores.MUHAA
-        adjustable["weight_jea"] = subscores.JEA
-        adjustable["weight_morr"] = subscores.MORR
-        adjustable["weight_cte"] = subscores.CTE
-        adjustable["weight_sou"] = subscores.SOU
+        adjustable = {key: getattr(subscores, name) for key, name in SUBSCORE_WEIGHTS.items()}
 
         def _mode_alpha(mode_name: str) -> float:
             mode: ModeConfig | None = self.params.modes.get(mode_name)
@@ -88,16 +152,22 @@ class ParameterAdjuster:
             key: Parameter key (e.g., 'weight_ea', 'alpha_walk')
             value: New parameter value
         """
-        if key not in self.original_params:
+        position = self._positions.get(key)
+        if position is None:
             logger.warning("unknown_parameter", key=key)
             return
 
-        self.modified_params[key] = value
+        self._modified[position] = value
         logger.info("parameter_updated", key=key, value=value)
 
     def get_diff(self) -> ParameterDiff:
         """Get diff between original and modified parameters."""
-        return ParameterDiff(original=self.original_params, modified=self.modified_params)
+        changed = np.flatnonzero(self._modified != self._original)
+        return ParameterDiff(
+            original=dict(self.original_params),
+            modified=dict(self.modified_params),
+            changed_keys=[self._keys[index] for index in changed],
+        )
 
     def validate_weights(self) -> tuple[bool, str]:
         """
@@ -106,8 +176,7 @@ class ParameterAdjuster:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        weight_keys = [f"weight_{s}" for s in ["ea", "lca", "muhaa", "jea", "morr", "cte", "sou"]]
-        weight_sum = sum(self.modified_params[k] for k in weight_keys)
+        weight_sum = float(self._modified[self._weight_positions].sum())
 
         if abs(weight_sum - 100.0) > 0.01:
             return False, f"Weights sum to {weight_sum:.2f}, must equal 100.0"
@@ -116,9 +185,9 @@ class ParameterAdjuster:
 
     def reset(self) -> None:
         """Reset all parameters to original values."""
-        self.modified_params = self.original_params.copy()
+        self._modified = self._original.copy()
         logger.info("parameters_reset")
 
     def to_dict(self) -> dict[str, float]:
         """Export modified parameters as dictionary."""
-        return self.modified_params.copy()
+        return dict(self.modified_params)
@@ -6,7 +6,6 @@ import time
 from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from functools import wraps
-from statistics import mean
 
 import structlog
 
@@ -21,12 +20,12 @@ def timer(operation: str) -> Iterator[None]:
     Args:
         operation: Description of the operation being timed
     """
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     try:
         yield
     finally:
-        elapsed = time.perf_counter() - start
-        logger.info("operation_timed", operation=operation, elapsed_ms=elapsed * 1000)
+        elapsed_ns = time.perf_counter_ns() - start
+        logger.info("operation_timed", operation=operation, elapsed_ms=elapsed_ns / 1_000_000)
 
 
 def profile_function[**P, T](func: Callable[P, T]) -> Callable[P, T]:
@@ -42,14 +41,14 @@ def profile_function[**P, T](func: Callable[P, T]) -> Callable[P, T]:
 
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        elapsed = time.perf_counter() - start
+        elapsed_ns = time.perf_counter_ns() - start
 
         logger.info(
             "function_profiled",
             function=func.__name__,
-            elapsed_ms=elapsed * 1000,
+            elapsed_ms=elapsed_ns / 1_000_000,
             args_count=len(args),
             kwargs_count=len(kwargs),
         )
@@ -59,12 +58,115 @@ def profile_function[**P, T](func: Callable[P, T]) -> Callable[P, T]:
     return wrapper
 
 
+class _P2Quantile:
+    """Streaming quantile estimate using the P² algorithm (Jain & Chlamtac, 1985).
+
+    Keeps five markers regardless of how many samples are observed; the first
+    five samples are held verbatim so small series report exact values.
+    """
+
+    __slots__ = ("_desired", "_heights", "_increments", "_positions", "quantile")
+
+    def __init__(self, quantile: float) -> None:
+        self.quantile = quantile
+        self._heights: list[float] = []
+        self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self._desired = [1.0, 1.0 + 2 * quantile, 1.0 + 4 * quantile, 3.0 + 2 * quantile, 5.0]
+        self._increments = [0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0]
+
+    def update(self, value: float) -> None:
+        heights = self._heights
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if heights[i] <= value < heights[i + 1])
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+        for i in (1, 2, 3):
+            delta = self._desired[i] - positions[i]
+            if (delta >= 1 and positions[i + 1] - positions[i] > 1) or (
+                delta <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if delta > 0 else -1
+                candidate = self._parabolic(i, step)
+                if heights[i - 1] < candidate < heights[i + 1]:
+                    heights[i] = candidate
+                else:
+                    heights[i] += step * (heights[i + step] - heights[i]) / (
+                        positions[i + step] - positions[i]
+                    )
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q = self._heights
+        n = self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> float:
+        heights = self._heights
+        if not heights:
+            return 0.0
+        if len(heights) < 5 or self._positions[4] == 5.0:
+            index = min(len(heights) - 1, int(round(self.quantile * (len(heights) - 1))))
+            return heights[index]
+        return heights[2]
+
+
+class MetricSummary:
+    """Constant-size running summary for a single metric.
+
+    Attributes:
+        count: Number of recorded samples
+        minimum: Smallest recorded sample
+        maximum: Largest recorded sample
+        total: Sum of all recorded samples
+        quantiles: P² estimators for the 50th, 95th and 99th percentiles
+    """
+
+    __slots__ = ("count", "maximum", "minimum", "quantiles", "total")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self.total = 0.0
+        self.quantiles = {pct: _P2Quantile(pct / 100) for pct in (50, 95, 99)}
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        for estimator in self.quantiles.values():
+            estimator.update(value)
+
+
 class PerformanceMonitor:
-    """Monitor and track UI performance metrics."""
+    """Monitor and track UI performance metrics.
+
+    Each metric keeps a fixed-size :class:`MetricSummary` (count, min, max, sum
+    and P² percentile markers) in :attr:`summaries`, so memory stays constant for
+    long-running sessions. Statistics cover every sample recorded since the
+    monitor was created, not a trailing window; raw samples are not retained.
+    """
 
     def __init__(self) -> None:
         """Initialize performance monitor."""
-        self.metrics: dict[str, list[float]] = {}
+        self.summaries: dict[str, MetricSummary] = {}
 
     def record(self, metric_name: str, value: float) -> None:
         """
@@ -74,14 +176,10 @@ class PerformanceMonitor:
             metric_name: Name of the metric (e.g., 'query_time_ms', 'render_time_ms')
             value: Metric value
         """
-        if metric_name not in self.metrics:
-            self.metrics[metric_name] = []
-
-        self.metrics[metric_name].append(value)
-
-        # Keep only last 1000 values to avoid unbounded growth
-        if len(self.metrics[metric_name]) > 1000:
-            self.metrics[metric_name] = self.metrics[metric_name][-1000:]
+        summary = self.summaries.get(metric_name)
+        if summary is None:
+            summary = self.summaries[metric_name] = MetricSummary()
+        summary.update(float(value))
 
     def get_stats(self, metric_name: str) -> dict[str, float] | None:
         """
@@ -91,34 +189,27 @@ class PerformanceMonitor:
             metric_name: Name of the metric
 
         Returns:
-            Dictionary with min, max, mean, p50, p95, p99
+            Dictionary with min, max, mean, p50, p95, p99 and count over every
+            recorded sample; percentiles are P² estimates beyond five samples
         """
-        if metric_name not in self.metrics or not self.metrics[metric_name]:
+        summary = self.summaries.get(metric_name)
+        if summary is None or summary.count == 0:
             return None
 
-        values = list(self.metrics[metric_name])
-        values_sorted = sorted(values)
-        count = len(values_sorted)
-
-        def percentile(pct: float) -> float:
-            if not values_sorted:
-                return 0.0
-            index = min(count - 1, int(round((pct / 100) * (count - 1))))
-            return values_sorted[index]
-
+        quantiles = summary.quantiles
         return {
-            "min": float(values_sorted[0]),
-            "max": float(values_sorted[-1]),
-            "mean": float(mean(values_sorted)),
-            "p50": percentile(50),
-            "p95": percentile(95),
-            "p99": percentile(99),
-            "count": count,
+            "min": summary.minimum,
+            "max": summary.maximum,
+            "mean": summary.total / summary.count,
+            "p50": quantiles[50].value(),
+            "p95": quantiles[95].value(),
+            "p99": quantiles[99].value(),
+            "count": summary.count,
         }
 
     def get_all_stats(self) -> dict[str, dict[str, float]]:
         """Get statistics for all tracked metrics."""
-        return {name: stats for name in self.metrics if (stats := self.get_stats(name)) is not None}
+        return {name: stats for name in self.summaries if (stats := self.get_stats(name)) is not None}
 
 
 # Global performance monitor instance
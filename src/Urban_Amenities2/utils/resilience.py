@@ -122,6 +122,9 @@ class CircuitBreaker:
             return result
 
     def before_call(self) -> None:
+        # A closed breaker is the common case; reading one attribute needs no lock.
+        if self._state == "closed":
+            return
         with self._lock:
             if self._state == "open":
                 if self.clock() - self._opened_at >= self.recovery_timeout:
@@ -130,6 +133,8 @@ class CircuitBreaker:
                     raise CircuitBreakerOpenError("circuit breaker is open")
 
     def record_success(self) -> None:
+        if self._state == "closed" and not self._failures:
+            return
         with self._lock:
             self._state = "closed"
             self._failures = 0
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import os
+import sys
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
+if sys.platform != "win32":
+    import fcntl
+
 
 @dataclass(slots=True)
 class DataSnapshot:
@@ -18,28 +24,32 @@ class DataSnapshot:
     def to_json(self) -> str:
         payload = asdict(self)
         payload["download_date"] = self.download_date.isoformat()
-        return json.dumps(payload, sort_keys=True)
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()
 
     @staticmethod
-    def from_json(payload: str) -> DataSnapshot:
-        data = json.loads(payload)
+    def from_json(payload: str | bytes) -> DataSnapshot:
+        data = orjson.loads(payload)
         data["download_date"] = datetime.fromisoformat(data["download_date"])
         return DataSnapshot(**data)
 
 
 def register_snapshot(snapshot: DataSnapshot, storage: Path) -> None:
     storage.parent.mkdir(parents=True, exist_ok=True)
-    with storage.open("a", encoding="utf-8") as fp:
-        fp.write(snapshot.to_json() + "\n")
+    # Hold an exclusive lock for the unbuffered O_APPEND writes, so concurrent
+    # registrations land as whole lines even when a record needs several writes.
+    line = memoryview((snapshot.to_json() + "\n").encode("utf-8"))
+    fd = os.open(storage, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        if sys.platform != "win32":
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        while line:
+            line = line[os.write(fd, line) :]
+    finally:
+        os.close(fd)  # also releases the lock
 
 
 def list_snapshots(storage: Path) -> list[DataSnapshot]:
     if not storage.exists():
         return []
-    snapshots: list[DataSnapshot] = []
-    for line in storage.read_text().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        snapshots.append(DataSnapshot.from_json(line))
-    return snapshots
+    with storage.open("rb") as fp:
+        return [DataSnapshot.from_json(line) for line in fp if line.strip()]
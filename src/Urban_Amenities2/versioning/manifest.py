@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import os
 import uuid
 from collections.abc import Iterable
+from contextlib import suppress
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
 
 @dataclass(slots=True)
 class RunManifest:
@@ -21,11 +25,11 @@ class RunManifest:
     def to_json(self) -> str:
         payload = asdict(self)
         payload["timestamp"] = self.timestamp.isoformat()
-        return json.dumps(payload, sort_keys=True)
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()
 
     @staticmethod
-    def from_json(payload: str) -> RunManifest:
-        data = json.loads(payload)
+    def from_json(payload: str | bytes) -> RunManifest:
+        data = orjson.loads(payload)
         data["timestamp"] = datetime.fromisoformat(data["timestamp"])
         return RunManifest(**data)
 
@@ -47,26 +51,100 @@ def create_run_manifest(
     return run
 
 
+def _index_path(storage: Path) -> Path:
+    return storage.with_suffix(".index")
+
+
+def _indexable(run_id: str) -> bool:
+    return "\t" not in run_id and "\n" not in run_id
+
+
 def append_manifest(manifest: RunManifest, storage: Path) -> None:
     storage.parent.mkdir(parents=True, exist_ok=True)
-    with storage.open("a", encoding="utf-8") as fp:
-        fp.write(manifest.to_json() + "\n")
+    line = (manifest.to_json() + "\n").encode("utf-8")
+    with storage.open("ab") as fp:
+        offset = fp.seek(0, os.SEEK_END)
+        fp.write(line)
+    # Only extend an index that already covers the log; a missing one is rebuilt on lookup.
+    index = _index_path(storage)
+    if _indexable(manifest.run_id) and (offset == 0 or index.exists()):
+        with index.open("w" if offset == 0 else "a", encoding="utf-8") as fp:
+            fp.write(f"{manifest.run_id}\t{offset}\t{len(line)}\n")
 
 
 def list_manifests(storage: Path) -> list[RunManifest]:
     if not storage.exists():
         return []
-    manifests: list[RunManifest] = []
-    for line in storage.read_text().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        manifests.append(RunManifest.from_json(line))
-    return manifests
+    with storage.open("rb") as fp:
+        return [RunManifest.from_json(line) for line in fp if line.strip()]
+
+
+@lru_cache(maxsize=8)
+def _read_index(index: Path, stamp: tuple[int, int]) -> dict[str, tuple[int, int]]:
+    # ``stamp`` is (mtime_ns, size) so appends invalidate the cached mapping.
+    entries: dict[str, tuple[int, int]] = {}
+    with index.open("r", encoding="utf-8") as fp:
+        for line in fp:
+            run_id, offset, length = line.rstrip("\n").split("\t")
+            entries.setdefault(run_id, (int(offset), int(length)))
+    return entries
+
+
+def _rebuild_index(storage: Path) -> None:
+    offset = 0
+    with storage.open("rb") as log, _index_path(storage).open("w", encoding="utf-8") as fp:
+        for line in log:
+            if line.strip():
+                run_id = RunManifest.from_json(line).run_id
+                if _indexable(run_id):
+                    fp.write(f"{run_id}\t{offset}\t{len(line)}\n")
+            offset += len(line)
+
+
+def _lookup_index(storage: Path, run_id: str) -> RunManifest | None:
+    index = _index_path(storage)
+    if not index.exists():
+        try:
+            _rebuild_index(storage)
+        except OSError:
+            # Read-only storage: drop any partial index and let the caller scan the log.
+            with suppress(OSError):
+                index.unlink(missing_ok=True)
+            return None
+    stat = index.stat()
+    try:
+        entry = _read_index(index, (stat.st_mtime_ns, stat.st_size)).get(run_id)
+    except ValueError:
+        return None
+    if entry is None:
+        return None
+    offset, length = entry
+    with storage.open("rb") as fp:
+        fp.seek(offset)
+        raw = fp.read(length)
+    try:
+        manifest = RunManifest.from_json(raw)
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+    return manifest if manifest.run_id == run_id else None
 
 
 def get_manifest(run_id: str, storage: Path) -> RunManifest | None:
-    for manifest in list_manifests(storage):
-        if manifest.run_id == run_id:
-            return manifest
+    if not storage.exists():
+        return None
+    # The sidecar index turns lookups into a seek + read; fall back to scanning when it
+    # is stale or does not know the id.
+    manifest = _lookup_index(storage, run_id)
+    if manifest is not None:
+        return manifest
+    # Only parse lines that can contain the id. ASCII ids encode the same way in every
+    # writer's output, so their quoted form is a safe pre-filter.
+    needle = orjson.dumps(run_id) if run_id.isascii() else b""
+    with storage.open("rb") as fp:
+        for line in fp:
+            if needle not in line or not line.strip():
+                continue
+            manifest = RunManifest.from_json(line)
+            if manifest.run_id == run_id:
+                return manifest
     return None
@@ -19,6 +19,7 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
+from tests.ui_factories import write_ui_dataset  # noqa: E402
 from Urban_Amenities2.cache.manager import CacheConfig, CacheManager  # noqa: E402
 from Urban_Amenities2.ui.config import UISettings  # noqa: E402
 from Urban_Amenities2.ui.data_loader import DataContext  # noqa: E402
@@ -104,6 +105,26 @@ def sample_hex_ids() -> list[str]:
     ]
 
 
+@pytest.fixture(scope="session")
+def ui_dataset_template(
+    tmp_path_factory: pytest.TempPathFactory, sample_hex_ids: list[str]
+) -> Path:
+    """Write each UI dataset variant once per session for tests to copy."""
+
+    root = tmp_path_factory.mktemp("ui-template")
+    variants = {
+        "flat-20240101": ("20240101", ["CO", "NE", "CA"], datetime(2024, 1, 1, 12), False),
+        "nested-20240101": ("20240101", ["CO", "NE", "CA"], datetime(2024, 1, 1, 12), True),
+        "nested-20240201": ("20240201", ["WA", "OR", "CA"], datetime(2024, 2, 1, 12), True),
+        "nested-20240301": ("20240301", ["NY", "NJ", "PA"], datetime(2024, 3, 1, 12), True),
+    }
+    for name, (identifier, states, timestamp, nested) in variants.items():
+        target = root / name
+        target.mkdir()
+        write_ui_dataset(target, identifier, sample_hex_ids, states, timestamp, nested=nested)
+    return root
+
+
 @pytest.fixture
 def cache_manager(tmp_path: Path) -> Iterator[CacheManager]:
     """Create an isolated cache manager backed by diskcache."""
@@ -177,6 +177,64 @@ def test_fetch_returns_empty_for_no_items(
     assert frame.empty
 
 
+def test_fetch_skips_cache_read_when_remote_succeeds(
+    tmp_path: Path,
+    dummy_rate_limiter,
+    dummy_breaker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    payload = {"items": [{"timestamp": "2024010100", "views": 10}]}
+    session = RecordingSession([StubResponse(payload), StubResponse(payload)])
+    _patch_retry(monkeypatch)
+    client = wikipedia.WikipediaClient(
+        cache_dir=tmp_path / "cache",
+        session=session,
+        rate_limiter=dummy_rate_limiter,
+        circuit_breaker=dummy_breaker,
+    )
+    client.fetch("Example Article")
+
+    def _unexpected_get(*_args: object, **_kwargs: object) -> object:
+        raise AssertionError("cache read on a successful fetch")
+
+    monkeypatch.setattr(client.cache, "get", _unexpected_get)
+    frame = client.fetch("Example Article")
+    assert list(frame["pageviews"]) == [10]
+
+
+def test_fetch_isolates_circuit_breakers_per_title(
+    tmp_path: Path,
+    dummy_rate_limiter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _patch_retry(monkeypatch)
+    breakers: list[wikipedia.CircuitBreaker] = []
+
+    def _factory() -> wikipedia.CircuitBreaker:
+        breaker = wikipedia.CircuitBreaker(
+            failure_threshold=1, expected_exceptions=(requests.RequestException,)
+        )
+        breakers.append(breaker)
+        return breaker
+
+    payload = {"items": [{"timestamp": "2024010100", "views": 10}]}
+    session = RecordingSession([StubResponse({}, status_code=500), StubResponse(payload)])
+    client = wikipedia.WikipediaClient(
+        cache_dir=tmp_path / "cache",
+        session=session,
+        rate_limiter=dummy_rate_limiter,
+        circuit_breaker_factory=_factory,
+    )
+    with pytest.raises(requests.HTTPError):
+        client.fetch("Flaky")
+    with pytest.raises(CircuitBreakerOpenError):
+        client.fetch("Flaky")
+    frame = client.fetch("Healthy")
+    assert list(frame["pageviews"]) == [10]
+    assert len(breakers) == 2
+    assert session.calls == 2
+
+
 def test_fetch_raises_when_circuit_open_without_cache(
     tmp_path: Path,
     dummy_rate_limiter,
@@ -206,3 +206,11 @@ def test_ces_respects_upper_bound_for_normalised_inputs(
         assert normalised.max() - 1e-8 <= result <= 1.0 + 1e-8
     else:
         assert result >= 1.0 - 1e-8
+
+
+def test_ces_geometric_mean_clamps_zero_products() -> None:
+    quality = np.asarray([[1.0, 0.0], [2.0, 8.0]], dtype=float)
+    accessibility = np.ones_like(quality)
+    result = ces_aggregate(quality, accessibility, rho=0.0, axis=1)
+    assert result[0] == pytest.approx(np.sqrt(1e-12))
+    assert result[1] == pytest.approx(4.0)
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import json
+from pathlib import Path
 from typing import Any
 
+import diskcache
 import pytest
 
-from Urban_Amenities2.cache.manager import CacheManager
+from Urban_Amenities2.cache.manager import TAGGED_MARKER, CacheConfig, CacheManager
 
 
 def test_cache_roundtrip(cache_manager: CacheManager) -> None:
@@ -25,6 +27,7 @@ def test_cache_roundtrip(cache_manager: CacheManager) -> None:
     assert stats["misses"] == 1  # initial miss
     assert stats["sets"] == 1
     assert stats["hit_rate"] > 0
+    assert stats["hit_rate_ewma"] == pytest.approx(50.0, abs=1.0)
 
 
 def test_cache_key_hashing(cache_manager: CacheManager) -> None:
@@ -32,20 +35,37 @@ def test_cache_key_hashing(cache_manager: CacheManager) -> None:
     hashed = cache_manager._make_key("wikidata", "entity", long_key)
     assert len(hashed.split(":")) == 3
     assert long_key not in hashed
+    assert len(hashed.split(":")[-1]) == 16
+    assert hashed == cache_manager._make_key("wikidata", "entity", long_key)
+
+
+def test_cache_hit_rate_ewma_tracks_recent_lookups(cache_manager: CacheManager) -> None:
+    cache_manager.set("wikipedia", "page", "1", {"value": 1})
+    for _ in range(200):
+        cache_manager.get("wikipedia", "page", "1")
+    assert cache_manager.get_stats()["hit_rate_ewma"] > 90.0
+
+    for _ in range(200):
+        cache_manager.get("wikipedia", "page", "missing")
+    stats = cache_manager.get_stats()
+    assert stats["hit_rate"] == 50.0
+    assert stats["hit_rate_ewma"] < 20.0
 
 
 def test_cache_ttl_selection(cache_manager: CacheManager, monkeypatch: pytest.MonkeyPatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_set(key: str, value: bytes, expire: int | None = None) -> bool:
+    def fake_set(key: str, value: bytes, expire: int | None = None, tag: str | None = None) -> bool:
         captured["key"] = key
         captured["expire"] = expire
+        captured["tag"] = tag
         return True
 
     monkeypatch.setattr(cache_manager.cache, "set", fake_set)
 
     cache_manager.set("wikipedia", "page", "1", {"title": "Test"})
     assert captured["expire"] == cache_manager.config.ttl_wikipedia
+    assert captured["tag"] == "wikipedia"
 
     cache_manager.set("otp", "trip", "2", {"legs": []})
     assert captured["expire"] == cache_manager.config.ttl_routing
@@ -65,6 +85,73 @@ def test_cache_invalidate_and_clear(cache_manager: CacheManager) -> None:
     assert cache_manager.get("wikidata", "entity", "Q1") is None
 
 
+def test_cache_invalidate_source_uses_tag_index(
+    cache_manager: CacheManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_manager.set("wikipedia", "page", "1", {"title": "A"})
+    cache_manager.set("wikipedia", "views", "1", {"views": 3})
+    cache_manager.set("wikidata", "entity", "Q1", {"label": "Item"})
+
+    def no_scan() -> None:
+        raise AssertionError("source invalidation should not scan keys")
+
+    monkeypatch.setattr(cache_manager.cache, "iterkeys", no_scan)
+    assert cache_manager.invalidate("wikipedia") == 2
+    assert cache_manager.get("wikidata", "entity", "Q1") == {"label": "Item"}
+
+
+def test_cache_invalidate_source_removes_untagged_entries(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "legacy"
+    config = CacheConfig(cache_dir=cache_dir, compression="none")
+    with diskcache.Cache(str(cache_dir)) as legacy:
+        legacy.set("wikipedia:page:1", json.dumps({"title": "A"}).encode())
+    manager = CacheManager(config)
+    manager.set("wikipedia", "page", "2", {"title": "B"})
+
+    assert manager.get("wikipedia", "page", "1") == {"title": "A"}
+    assert manager.invalidate("wikipedia") == 2
+    assert manager.get("wikipedia", "page", "1") is None
+
+    manager.clear()
+    assert CacheManager(config)._untagged_entries is False
+
+
+def test_cache_invalidate_retags_legacy_entries_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_dir = tmp_path / "legacy"
+    config = CacheConfig(cache_dir=cache_dir, compression="none")
+    with diskcache.Cache(str(cache_dir)) as legacy:
+        legacy.set("wikipedia:page:1", json.dumps({"title": "A"}).encode())
+        legacy.set("osrm:route:1", json.dumps({"d": 1}).encode(), expire=3600)
+    manager = CacheManager(config)
+    scans = 0
+    iterkeys = manager.cache.iterkeys
+
+    def counting_iterkeys(*args: Any, **kwargs: Any) -> Any:
+        nonlocal scans
+        scans += 1
+        return iterkeys(*args, **kwargs)
+
+    monkeypatch.setattr(manager.cache, "iterkeys", counting_iterkeys)
+    assert manager.invalidate("wikipedia") == 1
+    assert scans == 1
+    assert (cache_dir / TAGGED_MARKER).exists()
+
+    # Legacy entries now carry their source tag and keep their expiry.
+    _, expire_time, tag = manager.cache.get("osrm:route:1", expire_time=True, tag=True)
+    assert tag == "osrm"
+    assert expire_time is not None
+
+    def no_scan(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("source invalidation scanned keys")
+
+    monkeypatch.setattr(manager.cache, "iterkeys", no_scan)
+    assert manager.invalidate("osrm") == 1
+    assert manager.get("osrm", "route", "1") is None
+    assert CacheManager(config)._untagged_entries is False
+
+
 def test_cache_get_error_returns_default(
     cache_manager: CacheManager, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -83,3 +170,62 @@ def test_cache_serialisation_errors(
 
     monkeypatch.setattr(json, "dumps", bad_dumps)
     assert cache_manager.set("wikidata", "entity", "broken", {"a": 1}) is False
+
+
+def test_cache_compression_codecs_roundtrip(tmp_path: Path) -> None:
+    payload = {"data": "y" * 4096}
+    lz4_cache = CacheManager(CacheConfig(cache_dir=tmp_path / "lz4", compression="lz4"))
+    gzip_cache = CacheManager(CacheConfig(cache_dir=tmp_path / "gzip", compression="gzip"))
+    raw_cache = CacheManager(CacheConfig(cache_dir=tmp_path / "raw", compression=False))
+
+    for manager in (lz4_cache, gzip_cache, raw_cache):
+        assert manager.set("wikipedia", "page", "big", payload)
+        assert manager.set("wikipedia", "page", "small", {"v": 1})
+        assert manager.get("wikipedia", "page", "big") == payload
+        assert manager.get("wikipedia", "page", "small") == {"v": 1}
+
+    assert lz4_cache.cache.get("wikipedia:page:big").startswith(b"LZ4\x00")
+    assert lz4_cache.cache.get("wikipedia:page:small") == b'{"v": 1}'
+    # Entries written by another codec are still readable.
+    lz4_cache.cache.set("wikipedia:page:legacy", gzip_cache.cache.get("wikipedia:page:big"))
+    assert lz4_cache.get("wikipedia", "page", "legacy") == payload
+
+
+def test_cache_config_rejects_unknown_codec(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        CacheConfig(cache_dir=tmp_path, compression="brotli")  # type: ignore[arg-type]
+
+
+def test_cache_warm_uses_single_transaction(
+    cache_manager: CacheManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    transactions: list[bool] = []
+    original = cache_manager.cache.transact
+
+    def tracking_transact(retry: bool = False) -> Any:
+        transactions.append(retry)
+        return original(retry=retry)
+
+    monkeypatch.setattr(cache_manager.cache, "transact", tracking_transact)
+    entries = [("wikipedia", "page", str(i), {"views": i}) for i in range(50)]
+    entries.append(("wikipedia", "page", "bad", {"value": object()}))
+
+    assert cache_manager.warm_cache(entries) == 50
+    assert transactions == [True]
+    assert cache_manager.stats["sets"] == 50
+    assert cache_manager.get("wikipedia", "page", "49") == {"views": 49}
+    assert cache_manager.get("wikipedia", "page", "bad") is None
+
+
+def test_cache_warm_from_arrow(cache_manager: CacheManager) -> None:
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table(
+        {
+            "source": ["wikidata", "wikidata"],
+            "entity_type": ["entity", "entity"],
+            "entity_id": ["Q1", "Q2"],
+            "value": [{"label": "One"}, {"label": "Two"}],
+        }
+    )
+    assert cache_manager.warm_cache_from_arrow(table) == 2
+    assert cache_manager.get("wikidata", "entity", "Q2") == {"label": "Two"}
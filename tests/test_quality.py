@@ -118,3 +118,36 @@ def test_brand_dedupe_preserves_weight() -> None:
     assert pytest.approx(deduped["brand_weight"].sum()) == pytest.approx(pois["quality"].sum())
     assert stats["affected_ratio"] > 0
     assert deduped.loc[deduped["poi_id"] == "b", "brand_penalty"].iloc[0] < 1.0
+
+
+def test_brand_dedupe_nearest_neighbour_matches_pairwise() -> None:
+    rng = np.random.default_rng(7)
+    lat = 40.0 + rng.uniform(0.0, 0.02, size=60)
+    lon = -105.0 + rng.uniform(0.0, 0.02, size=60)
+    pois = pd.DataFrame(
+        {
+            "poi_id": [f"p{i}" for i in range(60)],
+            "aucstype": ["grocery"] * 60,
+            "brand": ["Chain"] * 60,
+            "lat": lat,
+            "lon": lon,
+            "quality": np.full(60, 50.0),
+        }
+    )
+    config = BrandDedupeConfig(distance_threshold_m=400, beta_per_km=1.5)
+    deduped, _ = apply_brand_dedupe(pois, config)
+
+    lat_r = np.radians(lat)
+    lon_r = np.radians(lon)
+    a = (
+        np.sin((lat_r[:, None] - lat_r[None, :]) / 2) ** 2
+        + np.cos(lat_r)[:, None]
+        * np.cos(lat_r)[None, :]
+        * np.sin((lon_r[:, None] - lon_r[None, :]) / 2) ** 2
+    )
+    distances = 2 * 6_371_000.0 * np.arcsin(np.sqrt(a))
+    close = np.where((distances > 0) & (distances <= 400), distances, np.inf).min(axis=1)
+    expected = np.ones(60)
+    mask = np.isfinite(close)
+    expected[mask] = 1.0 - np.exp(-1.5 * close[mask] / 1000.0)
+    assert np.allclose(deduped["brand_penalty"].to_numpy(), expected)
@@ -40,6 +40,17 @@ def test_circuit_breaker_transitions():
     breaker.before_call()  # closed again
 
 
+def test_circuit_breaker_success_resets_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=5.0, clock=lambda: 0.0)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.before_call()  # one failure since the reset keeps the breaker closed
+    breaker.record_failure()
+    with pytest.raises(CircuitBreakerOpenError):
+        breaker.before_call()
+
+
 def test_retry_with_backoff_retries_and_succeeds():
     attempts: list[int] = []
 
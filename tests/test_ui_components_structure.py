@@ -17,7 +17,7 @@ from Urban_Amenities2.ui.components.overlay_controls import (
     build_overlay_panel,
 )
 from Urban_Amenities2.ui.config import UISettings
-from Urban_Amenities2.ui.downloads import build_file_download, send_file
+from Urban_Amenities2.ui.downloads import MMAP_THRESHOLD_BYTES, build_file_download, send_file
 from Urban_Amenities2.ui.performance import PerformanceMonitor, profile_function, timer
 
 
@@ -46,6 +46,12 @@ def test_build_sidebar_links() -> None:
     assert first_link.children[1].children == PAGES[0]["label"]
 
 
+def test_static_components_reuse_cached_subtrees(ui_settings: UISettings) -> None:
+    assert build_header(ui_settings) is build_header(ui_settings)
+    assert build_sidebar() is build_sidebar()
+    assert build_footer() is build_footer()
+
+
 def test_build_overlay_panel_defaults() -> None:
     panel = build_overlay_panel()
     assert isinstance(panel, html.Div)
@@ -56,6 +62,7 @@ def test_build_overlay_panel_defaults() -> None:
     option_values = {option["value"] for option in OVERLAY_OPTIONS}
     assert option_values >= set(DEFAULT_OVERLAYS)
     assert all(isinstance(option["label"], str) for option in OVERLAY_OPTIONS)
+    assert build_overlay_panel() is panel
 
 
 def test_filter_and_parameter_panels() -> None:
@@ -71,6 +78,11 @@ def test_filter_and_parameter_panels() -> None:
     ]
     assert len(dropdowns) == 3
 
+    options = {"states": [{"label": "CO", "value": "CO"}], "metros": [], "counties": []}
+    cached_panel = build_filter_panel(options=options)
+    state_dropdown = cached_panel.children[0].children[1]
+    assert state_dropdown.options is options["states"]
+
     weights = {"aucs": 50.0, "ea": 50.0}
     parameter_panel = build_parameter_panel(weights)
     assert any(isinstance(child, html.Details) for child in parameter_panel.children)
@@ -98,6 +110,8 @@ def test_filter_and_parameter_panels() -> None:
                 slider_components.append(slider)
     assert slider_components
 
+    assert build_parameter_panel(dict(weights)) is parameter_panel
+
 
 def test_performance_timer_logs(monkeypatch: pytest.MonkeyPatch) -> None:
     events: list[tuple[str, dict[str, object]]] = []
@@ -161,6 +175,16 @@ def test_build_file_download_encodes_content(tmp_path: Path) -> None:
     assert decoded == b"hello world"
 
 
+def test_build_file_download_memory_maps_large_files(tmp_path: Path) -> None:
+    path = tmp_path / "export.csv"
+    content = b"hex_id,aucs\n" * ((MMAP_THRESHOLD_BYTES // 12) + 10)
+    path.write_bytes(content)
+
+    payload = build_file_download(path)
+    assert payload["filename"] == "export.csv"
+    assert base64.b64decode(payload["content"]) == content
+
+
 def test_send_file_delegates_to_dash(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     path = tmp_path / "data.csv"
     path.write_text("value", encoding="utf-8")
@@ -175,7 +199,7 @@ def test_send_file_delegates_to_dash(tmp_path: Path, monkeypatch: pytest.MonkeyP
         captured["type"] = type
         return {"content": "ok"}
 
-    monkeypatch.setattr("Urban_Amenities2.ui.downloads.dcc.send_file", _fake_send_file)
+    monkeypatch.setattr("Urban_Amenities2.ui.downloads._SEND_FILE", _fake_send_file)
 
     payload = send_file(path, filename="data.csv", content_type="text/csv")
     assert payload == {"content": "ok"}
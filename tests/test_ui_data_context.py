@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+from collections.abc import Iterable
 from pathlib import Path
+from types import SimpleNamespace
 
 import pandas as pd
 import pytest
 
-from tests.ui_factories import write_overlay_file, write_ui_dataset
+from tests.ui_factories import copy_ui_dataset, write_overlay_file
+from Urban_Amenities2.ui import data_loader
 from Urban_Amenities2.ui.config import UISettings
 from Urban_Amenities2.ui.data_loader import DataContext
 from Urban_Amenities2.ui.hexes import HexGeometryCache
@@ -27,7 +29,7 @@ def test_hex_geometry_cache_caches_entries() -> None:
     }
     cached_frame = cache.ensure_geometries(hex_ids)
     assert len(cached_frame) == len(hex_ids)
-    assert set(cache.store) == {"8928308280fffff"}
+    assert set(cache._index) == {"8928308280fffff"}
 
 
 def test_data_context_to_geojson_returns_feature_collection(
@@ -53,7 +55,8 @@ def test_data_context_to_geojson_returns_feature_collection(
     )
     frame = pd.DataFrame({"hex_id": ["8928308280fffff"], "aucs": [75.0]})
     monkeypatch.setattr(
-        "Urban_Amenities2.ui.data_loader.build_feature_collection",
+        data_loader,
+        "build_feature_collection",
         lambda *_args, **_kwargs: {
             "type": "FeatureCollection",
             "features": [
@@ -76,6 +79,52 @@ def test_data_context_to_geojson_returns_feature_collection(
     feature = payload["features"][0]
     assert feature["properties"]["aucs"] == 75.0
 
+    assert context.to_geojson(frame.iloc[0:0]) == {"type": "FeatureCollection", "features": []}
+
+
+def test_data_context_to_geojson_bytes_uses_cached_geometry() -> None:
+    context = DataContext(settings=UISettings())
+    polygon = {"type": "Polygon", "coordinates": [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]]}
+    context.geometries = pd.DataFrame(
+        {
+            "hex_id": ["8928308280fffff"],
+            "geometry": [json.dumps(polygon)],
+            "geometry_wkt": ["POLYGON((0 0,1 0,1 1,0 0))"],
+            "centroid_lon": [0.5],
+            "centroid_lat": [0.5],
+            "resolution": [9],
+        }
+    )
+    frame = pd.DataFrame({"hex_id": ["8928308280fffff"], "aucs": [75.0]})
+
+    payload = json.loads(context.to_geojson_bytes(frame))
+    feature = payload["features"][0]
+    assert feature["geometry"] == polygon
+    assert feature["properties"] == {"hex_id": "8928308280fffff", "aucs": 75.0}
+
+
+def test_data_context_to_geojson_properties_follow_frame_columns() -> None:
+    context = DataContext(settings=UISettings())
+    context.geometries = pd.DataFrame(
+        {
+            "hex_id": ["8928308280fffff"],
+            "geometry": [json.dumps({"type": "Polygon", "coordinates": []})],
+            "geometry_wkt": ["POLYGON((0 0,1 0,1 1,0 0))"],
+            "centroid_lon": [0.5],
+            "centroid_lat": [0.25],
+            "resolution": [9],
+        }
+    )
+    frame = pd.DataFrame({"hex_id": ["8928308280fffff"], "aucs": [75.0]})
+
+    bare = context.to_geojson(frame)["features"][0]["properties"]
+    assert list(bare) == ["hex_id", "aucs"]
+
+    attached = context.to_geojson(context.attach_geometries(frame))["features"][0]
+    assert {"centroid_lat", "centroid_lon"} <= set(attached["properties"])
+    assert "geometry" not in attached["properties"]
+    assert attached["properties"]["centroid_lat"] == 0.25
+
 
 def test_data_context_builds_typed_overlays(monkeypatch: pytest.MonkeyPatch) -> None:
     context = DataContext(settings=UISettings())
@@ -105,8 +154,8 @@ def test_data_context_builds_typed_overlays(monkeypatch: pytest.MonkeyPatch) ->
 
     class _DummyLoader:
         @staticmethod
-        def loads(_wkt: str) -> _DummyShape:
-            return _DummyShape()
+        def loads(wkts: Iterable[str]) -> list[_DummyShape]:
+            return [_DummyShape() for _ in wkts]
 
     def _dummy_union(_shapes: list[_DummyShape]) -> _DummyShape:
         return _DummyShape()
@@ -118,7 +167,8 @@ def test_data_context_builds_typed_overlays(monkeypatch: pytest.MonkeyPatch) ->
         }
 
     monkeypatch.setattr(
-        "Urban_Amenities2.ui.data_loader.import_module",
+        data_loader,
+        "import_module",
         lambda name: {
             "shapely.wkt": _DummyLoader,
             "shapely.ops": type("_Ops", (), {"unary_union": staticmethod(_dummy_union)}),
@@ -126,7 +176,12 @@ def test_data_context_builds_typed_overlays(monkeypatch: pytest.MonkeyPatch) ->
         }[name],
     )
 
-    context._build_overlays(force=True)
+    # The shapely lookup is cached per process; reset it around the stubbed import.
+    data_loader._import_shapely_modules.cache_clear()
+    try:
+        context._build_overlays(force=True)
+    finally:
+        data_loader._import_shapely_modules.cache_clear()
     payload = context.get_overlay("states")
     assert payload["type"] == "FeatureCollection"
     assert payload["features"]
@@ -134,6 +189,155 @@ def test_data_context_builds_typed_overlays(monkeypatch: pytest.MonkeyPatch) ->
     assert feature["properties"]["label"] == "CO"
 
 
+def test_data_context_parses_overlay_wkt_once_per_geometry_frame(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    context = DataContext(settings=UISettings())
+    context.scores = pd.DataFrame({"hex_id": ["a", "b"], "state": ["CO", "UT"]})
+    context.geometries = pd.DataFrame(
+        {
+            "hex_id": ["a", "b"],
+            "geometry_wkt": [
+                "POLYGON((0 0,1 0,1 1,0 1,0 0))",
+                "POLYGON((2 2,3 2,3 3,2 3,2 2))",
+            ],
+        }
+    )
+    context._aggregation_version = "test"
+    parsed: list[list[str]] = []
+
+    class _Shape:
+        is_empty = False
+
+        def simplify(self, *_args: object, **_kwargs: object) -> _Shape:
+            return self
+
+    class _Loader:
+        @staticmethod
+        def loads(wkts: Iterable[str]) -> list[_Shape]:
+            parsed.append(list(wkts))
+            return [_Shape() for _ in parsed[-1]]
+
+    monkeypatch.setattr(
+        data_loader,
+        "_import_shapely_modules",
+        lambda: (
+            _Loader,
+            lambda _shape: {"type": "Polygon", "coordinates": []},
+            lambda shapes: shapes[0],
+        ),
+    )
+
+    context._build_overlays(force=True)
+    context._build_overlays(force=True)
+    assert [len(batch) for batch in parsed] == [2]
+    assert {f["properties"]["label"] for f in context.get_overlay("states")["features"]} == {
+        "CO",
+        "UT",
+    }
+
+    assert context._boundary_cache == {}  # nothing on disk to key the dissolve by
+
+    context.geometries = context.geometries.assign(
+        geometry_wkt=["POLYGON((0 0,1 0,1 1,0 1,0 0))", "POLYGON((4 4,5 4,5 5,4 5,4 4))"]
+    )
+    context._build_overlays(force=True)
+    assert [len(batch) for batch in parsed] == [2, 2]
+
+
+def test_data_context_reuses_boundaries_for_unchanged_version_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    context = DataContext(settings=UISettings(data_path=tmp_path))
+    context.scores = pd.DataFrame({"hex_id": ["a"], "state": ["CO"]})
+    context.geometries = pd.DataFrame(
+        {"hex_id": ["a"], "geometry_wkt": ["POLYGON((0 0,1 0,1 1,0 1,0 0))"]}
+    )
+    scores_path = tmp_path / "20240101_scores.parquet"
+    scores_path.touch()
+    version = data_loader.DatasetVersion.from_path(scores_path, tmp_path)
+    unions: list[int] = []
+
+    class _Shape:
+        is_empty = False
+
+        def simplify(self, *_args: object, **_kwargs: object) -> _Shape:
+            return self
+
+    def _union(shapes: Iterable[_Shape]) -> _Shape:
+        unions.append(len(list(shapes)))
+        return _Shape()
+
+    monkeypatch.setattr(
+        data_loader,
+        "_import_shapely_modules",
+        lambda: (
+            SimpleNamespace(loads=lambda wkts: [_Shape() for _ in wkts]),
+            lambda _shape: {"type": "Polygon", "coordinates": []},
+            _union,
+        ),
+    )
+
+    context._build_overlays(force=True, version=version, reuse_boundaries=True)
+    context._build_overlays(force=True, version=version, reuse_boundaries=True)
+    assert len(unions) == 1
+
+    # A forced rebuild recomputes even when the files are unchanged.
+    context._build_overlays(force=True, version=version)
+    assert len(unions) == 2
+
+    # Rewriting a file changes the key.
+    (tmp_path / "20240101_metadata.parquet").touch()
+    context._build_overlays(force=True, version=version, reuse_boundaries=True)
+    assert len(unions) == 3
+
+
+def test_data_context_overlays_cached_per_zoom_tier(monkeypatch: pytest.MonkeyPatch) -> None:
+    context = DataContext(settings=UISettings())
+    context.scores = pd.DataFrame({"hex_id": ["a", "b"], "state": ["CO", "UT"]})
+    context.geometries = pd.DataFrame(
+        {
+            "hex_id": ["a", "b"],
+            "geometry_wkt": [
+                "POLYGON((0 0,1 0,1 1,0 1,0 0))",
+                "POLYGON((2 2,3 2,3 3,2 3,2 2))",
+            ],
+        }
+    )
+    context._aggregation_version = "test"
+    tolerances: list[float] = []
+
+    class _Shape:
+        is_empty = False
+
+        def simplify(self, tolerance: float, **_kwargs: object) -> _Shape:
+            tolerances.append(tolerance)
+            return self
+
+    monkeypatch.setattr(
+        data_loader,
+        "_import_shapely_modules",
+        lambda: (
+            SimpleNamespace(loads=lambda wkts: [_Shape() for _ in wkts]),
+            lambda _shape: {"type": "Polygon", "coordinates": []},
+            lambda shapes: shapes[0],
+        ),
+    )
+
+    context._build_overlays(force=True)
+    assert tolerances == [0.01, 0.01]
+    assert context.overlays_for_zoom(4) is context.overlays
+
+    close = context.overlays_for_zoom(12)
+    assert tolerances[2:] == [0.0001, 0.0001]
+    assert context.overlays_for_zoom(13) is close
+    assert len(context.get_overlay("states", zoom=12)["features"]) == 2
+    assert len(tolerances) == 4
+
+    context._build_overlays(force=True)
+    assert context._overlay_cache.keys() == {("test", 0)}
+
+
 def test_data_context_summary_returns_expected_columns() -> None:
     context = DataContext(settings=UISettings())
     context.scores = pd.DataFrame(
@@ -145,28 +349,34 @@ def test_data_context_summary_returns_expected_columns() -> None:
     summary = context.summarise(["aucs"])
     assert "aucs" in summary.index
     assert {"min", "max", "mean"}.issubset(summary.columns)
+    assert summary.loc["aucs", ["min", "max", "mean"]].tolist() == [10.0, 30.0, 20.0]
+
+
+def test_data_context_summary_matches_pandas_statistics() -> None:
+    context = DataContext(settings=UISettings(summary_percentiles=[5, 50, 95]))
+    context.scores = pd.DataFrame(
+        {
+            "hex_id": ["a", "b", "c", "d"],
+            "aucs": [10.0, 20.0, None, 40.0],
+            "EA": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    summary = context.summarise(["aucs", "EA", "missing"])
+    assert list(summary.index) == ["aucs", "EA"]
+    assert list(summary.columns) == ["min", "max", "mean", "p5", "p50", "p95"]
+    for column in ("aucs", "EA"):
+        series = context.scores[column]
+        assert summary.loc[column, "min"] == series.min()
+        assert summary.loc[column, "mean"] == pytest.approx(series.mean())
+        assert summary.loc[column, "p95"] == pytest.approx(series.quantile(0.95))
 
 
 def test_data_context_lists_versions_and_switches(
-    tmp_path: Path, sample_hex_ids: list[str]
+    tmp_path: Path, ui_dataset_template: Path
 ) -> None:
     data_path = tmp_path / "ui-data"
-    data_path.mkdir()
-    write_ui_dataset(
-        data_path,
-        "20240101",
-        sample_hex_ids,
-        ["CO", "NE", "CA"],
-        datetime(2024, 1, 1, 12, 0, 0),
-    )
-    write_ui_dataset(
-        data_path,
-        "20240201",
-        sample_hex_ids,
-        ["WA", "OR", "CA"],
-        datetime(2024, 2, 1, 12, 0, 0),
-        nested=True,
-    )
+    copy_ui_dataset(ui_dataset_template / "flat-20240101", data_path)
+    copy_ui_dataset(ui_dataset_template / "nested-20240201", data_path)
 
     settings = UISettings(data_path=data_path)
     context = DataContext.from_settings(settings)
@@ -184,18 +394,10 @@ def test_data_context_lists_versions_and_switches(
 
 
 def test_data_context_prefers_version_specific_overlays(
-    tmp_path: Path, sample_hex_ids: list[str]
+    tmp_path: Path, ui_dataset_template: Path
 ) -> None:
     data_path = tmp_path / "ui-data"
-    data_path.mkdir()
-    write_ui_dataset(
-        data_path,
-        "20240101",
-        sample_hex_ids,
-        ["CO", "NE", "CA"],
-        datetime(2024, 3, 1, 12, 0, 0),
-        nested=True,
-    )
+    copy_ui_dataset(ui_dataset_template / "nested-20240101", data_path)
 
     version_dir = data_path / "20240101"
     version_overlays = version_dir / "overlays"
@@ -210,3 +412,38 @@ def test_data_context_prefers_version_specific_overlays(
     parks = context.get_overlay("parks")
     assert parks["features"]
     assert parks["features"][0]["properties"]["label"] == "Version parks"
+
+    # Unchanged files are served from the parse cache; edits are picked up.
+    context.rebuild_overlays(force=True)
+    assert context.get_overlay("parks") is parks
+    write_overlay_file(version_overlays, "parks", "Updated version parks")
+    context.rebuild_overlays(force=True)
+    assert context.get_overlay("parks")["features"][0]["properties"]["label"] == (
+        "Updated version parks"
+    )
+
+
+def test_data_context_hex_index_is_dictionary_encoded(
+    tmp_path: Path, ui_dataset_template: Path
+) -> None:
+    data_path = copy_ui_dataset(ui_dataset_template / "flat-20240101", tmp_path / "ui-data")
+    context = DataContext.from_settings(UISettings(data_path=data_path))
+    assert isinstance(context.scores["hex_id"].dtype, pd.CategoricalDtype)
+
+    index = context.hex_index()
+    assert str(index.type.index_type) == "int32"
+    assert index.to_pylist() == context.scores["hex_id"].astype(str).tolist()
+
+
+def test_data_context_filter_options_cached_per_version(
+    tmp_path: Path, ui_dataset_template: Path
+) -> None:
+    data_path = copy_ui_dataset(ui_dataset_template / "flat-20240101", tmp_path / "ui-data")
+    context = DataContext.from_settings(UISettings(data_path=data_path))
+
+    options = context.filter_options()
+    assert [option["value"] for option in options["states"]] == ["CA", "CO", "NE"]
+    assert context.filter_options() is options
+
+    context.refresh(force=True)
+    assert context.filter_options() is not options
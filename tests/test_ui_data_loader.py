@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
-from tests.ui_factories import make_ui_settings, write_ui_dataset
+from tests.ui_factories import copy_ui_dataset, make_ui_settings
+from Urban_Amenities2.ui import data_loader
 from Urban_Amenities2.ui.data_loader import DataContext
 
 
@@ -25,8 +25,8 @@ def shapely_stub(monkeypatch: pytest.MonkeyPatch) -> None:
 
     class _DummyLoader:
         @staticmethod
-        def loads(_wkt: str) -> _DummyShape:
-            return _DummyShape()
+        def loads(wkts: Iterable[str]) -> list[_DummyShape]:
+            return [_DummyShape() for _ in wkts]
 
     def _dummy_mapping(_shape: _DummyShape) -> dict[str, object]:
         return {
@@ -41,7 +41,8 @@ def shapely_stub(monkeypatch: pytest.MonkeyPatch) -> None:
         return _DummyLoader, _dummy_mapping, _dummy_union
 
     monkeypatch.setattr(
-        "Urban_Amenities2.ui.data_loader._import_shapely_modules",
+        data_loader,
+        "_import_shapely_modules",
         _import_stub,
     )
 
@@ -49,44 +50,21 @@ def shapely_stub(monkeypatch: pytest.MonkeyPatch) -> None:
 @pytest.fixture
 def loaded_context(
     tmp_path: Path,
-    sample_hex_ids: list[str],
+    ui_dataset_template: Path,
     shapely_stub: None,
 ) -> DataContext:
-    data_dir = tmp_path / "ui-data"
-    data_dir.mkdir()
-    write_ui_dataset(
-        data_dir,
-        "20240201",
-        sample_hex_ids,
-        ["WA", "OR", "CA"],
-        datetime(2024, 2, 1, 12, 0, 0),
-        nested=True,
-    )
+    data_dir = copy_ui_dataset(ui_dataset_template / "nested-20240201", tmp_path / "ui-data")
     settings = make_ui_settings(data_dir)
     context = DataContext.from_settings(settings)
     return context
 
 
 def test_refresh_prefers_latest_score_dataset(
-    tmp_path: Path, sample_hex_ids: list[str], shapely_stub: None
+    tmp_path: Path, ui_dataset_template: Path, shapely_stub: None
 ) -> None:
     data_dir = tmp_path / "ui-data"
-    data_dir.mkdir()
-    write_ui_dataset(
-        data_dir,
-        "20240101",
-        sample_hex_ids,
-        ["CO", "NE", "CA"],
-        datetime(2024, 1, 1, 12, 0, 0),
-    )
-    write_ui_dataset(
-        data_dir,
-        "20240301",
-        sample_hex_ids,
-        ["NY", "NJ", "PA"],
-        datetime(2024, 3, 1, 12, 0, 0),
-        nested=True,
-    )
+    copy_ui_dataset(ui_dataset_template / "flat-20240101", data_dir)
+    copy_ui_dataset(ui_dataset_template / "nested-20240301", data_dir)
 
     settings = make_ui_settings(data_dir)
     context = DataContext.from_settings(settings)
@@ -111,18 +89,9 @@ def test_refresh_handles_missing_scores(tmp_path: Path, caplog: pytest.LogCaptur
 
 
 def test_refresh_falls_back_to_global_metadata(
-    tmp_path: Path, sample_hex_ids: list[str], shapely_stub: None
+    tmp_path: Path, sample_hex_ids: list[str], ui_dataset_template: Path, shapely_stub: None
 ) -> None:
-    data_dir = tmp_path / "ui-data"
-    data_dir.mkdir()
-    write_ui_dataset(
-        data_dir,
-        "20240101",
-        sample_hex_ids,
-        ["CO", "NE", "CA"],
-        datetime(2024, 1, 1, 12, 0, 0),
-        nested=True,
-    )
+    data_dir = copy_ui_dataset(ui_dataset_template / "nested-20240101", tmp_path / "ui-data")
     invalid_metadata = pd.DataFrame({"hex_id": sample_hex_ids})
     invalid_metadata.to_parquet(data_dir / "20240101" / "metadata.parquet")
 
@@ -153,23 +122,16 @@ def test_build_overlays_with_stubbed_shapely(loaded_context: DataContext) -> Non
 
 
 def test_build_overlays_without_shapely(
-    tmp_path: Path, sample_hex_ids: list[str], monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, ui_dataset_template: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    data_dir = tmp_path / "ui-data"
-    data_dir.mkdir()
-    write_ui_dataset(
-        data_dir,
-        "20240101",
-        sample_hex_ids,
-        ["CO", "NE", "CA"],
-        datetime(2024, 1, 1, 12, 0, 0),
-    )
+    data_dir = copy_ui_dataset(ui_dataset_template / "flat-20240101", tmp_path / "ui-data")
 
     def _missing_shapely() -> tuple[object, object, object]:
         raise ImportError("shapely not installed")
 
     monkeypatch.setattr(
-        "Urban_Amenities2.ui.data_loader._import_shapely_modules",
+        data_loader,
+        "_import_shapely_modules",
         _missing_shapely,
     )
 
@@ -226,3 +188,48 @@ def test_attach_geometries_adds_spatial_columns(loaded_context: DataContext) ->
     attached = loaded_context.attach_geometries(subset)
     assert {"centroid_lat", "centroid_lon"}.issubset(attached.columns)
     assert attached["hex_id"].tolist() == subset["hex_id"].tolist()
+
+
+def test_attach_geometries_matches_left_merge(loaded_context: DataContext) -> None:
+    frame = pd.DataFrame(
+        {"hex_id": [*loaded_context.scores["hex_id"].astype(str), "unknown"], "aucs": 1.0},
+        index=[10, 11, 12, 13],
+    )
+    geometries = loaded_context.geometries
+    columns = ["hex_id", "centroid_lat", "centroid_lon", "geometry_wkt", "resolution"]
+    expected = frame.merge(geometries[columns], on="hex_id", how="left")
+
+    attached = loaded_context.attach_geometries(frame)
+    pd.testing.assert_frame_equal(attached, expected)
+    assert loaded_context.attach_geometries(frame) is not attached
+
+
+def test_load_parquet_deduplicates_projected_columns(loaded_context: DataContext) -> None:
+    path = loaded_context.version.path
+    frame = loaded_context._load_parquet(path, columns=["hex_id", "aucs", "aucs"])
+    assert list(frame.columns) == ["hex_id", "aucs"]
+    assert isinstance(frame["hex_id"].dtype, pd.CategoricalDtype)
+
+
+def test_ids_in_viewport_matches_bounding_box_scan(loaded_context: DataContext) -> None:
+    geometries = loaded_context.geometries
+    lons = geometries["centroid_lon"]
+    lats = geometries["centroid_lat"]
+    bounds = (
+        float(lons.min()),
+        float(lats.min()),
+        float(lons.median()),
+        float(lats.max()),
+    )
+    mask = (
+        lons.between(bounds[0], bounds[2])
+        & lats.between(bounds[1], bounds[3])
+        & (geometries["resolution"] == loaded_context.base_resolution)
+    )
+    expected = geometries.loc[mask, "hex_id"].astype(str).tolist()
+
+    ids = loaded_context.ids_in_viewport(bounds, resolution=loaded_context.base_resolution)
+
+    assert ids == expected
+    assert ids
+    assert loaded_context.ids_in_viewport((0.0, 0.0, 1.0, 1.0)) == []
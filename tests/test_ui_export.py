@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-import tempfile
 from pathlib import Path
 
 import geopandas as gpd
@@ -26,72 +25,114 @@ def sample_data():
     return make_export_dataset()
 
 
-def test_export_csv(sample_data):
-    """Test CSV export."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "export.csv"
-        result = export_csv(sample_data, output_path, include_geometry=True)
+@pytest.fixture(scope="module")
+def export_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Share one output directory across the module's export tests."""
+    return tmp_path_factory.mktemp("export")
+
+
+@pytest.fixture
+def output_dir(export_dir: Path, request: pytest.FixtureRequest) -> Path:
+    """Per-test subdirectory of the shared export directory."""
+    path = export_dir / request.node.name
+    path.mkdir()
+    return path
 
-        assert result == output_path
-        assert output_path.exists()
 
-        loaded = pd.read_csv(output_path)
-        assert len(loaded) == len(sample_data)
-        assert "hex_id" in loaded.columns
-        assert "aucs" in loaded.columns
-        assert "lat" in loaded.columns
-        assert "lon" in loaded.columns
+def test_export_csv(sample_data, output_dir):
+    """Test CSV export."""
+    output_path = output_dir / "export.csv"
+    result = export_csv(sample_data, output_path, include_geometry=True)
+
+    assert result == output_path
+    assert output_path.exists()
+
+    loaded = pd.read_csv(output_path)
+    assert len(loaded) == len(sample_data)
+    assert "hex_id" in loaded.columns
+    assert "aucs" in loaded.columns
+    assert "lat" in loaded.columns
+    assert "lon" in loaded.columns
+
+
+def test_export_csv_matches_pandas_format(output_dir):
+    """CSV exports keep the pandas text format for strings, floats, bools and nulls."""
+    frame = pd.DataFrame(
+        {
+            "hex_id": ["8928308280fffff", "8928308280bffff"],
+            "aucs": [1.0, float("nan")],
+            "flag": [True, False],
+            "note": ["a, b", None],
+            "mixed": ["a", 1],
+        }
+    )
+    output_path = export_csv(frame, output_dir / "golden.csv")
+    assert output_path.read_text() == (
+        "hex_id,aucs,flag,note,mixed\n"
+        '8928308280fffff,1.0,True,"a, b",a\n'
+        "8928308280bffff,,False,,1\n"
+    )
 
 
-def test_export_geojson(sample_data):
+def test_export_geojson(sample_data, output_dir):
     """Test GeoJSON export."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "export.geojson"
-        result = export_geojson(sample_data, output_path)
+    output_path = output_dir / "export.geojson"
+    result = export_geojson(sample_data, output_path)
 
-        assert result == output_path
-        assert output_path.exists()
+    assert result == output_path
+    assert output_path.exists()
 
-        gdf = gpd.read_file(output_path)
-        assert len(gdf) == len(sample_data)
-        assert "hex_id" in gdf.columns
-        assert "aucs" in gdf.columns
-        assert gdf.crs == "EPSG:4326"
-        assert all(gdf.geometry.type == "Polygon")
+    gdf = gpd.read_file(output_path)
+    assert len(gdf) == len(sample_data)
+    assert "hex_id" in gdf.columns
+    assert "aucs" in gdf.columns
+    assert gdf.crs == "EPSG:4326"
+    assert all(gdf.geometry.type == "Polygon")
 
-        payload = json.loads(output_path.read_text())
-        assert payload["type"] == "FeatureCollection"
-        for feature in payload["features"]:
-            assert feature["type"] == "Feature"
-            assert "geometry" in feature
-            assert set(feature["properties"].keys()) >= {"hex_id", "aucs"}
+    payload = json.loads(output_path.read_text())
+    assert payload["type"] == "FeatureCollection"
+    for feature in payload["features"]:
+        assert feature["type"] == "Feature"
+        assert "geometry" in feature
+        assert set(feature["properties"].keys()) >= {"hex_id", "aucs"}
 
 
-def test_export_geojson_with_properties(sample_data):
+def test_export_geojson_with_properties(sample_data, output_dir):
     """Test GeoJSON export with selected properties."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "export.geojson"
-        export_geojson(sample_data, output_path, properties=["hex_id", "aucs", "ea"])
+    output_path = output_dir / "export.geojson"
+    export_geojson(sample_data, output_path, properties=["hex_id", "aucs", "ea"])
+
+    gdf = gpd.read_file(output_path)
+    assert set(gdf.columns) == {"hex_id", "aucs", "ea", "geometry"}
+
+    payload = json.loads(output_path.read_text())
+    for feature in payload["features"]:
+        assert set(feature["properties"].keys()) <= {"hex_id", "aucs", "ea"}
 
-        gdf = gpd.read_file(output_path)
-        assert set(gdf.columns) == {"hex_id", "aucs", "ea", "geometry"}
 
-        payload = json.loads(output_path.read_text())
-        for feature in payload["features"]:
-            assert set(feature["properties"].keys()) <= {"hex_id", "aucs", "ea"}
+def test_export_geojson_streams_valid_json(sample_data, output_dir):
+    """Streamed output stays valid JSON for missing values and empty frames."""
+    frame = sample_data.copy()
+    frame.loc[0, "ea"] = float("nan")
+    output_path = export_geojson(frame, output_dir / "nan.geojson")
+    payload = json.loads(output_path.read_text())
+    assert len(payload["features"]) == len(frame)
+    assert payload["features"][0]["properties"]["ea"] is None
 
+    empty_path = export_geojson(frame.iloc[0:0], output_dir / "empty.geojson")
+    assert json.loads(empty_path.read_text()) == {"type": "FeatureCollection", "features": []}
 
-def test_export_parquet(sample_data):
+
+def test_export_parquet(sample_data, output_dir):
     """Test Parquet export."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "export.parquet"
-        result = export_parquet(sample_data, output_path)
+    output_path = output_dir / "export.parquet"
+    result = export_parquet(sample_data, output_path)
 
-        assert result == output_path
-        assert output_path.exists()
+    assert result == output_path
+    assert output_path.exists()
 
-        loaded = pd.read_parquet(output_path)
-        pd.testing.assert_frame_equal(loaded, sample_data)
+    loaded = pd.read_parquet(output_path)
+    pd.testing.assert_frame_equal(loaded, sample_data)
 
 
 def test_create_shareable_url_basic():
@@ -154,3 +195,20 @@ def test_build_feature_collection(sample_data):
     first_feature = collection["features"][0]
     assert first_feature["geometry"]["type"] == "Polygon"
     assert set(first_feature["properties"].keys()) >= {"hex_id", "aucs"}
+
+
+def test_build_feature_collection_reuses_cached_geometry(sample_data):
+    geometry = {
+        "type": "Polygon",
+        "coordinates": [[[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]],
+    }
+    frame = sample_data[["hex_id", "aucs"]].copy()
+    frame["geometry"] = json.dumps(geometry)
+    frame.loc[frame.index[-1], "geometry"] = None
+
+    collection = build_feature_collection(frame, geometry_column="geometry")
+    first, last = collection["features"][0], collection["features"][-1]
+    assert first["geometry"] == geometry
+    assert "geometry" not in first["properties"]
+    assert last["geometry"]["type"] == "Polygon"
+    assert last["geometry"] != geometry
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import gc
+
 import pandas as pd
 import pytest
 
 from tests.ui_factories import make_filter_dataset
+from Urban_Amenities2.ui import filters
 from Urban_Amenities2.ui.filters import FilterConfig, apply_filters, get_filter_options
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_data():
-    """Create sample hex data for testing."""
+    """Create sample hex data for testing; shared because ``apply_filters`` never mutates it."""
     return make_filter_dataset()
 
 
@@ -82,7 +85,8 @@ def test_empty_filter_returns_all(sample_data):
     config = FilterConfig()
     filtered = apply_filters(sample_data, config)
     assert len(filtered) == len(sample_data)
-    pd.testing.assert_frame_equal(filtered, sample_data)
+    assert filtered is sample_data
+    assert apply_filters(sample_data, FilterConfig(score_min=0.0)) is sample_data
 
 
 def test_filter_resulting_in_no_data(sample_data):
@@ -90,3 +94,47 @@ def test_filter_resulting_in_no_data(sample_data):
     config = FilterConfig(score_min=100.0)
     filtered = apply_filters(sample_data, config)
     assert len(filtered) == 0
+
+
+def test_get_filter_options_ignores_unused_categories(sample_data):
+    """Only categories present in the frame are offered."""
+    subset = apply_filters(sample_data, FilterConfig(state=["CO"]))
+    options = get_filter_options(subset)
+
+    assert options["states"] == ["CO"]
+    assert options["land_uses"] == ["suburban", "urban"]
+    assert options["score_range"] == (45.0, 75.0)
+
+
+def test_get_filter_options_drops_missing_values_for_any_dtype():
+    """Object and categorical columns offer the same values when NaN is present."""
+    frame = pd.DataFrame({"state": ["CO", None, "UT", float("nan")]})
+    categorical = frame.astype({"state": "category"})
+    assert get_filter_options(frame)["states"] == ["CO", "UT"]
+    assert get_filter_options(categorical)["states"] == ["CO", "UT"]
+
+
+def test_get_filter_options_cached_per_frame(monkeypatch):
+    """Repeat calls on one frame reuse the scan; collected frames leave the cache."""
+    frame = make_filter_dataset()
+    calls = []
+    build = filters._build_filter_options
+
+    def counting_build(df):
+        calls.append(id(df))
+        return build(df)
+
+    monkeypatch.setattr(filters, "_build_filter_options", counting_build)
+
+    first = get_filter_options(frame)
+    first["states"].append("XX")
+    assert get_filter_options(frame)["states"] == ["CO", "ID", "UT"]
+    assert len(calls) == 1
+
+    get_filter_options(frame.iloc[:2])
+    assert len(calls) == 2
+
+    key = id(frame)
+    del frame
+    gc.collect()
+    assert key not in filters._OPTIONS_CACHE
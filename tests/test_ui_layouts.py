@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from importlib import import_module, reload
+from importlib import import_module
 from pathlib import Path
+from types import ModuleType
 
 import dash
 import pandas as pd
@@ -15,41 +16,71 @@ from Urban_Amenities2.ui import callbacks as callbacks_module
 from Urban_Amenities2.ui.config import UISettings
 from Urban_Amenities2.ui.data_loader import DataContext, DatasetVersion
 
+# Read-only scores for the callback stub context; its helpers hand out copies.
+_STUB_SCORES = pd.DataFrame(
+    {
+        "hex_id": ["hex1", "hex2"],
+        "aucs": [75.0, 55.0],
+        "EA": [80.0, 60.0],
+        "state": ["CO", "CO"],
+        "metro": ["Denver", "Denver"],
+        "county": ["Denver", "Jefferson"],
+    }
+).astype({"state": "category", "metro": "category", "county": "category"})
 
-@pytest.fixture
+
+def _inject(monkeypatch: pytest.MonkeyPatch, module: ModuleType, **attrs: object) -> None:
+    """Patch the module-level context globals a layout reads."""
+
+    for name, value in attrs.items():
+        monkeypatch.setattr(module, name, value)
+
+
+@pytest.fixture(scope="session")
 def layouts_module():
-    module = import_module("Urban_Amenities2.ui.layouts")
-    return module
+    return import_module("Urban_Amenities2.ui.layouts")
 
 
-@pytest.fixture
-def dash_app(ui_settings, layouts_module, data_context, monkeypatch):
+@pytest.fixture(scope="session")
+def _dash_app_singleton():
     # Ensure Dash is initialised before pages register themselves
-    app = Dash(__name__, use_pages=True, pages_folder="")
-    reload(layouts_module)
-    app.title = ui_settings.title
-    monkeypatch.setattr(layouts_module, "DATA_CONTEXT", data_context)
-    monkeypatch.setattr(layouts_module, "SETTINGS", ui_settings)
-    layouts_module.register_layouts(app, ui_settings)
-    return app, layouts_module
+    return Dash(__name__, use_pages=True, pages_folder="")
+
+
+@pytest.fixture(scope="session")
+def page_modules(_dash_app_singleton):
+    # Page modules call register_page on import, so resolve them once an app exists.
+    return {
+        name: import_module(f"Urban_Amenities2.ui.layouts.{name}")
+        for name in ("home", "data_management", "map_view", "settings")
+    }
 
 
 @pytest.fixture
-def data_context(ui_settings: UISettings, tmp_path: Path) -> DataContext:
+def dash_app(_dash_app_singleton, ui_settings, layouts_module, data_context, monkeypatch):
+    # Reuse the session app; register_layouts replaces the layout, callbacks are reset here.
+    app = _dash_app_singleton
+    app.callback_map.clear()
+    app._callback_list.clear()
+    original_registry = dash.page_registry.copy()
+    dash.page_registry.clear()
+    app.title = ui_settings.title
+    _inject(monkeypatch, layouts_module, DATA_CONTEXT=data_context, SETTINGS=ui_settings)
+    try:
+        layouts_module.register_layouts(app, ui_settings)
+        yield app, layouts_module
+    finally:
+        dash.page_registry.clear()
+        dash.page_registry.update(original_registry)
+
+
+@pytest.fixture(scope="module")
+def data_context(tmp_path_factory: pytest.TempPathFactory) -> DataContext:
+    # Built once per module: layouts only read the context, and each test patches it
+    # into the layout modules through monkeypatch. DataContext reads just these settings.
     settings = UISettings(
-        host=ui_settings.host,
-        port=ui_settings.port,
-        debug=ui_settings.debug,
-        secret_key=ui_settings.secret_key,
-        mapbox_token=ui_settings.mapbox_token,
-        cors_origins=ui_settings.cors_origins,
-        enable_cors=ui_settings.enable_cors,
-        data_path=tmp_path,
-        log_level=ui_settings.log_level,
-        title=ui_settings.title,
-        reload_interval_seconds=ui_settings.reload_interval_seconds,
-        hex_resolutions=ui_settings.hex_resolutions,
-        summary_percentiles=ui_settings.summary_percentiles,
+        data_path=tmp_path_factory.mktemp("data_ctx"),
+        summary_percentiles=[5, 50, 95],
     )
     context = DataContext(settings=settings)
     scores = pd.DataFrame(
@@ -67,7 +98,7 @@ def data_context(ui_settings: UISettings, tmp_path: Path) -> DataContext:
             "metro": ["Denver", "Salt Lake City"],
             "county": ["Denver", "Salt Lake"],
         }
-    )
+    ).astype({"state": "category", "metro": "category", "county": "category"})
     context.scores = scores
     context.metadata = scores[["hex_id", "state", "metro", "county"]].copy()
     context.geometries = pd.DataFrame(
@@ -97,10 +128,10 @@ def test_register_layouts_configures_app(dash_app, ui_settings) -> None:
     assert app.title == ui_settings.title
 
 
-def test_home_layout_uses_context(dash_app, data_context, monkeypatch) -> None:
+def test_home_layout_uses_context(dash_app, page_modules, data_context, monkeypatch) -> None:
     _, layouts_module = dash_app
-    home = import_module("Urban_Amenities2.ui.layouts.home")
-    monkeypatch.setattr(home, "DATA_CONTEXT", data_context)
+    home = page_modules["home"]
+    _inject(monkeypatch, home, DATA_CONTEXT=data_context)
     layout = home.layout()
     assert isinstance(layout, html.Div)
     scoreboard = layout.children[2]
@@ -111,20 +142,20 @@ def test_home_layout_uses_context(dash_app, data_context, monkeypatch) -> None:
 
 
 def test_data_management_layout_shows_version(
-    dash_app, data_context, ui_settings, monkeypatch
+    dash_app, page_modules, data_context, ui_settings, monkeypatch
 ) -> None:
-    data_management = import_module("Urban_Amenities2.ui.layouts.data_management")
-    monkeypatch.setattr(data_management, "DATA_CONTEXT", data_context)
-    monkeypatch.setattr(data_management, "SETTINGS", ui_settings)
+    data_management = page_modules["data_management"]
+    _inject(monkeypatch, data_management, DATA_CONTEXT=data_context, SETTINGS=ui_settings)
     layout = data_management.layout()
     assert "Data Management" in layout.children[0].children
     assert data_context.version and data_context.version.identifier in layout.children[1].children
 
 
-def test_map_view_layout_has_controls(dash_app, data_context, ui_settings, monkeypatch) -> None:
-    map_view = import_module("Urban_Amenities2.ui.layouts.map_view")
-    monkeypatch.setattr(map_view, "DATA_CONTEXT", data_context)
-    monkeypatch.setattr(map_view, "SETTINGS", ui_settings)
+def test_map_view_layout_has_controls(
+    dash_app, page_modules, data_context, ui_settings, monkeypatch
+) -> None:
+    map_view = page_modules["map_view"]
+    _inject(monkeypatch, map_view, DATA_CONTEXT=data_context, SETTINGS=ui_settings)
     layout = map_view.layout()
     assert isinstance(layout, html.Div)
     controls = layout.children[0]
@@ -134,9 +165,11 @@ def test_map_view_layout_has_controls(dash_app, data_context, ui_settings, monke
     assert isinstance(loading_container.children, dcc.Graph)
 
 
-def test_settings_layout_lists_configuration(dash_app, ui_settings, monkeypatch) -> None:
-    settings = import_module("Urban_Amenities2.ui.layouts.settings")
-    monkeypatch.setattr(settings, "SETTINGS", ui_settings)
+def test_settings_layout_lists_configuration(
+    dash_app, page_modules, ui_settings, monkeypatch
+) -> None:
+    settings = page_modules["settings"]
+    _inject(monkeypatch, settings, SETTINGS=ui_settings)
     layout = settings.layout()
     assert "Settings" in layout.children[0].children
     items = layout.children[1].children
@@ -145,7 +178,6 @@ def test_settings_layout_lists_configuration(dash_app, ui_settings, monkeypatch)
 
 def test_register_layouts_initialises_callbacks(monkeypatch, ui_settings) -> None:
     layouts_module = import_module("Urban_Amenities2.ui.layouts")
-    reload(layouts_module)
     app = Dash(__name__, use_pages=True, pages_folder="")
 
     original_registry = dash.page_registry.copy()
@@ -227,9 +259,12 @@ def test_update_map_callback_builds_overlay_payload(monkeypatch, ui_settings) ->
             self.layers = ["layer"]
             self.traces = ["trace"]
 
-    def _fake_overlay(selected, context, *, opacity: float) -> _DummyPayload:
+    def _fake_overlay(
+        selected, context, *, opacity: float, zoom: float | None = None
+    ) -> _DummyPayload:
         overlay_calls["selected"] = list(selected)
         overlay_calls["opacity"] = opacity
+        overlay_calls["zoom"] = zoom
         overlay_calls["context"] = context
         return _DummyPayload()
 
@@ -254,16 +289,8 @@ def test_update_map_callback_builds_overlay_payload(monkeypatch, ui_settings) ->
         def __init__(self) -> None:
             self.base_resolution = 9
             self.bounds = (-105.0, 39.0, -104.0, 40.0)
-            self.scores = pd.DataFrame(
-                {
-                    "hex_id": ["hex1", "hex2"],
-                    "aucs": [75.0, 55.0],
-                    "EA": [80.0, 60.0],
-                    "state": ["CO", "CO"],
-                    "metro": ["Denver", "Denver"],
-                    "county": ["Denver", "Jefferson"],
-                }
-            )
+            self.scores = _STUB_SCORES
+            self._first_row = _STUB_SCORES.iloc[:1]
             self.filters: list[tuple[object, ...]] = []
             self.viewport: list[tuple[int, tuple[float, float, float, float] | None]] = []
 
@@ -276,7 +303,7 @@ def test_update_map_callback_builds_overlay_payload(monkeypatch, ui_settings) ->
             score_range: tuple[float, float] | None,
         ) -> pd.DataFrame:
             self.filters.append((state, metro, county, score_range))
-            return self.scores.iloc[[0]].copy()
+            return self._first_row.copy(deep=False)
 
         def frame_for_resolution(self, resolution: int, columns: list[str]) -> pd.DataFrame:
             frame = self.scores[columns + ["hex_id"]].copy()
@@ -290,7 +317,7 @@ def test_update_map_callback_builds_overlay_payload(monkeypatch, ui_settings) ->
             bounds: tuple[float, float, float, float] | None,
         ) -> pd.DataFrame:
             self.viewport.append((resolution, bounds))
-            return frame.iloc[[0]].copy()
+            return frame.iloc[:1].copy(deep=False)
 
         def attach_geometries(self, frame: pd.DataFrame) -> pd.DataFrame:
             frame = frame.copy()
@@ -301,7 +328,7 @@ def test_update_map_callback_builds_overlay_payload(monkeypatch, ui_settings) ->
         def to_geojson(self, frame: pd.DataFrame) -> dict[str, object]:
             return {"type": "FeatureCollection", "features": []}
 
-        def get_overlay(self, _key: str) -> dict[str, object]:
+        def get_overlay(self, _key: str, _zoom: float | None = None) -> dict[str, object]:
             return {"type": "FeatureCollection", "features": []}
 
     stub_context = _StubContext()
@@ -333,6 +360,7 @@ def test_update_map_callback_builds_overlay_payload(monkeypatch, ui_settings) ->
     assert description == callbacks_module.SUBSCORE_DESCRIPTIONS["EA"]
     assert set(overlay_calls["selected"]) == {"states", "city_labels"}
     assert overlay_calls["opacity"] == 0.6
+    assert overlay_calls["zoom"] == 9
     assert choropleth_calls["hover_columns"] == [
         "EA",
         "aucs",
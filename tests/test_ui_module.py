@@ -12,36 +12,27 @@ from Urban_Amenities2.ui.data_loader import DataContext
 from Urban_Amenities2.ui.hexes import HexGeometryCache, hex_centroid, hex_to_geojson
 from Urban_Amenities2.ui.layers import build_overlay_payload
 
+# Every test here needs real H3 cells, so skip the module once at collection time.
+h3 = pytest.importorskip("h3")
 
-@pytest.fixture()
+
+@pytest.fixture(scope="module")
 def sample_hexes() -> list[str]:
-    h3 = pytest.importorskip("h3")
     return [
         h3.latlng_to_cell(39.7392, -104.9903, 9),
         h3.latlng_to_cell(40.7608, -111.8910, 9),
     ]
 
 
-def test_geometry_cache(sample_hexes: list[str]) -> None:
-    cache = HexGeometryCache()
-    df = cache.ensure_geometries(sample_hexes)
-    assert set(df["hex_id"]) == set(sample_hexes)
-    for hex_id in sample_hexes:
-        centroid = hex_centroid(hex_id)
-        assert len(centroid) == 2
-        geojson = hex_to_geojson(hex_id)
-        assert geojson["type"] == "Polygon"
-    cache.validate(sample_hexes)
-
+def _prepared_context(hex_ids: list[str], aucs: list[float], ea: list[float]) -> DataContext:
+    """Build a fresh context per test; H3 records are still memoised process-wide."""
 
-def test_data_context_aggregation(tmp_path: Path, sample_hexes: list[str]) -> None:
-    settings = UISettings()
-    context = DataContext(settings=settings)
+    context = DataContext(settings=UISettings())
     scores = pd.DataFrame(
         {
-            "hex_id": sample_hexes,
-            "aucs": [80.0, 60.0],
-            "EA": [75.0, 55.0],
+            "hex_id": hex_ids,
+            "aucs": aucs,
+            "EA": ea,
             "state": ["CO", "UT"],
             "metro": ["Denver", "Salt Lake City"],
             "county": ["Denver County", "Salt Lake County"],
@@ -52,6 +43,24 @@ def test_data_context_aggregation(tmp_path: Path, sample_hexes: list[str]) -> No
     context._prepare_geometries()
     context.validate_geometries()
     context._record_base_resolution()
+    return context
+
+
+def test_geometry_cache(sample_hexes: list[str]) -> None:
+    cache = HexGeometryCache()
+    df = cache.ensure_geometries(sample_hexes)
+    assert set(df["hex_id"]) == set(sample_hexes)
+    for hex_id in sample_hexes:
+        centroid = hex_centroid(hex_id)
+        assert len(centroid) == 2
+        geojson = hex_to_geojson(hex_id)
+        assert geojson["type"] == "Polygon"
+    cache.validate(sample_hexes)
+
+
+def test_data_context_aggregation(tmp_path: Path, sample_hexes: list[str]) -> None:
+    context = _prepared_context(sample_hexes, aucs=[80.0, 60.0], ea=[75.0, 55.0])
+    scores = context.scores
     aggregated = context.aggregate_by_resolution(8, columns=["aucs", "EA"])
     assert {"hex_id", "aucs", "EA", "count"} <= set(aggregated.columns)
     geojson = context.to_geojson(scores)
@@ -64,23 +73,7 @@ def test_data_context_aggregation(tmp_path: Path, sample_hexes: list[str]) -> No
 
 
 def test_viewport_selection(sample_hexes: list[str]) -> None:
-    settings = UISettings()
-    context = DataContext(settings=settings)
-    scores = pd.DataFrame(
-        {
-            "hex_id": sample_hexes,
-            "aucs": [82.0, 61.0],
-            "EA": [70.0, 58.0],
-            "state": ["CO", "UT"],
-            "metro": ["Denver", "Salt Lake City"],
-            "county": ["Denver County", "Salt Lake County"],
-        }
-    )
-    context.scores = scores
-    context.metadata = scores[["hex_id", "state", "metro", "county"]]
-    context._prepare_geometries()
-    context.validate_geometries()
-    context._record_base_resolution()
+    context = _prepared_context(sample_hexes, aucs=[82.0, 61.0], ea=[70.0, 58.0])
     assert context.bounds is not None
     geometries = context.geometries.set_index("hex_id")
     lon = float(geometries.loc[sample_hexes[0], "centroid_lon"])
@@ -101,23 +94,8 @@ def test_viewport_selection(sample_hexes: list[str]) -> None:
 
 def test_overlay_payload_and_choropleth(sample_hexes: list[str]) -> None:
     pytest.importorskip("shapely")
-    settings = UISettings()
-    context = DataContext(settings=settings)
-    scores = pd.DataFrame(
-        {
-            "hex_id": sample_hexes,
-            "aucs": [82.0, 61.0],
-            "EA": [70.0, 58.0],
-            "state": ["CO", "UT"],
-            "metro": ["Denver", "Salt Lake City"],
-            "county": ["Denver County", "Salt Lake County"],
-        }
-    )
-    context.scores = scores
-    context.metadata = scores[["hex_id", "state", "metro", "county"]]
-    context._prepare_geometries()
-    context.validate_geometries()
-    context._record_base_resolution()
+    context = _prepared_context(sample_hexes, aucs=[82.0, 61.0], ea=[70.0, 58.0])
+    scores = context.scores
     context.rebuild_overlays(force=True)
     context.overlays["transit_stops"] = {
         "type": "FeatureCollection",
@@ -51,3 +51,33 @@ def test_parameter_adjuster_reset(default_params: AUCSParams) -> None:
     adjuster.update_parameter("alpha_walk", 0.2)
     adjuster.reset()
     assert adjuster.modified_params == adjuster.original_params
+
+
+def test_parameter_adjuster_diff_lists_changed_keys_in_order(default_params: AUCSParams) -> None:
+    adjuster = ParameterAdjuster(default_params)
+    adjuster.update_parameter("alpha_walk", 0.2)
+    adjuster.update_parameter("weight_ea", adjuster.original_params["weight_ea"] + 1.0)
+    adjuster.update_parameter("weight_lca", adjuster.original_params["weight_lca"])
+    assert adjuster.get_diff().changed_keys == ["weight_ea", "alpha_walk"]
+
+    adjuster.modified_params = adjuster.original_params
+    assert not adjuster.get_diff().has_changes()
+
+
+def test_parameter_adjuster_views_write_through_or_raise(default_params: AUCSParams) -> None:
+    adjuster = ParameterAdjuster(default_params)
+    adjuster.modified_params["weight_ea"] = 0.0
+    assert adjuster.to_dict()["weight_ea"] == 0.0
+    assert adjuster.get_diff().changed_keys == ["weight_ea"]
+
+    with pytest.raises(KeyError):
+        adjuster.modified_params["unknown"] = 1.0
+    with pytest.raises(TypeError):
+        del adjuster.modified_params["weight_ea"]
+    with pytest.raises(TypeError):
+        adjuster.original_params["weight_ea"] = 0.0  # type: ignore[index]
+
+    # Exported dicts are snapshots and do not write back.
+    exported = adjuster.to_dict()
+    exported["weight_lca"] = 0.0
+    assert adjuster.modified_params["weight_lca"] != 0.0
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -9,6 +11,7 @@ from typer.testing import CliRunner
 
 from Urban_Amenities2.cli.main import app
 from Urban_Amenities2.config.loader import load_params
+from Urban_Amenities2.versioning import manifest as manifest_module
 from Urban_Amenities2.versioning.data_snapshot import (
     DataSnapshot,
     list_snapshots,
@@ -63,6 +66,64 @@ def test_snapshot_registration(tmp_path: Path) -> None:
     assert snapshots[0].source_name == "Overture"
 
 
+def test_snapshot_registration_from_threads_keeps_whole_lines(tmp_path: Path) -> None:
+    storage = tmp_path / "snapshots.jsonl"
+    snapshots = [
+        DataSnapshot(
+            source_name=f"source-{index}",
+            version="2024-02-01",
+            download_date=pd.Timestamp("2024-02-15"),
+            file_hash="f" * 4096,
+        )
+        for index in range(32)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda snapshot: register_snapshot(snapshot, storage), snapshots))
+    registered = list_snapshots(storage)
+    assert sorted(item.source_name for item in registered) == sorted(
+        item.source_name for item in snapshots
+    )
+
+
+def test_manifest_lookup_scans_when_index_cannot_be_written(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage = tmp_path / "runs.jsonl"
+    manifest = create_run_manifest("hash", [], git_commit=None, storage=storage)
+    storage.with_suffix(".index").unlink()
+
+    def read_only(_storage: Path) -> None:
+        raise PermissionError("read-only file system")
+
+    monkeypatch.setattr(manifest_module, "_rebuild_index", read_only)
+    assert get_manifest(manifest.run_id, storage) == manifest
+    assert not storage.with_suffix(".index").exists()
+
+
+def test_snapshot_registration_finishes_short_writes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage = tmp_path / "snapshots.jsonl"
+    snapshot = DataSnapshot(
+        source_name="Overture",
+        version="2024-02-01",
+        download_date=pd.Timestamp("2024-02-15"),
+        file_hash="f" * 4096,
+    )
+    write = os.write
+    chunks: list[int] = []
+
+    def short_write(fd: int, data: bytes | memoryview) -> int:
+        chunks.append(write(fd, data[:512]))
+        return chunks[-1]
+
+    monkeypatch.setattr(os, "write", short_write)
+    register_snapshot(snapshot, storage)
+    monkeypatch.undo()
+    assert len(chunks) > 1
+    assert list_snapshots(storage) == [snapshot]
+
+
 def test_run_manifest_append_and_lookup(tmp_path: Path) -> None:
     storage = tmp_path / "runs.jsonl"
     manifest = RunManifest(
@@ -83,3 +144,60 @@ def test_run_manifest_append_and_lookup(tmp_path: Path) -> None:
 def test_list_manifests_missing_file(tmp_path: Path) -> None:
     storage = tmp_path / "absent.jsonl"
     assert list_manifests(storage) == []
+    assert get_manifest("run-1", storage) is None
+
+
+def test_get_manifest_scans_appended_runs(tmp_path: Path) -> None:
+    storage = tmp_path / "runs.jsonl"
+    for run_id in ("run-1", "run-10", "run-2"):
+        append_manifest(
+            RunManifest(
+                run_id=run_id,
+                timestamp=datetime.now(UTC),
+                param_hash=run_id,
+                data_snapshot_ids=[],
+                git_commit=None,
+            ),
+            storage,
+        )
+    assert [manifest.run_id for manifest in list_manifests(storage)] == [
+        "run-1",
+        "run-10",
+        "run-2",
+    ]
+    fetched = get_manifest("run-1", storage)
+    assert fetched is not None
+    assert fetched.param_hash == "run-1"
+    assert get_manifest("run-3", storage) is None
+
+
+def test_get_manifest_uses_and_rebuilds_sidecar_index(tmp_path: Path) -> None:
+    storage = tmp_path / "runs.jsonl"
+    for run_id in ("run-1", "run-2"):
+        append_manifest(
+            RunManifest(
+                run_id=run_id,
+                timestamp=datetime.now(UTC),
+                param_hash=run_id,
+                data_snapshot_ids=[],
+                git_commit=None,
+            ),
+            storage,
+        )
+    index = storage.with_suffix(".index")
+    assert [line.split("\t")[0] for line in index.read_text().splitlines()] == [
+        "run-1",
+        "run-2",
+    ]
+
+    index.unlink()
+    fetched = get_manifest("run-2", storage)
+    assert fetched is not None
+    assert fetched.param_hash == "run-2"
+    assert index.exists()
+
+    # A stale index entry falls back to scanning the log.
+    index.write_text("run-1\t0\t5\n")
+    fetched = get_manifest("run-1", storage)
+    assert fetched is not None
+    assert fetched.param_hash == "run-1"
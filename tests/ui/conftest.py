@@ -72,6 +72,7 @@ def fake_h3(monkeypatch: pytest.MonkeyPatch) -> FakeH3:
     """Provide a shared fake H3 module for UI tests."""
 
     stub = FakeH3()
+    hexes._hex_record.cache_clear()
 
     monkeypatch.setattr(hexes, "_load_h3", lambda: stub)
     monkeypatch.setattr(hex_selection, "_import_h3", lambda: stub)
@@ -80,9 +81,7 @@ def fake_h3(monkeypatch: pytest.MonkeyPatch) -> FakeH3:
 
     yield stub
 
-    hexes._hex_boundary_geojson.cache_clear()
-    hexes._hex_boundary_wkt.cache_clear()
-    hexes._hex_centroid.cache_clear()
+    hexes._hex_record.cache_clear()
 
 
 @pytest.fixture
@@ -112,10 +111,13 @@ def fake_shapely(monkeypatch: pytest.MonkeyPatch) -> None:
             return FakeShape([])
         return FakeShape(list(shapes[0].coordinates))
 
+    def _loads(payload: Iterable[str]) -> list[FakeShape]:
+        return [_parse_wkt(item) for item in payload]
+
     monkeypatch.setattr(
         data_loader,
         "_import_shapely_modules",
-        lambda: (SimpleNamespace(loads=_parse_wkt), _mapping, _unary_union),
+        lambda: (SimpleNamespace(loads=_loads), _mapping, _unary_union),
     )
 
 
@@ -141,4 +143,6 @@ def sample_scores() -> pd.DataFrame:
             {"bike": 0.3},
         ],
     }
-    return pd.DataFrame(data)
+    return pd.DataFrame(data).astype(
+        {"state": "category", "metro": "category", "county": "category"}
+    )
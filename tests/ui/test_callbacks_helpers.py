@@ -181,6 +181,9 @@ def test_resolution_for_zoom_thresholds() -> None:
     assert _resolution_for_zoom(7.2) == 7
     assert _resolution_for_zoom(10.5) == 8
     assert _resolution_for_zoom(12.0) == 9
+    # Thresholds are inclusive upper bounds.
+    edges = (5, 5.01, 8, 8.01, 11, 11.01)
+    assert [_resolution_for_zoom(zoom) for zoom in edges] == [6, 7, 7, 8, 8, 9]
 
 
 def test_extract_viewport_bounds_from_coordinates() -> None:
@@ -222,7 +225,7 @@ def test_register_callbacks_updates_map_and_handles_filters(monkeypatch: pytest.
     overlay_payload = OverlayPayload(layers=[{"type": "fill", "id": "states"}], traces=["trace"])
     overlay_calls: list[tuple[list[str], float]] = []
 
-    def fake_overlay(selection, data_context, *, opacity=0.35):
+    def fake_overlay(selection, data_context, *, opacity=0.35, zoom=None):
         assert data_context is context
         overlay_calls.append((list(selection), opacity))
         return overlay_payload
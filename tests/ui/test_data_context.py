@@ -192,6 +192,19 @@ def test_data_context_viewport_and_exports(
     assert repeat.equals(coarse)
     assert repeat is not coarse  # cached copy returned
 
+    # A different column set re-aggregates but reuses the parent mapping.
+    parent_lookups = len(fake_h3.parent_requests)
+    coarse_ea = context.frame_for_resolution(7, columns=["EA"])
+    assert coarse_ea["hex_id"].tolist() == coarse["hex_id"].tolist()
+    assert len(fake_h3.parent_requests) == parent_lookups
+    scores = context.scores.assign(
+        parent=[fake_h3.cell_to_parent(str(hex_id), 7) for hex_id in context.scores["hex_id"]]
+    )
+    expected = scores.groupby("parent")["EA"].agg(["mean", "count"])
+    assert coarse_ea["EA"].tolist() == expected["mean"].tolist()
+    assert coarse_ea["count"].tolist() == expected["count"].tolist()
+    assert coarse_ea["hex_id"].tolist() == expected.index.tolist()
+
     first = context.geometries.iloc[0]
     delta = 0.0001
     bounds = (
@@ -213,6 +226,10 @@ def test_data_context_viewport_and_exports(
 
     index = context.get_hex_index(7)
     assert index
+    parent_lookups = len(fake_h3.parent_requests)
+    next(iter(index.values())).clear()
+    assert context.get_hex_index(7) != index  # callers get their own lists
+    assert len(fake_h3.parent_requests) == parent_lookups
 
     subset = context.load_subset(["hex_id", "aucs", "aucs"])
     assert list(subset.columns) == ["hex_id", "aucs"]
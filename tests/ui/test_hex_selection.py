@@ -49,6 +49,19 @@ def test_hex_selector_get_details_and_neighbors(sample_scores: pd.DataFrame, fak
     assert neighbors.equals(sample_scores[sample_scores["hex_id"] == "abc123"]) is True
 
 
+def test_hex_selector_neighbors_keep_frame_order(
+    sample_scores: pd.DataFrame, fake_h3, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(fake_h3, "grid_disk", lambda *_: ["ghi789", "missing", "abc123"])
+    selector = HexSelector(sample_scores)
+    neighbors = selector.get_neighbors("abc123", k=1)
+    assert neighbors["hex_id"].tolist() == ["abc123", "ghi789"]
+
+    selector.df = sample_scores.iloc[::-1]
+    assert selector.get_neighbors("abc123", k=1)["hex_id"].tolist() == ["ghi789", "abc123"]
+    assert selector.get_neighbor_ids("abc123", k=1) == ["ghi789", "abc123"]
+
+
 def test_hex_selector_comparison_data(sample_scores: pd.DataFrame) -> None:
     selector = HexSelector(sample_scores)
     selector.select_hex("abc123")
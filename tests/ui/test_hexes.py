@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import pytest
 
@@ -15,14 +18,15 @@ def test_hex_geometry_helpers_cache(fake_h3) -> None:
 
     assert fake_h3.boundary_calls.count(hex_id) == 1
 
-    # Cached calls should not trigger additional boundary lookups for the same helper.
+    # All helpers share one per-hex record, so repeat and cross-format calls are free.
     hexes.hex_to_geojson(hex_id)
     assert fake_h3.boundary_calls.count(hex_id) == 1
 
-    hexes.hex_to_wkt(hex_id)
-    assert fake_h3.boundary_calls.count(hex_id) == 2
+    assert hexes.hex_to_wkt(hex_id).startswith("POLYGON((")
+    assert fake_h3.boundary_calls.count(hex_id) == 1
 
-    _ = hexes.hex_centroid(hex_id)
+    assert hexes.hex_centroid(hex_id) == pytest.approx((-104.955, 39.045))
+    assert fake_h3.centroid_calls.count(hex_id) == 1
 
 
 @pytest.mark.usefixtures("fake_h3")
@@ -50,6 +54,87 @@ def test_hex_geometry_cache_and_validation(fake_h3) -> None:
         cache.validate(["missing"])
 
 
+@pytest.mark.usefixtures("fake_h3")
+def test_hex_geometry_caches_share_conversions(fake_h3) -> None:
+    first = hexes.HexGeometryCache().ensure_geometries(["abc123", "def456"])
+    second = hexes.HexGeometryCache().ensure_geometries(["abc123"])
+    assert fake_h3.boundary_calls.count("abc123") == 1
+    assert second.loc[0, "geometry_wkt"] == first.loc[0, "geometry_wkt"]
+    assert hexes._hex_record.cache_info().maxsize == hexes.SHARED_MAX_ENTRIES
+
+
+@pytest.mark.usefixtures("fake_h3")
+def test_hex_geometry_cache_store_view() -> None:
+    cache = hexes.HexGeometryCache()
+    frame = cache.ensure_geometries(["abc123", "def456"])
+    store = cache.store
+    assert list(store) == ["abc123", "def456"]
+    assert "abc123" in store and "missing" not in store
+    entry = store["abc123"]
+    assert entry.as_record() == frame.iloc[0].to_dict()
+
+
+@pytest.mark.usefixtures("fake_h3")
+def test_hex_helpers_miss_in_constant_time_at_capacity(monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_array_cache(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("single-hex helpers must not grow a HexGeometryCache")
+
+    monkeypatch.setattr(hexes.HexGeometryCache, "_append", no_array_cache)
+    monkeypatch.setattr(hexes.HexGeometryCache, "_evict", no_array_cache)
+
+    def time_misses(prefix: str, count: int = 500) -> float:
+        start = time.perf_counter()
+        for index in range(count):
+            hexes.hex_centroid(f"{prefix}{index}")
+        return (time.perf_counter() - start) / count
+
+    cold = time_misses("cold")
+    for index in range(hexes.SHARED_MAX_ENTRIES):
+        hexes.hex_to_wkt(f"fill{index}")
+    assert hexes._hex_record.cache_info().currsize == hexes.SHARED_MAX_ENTRIES
+
+    at_capacity = time_misses("full")
+    assert hexes._hex_record.cache_info().currsize == hexes.SHARED_MAX_ENTRIES
+    # Every miss now also evicts; it must stay O(1), not scale with the cache size.
+    assert at_capacity < cold * 5 + 1e-4
+
+
+@pytest.mark.usefixtures("fake_h3")
+def test_hex_geometry_cache_evicts_least_recently_requested(fake_h3) -> None:
+    cache = hexes.HexGeometryCache(max_entries=3)
+    cache.ensure_geometries(["abc123", "def456"])
+    cache.ensure_geometries(["ghi789"])
+    cache.ensure_geometries(["abc123"])
+
+    frame = cache.ensure_geometries(["jkl012", "mno345"])
+    assert frame["hex_id"].tolist() == ["jkl012", "mno345"]
+    assert len(cache) == 3
+    assert "abc123" in cache
+    assert "def456" not in cache and "ghi789" not in cache
+
+    # A single request larger than the cap is served in full.
+    wide = ["abc123", "pqr678", "stu901", "vwx234"]
+    assert cache.ensure_geometries(wide)["hex_id"].tolist() == wide
+    cache.validate(wide)
+
+
+@pytest.mark.usefixtures("fake_h3")
+def test_hex_geometry_cache_is_safe_across_threads(fake_h3) -> None:
+    cache = hexes.HexGeometryCache(max_entries=50)
+    batches = [[f"hex{(start + offset) % 200:04d}" for offset in range(20)] for start in range(400)]
+
+    def _load(batch: list[str]) -> bool:
+        frame = cache.ensure_geometries(batch)
+        expected = [hexes.hex_to_wkt(hex_id) for hex_id in batch]
+        return frame["hex_id"].tolist() == batch and frame["geometry_wkt"].tolist() == expected
+
+    # Every batch overflows the cap somewhere, so threads keep evicting under each other.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(_load, batches))
+    assert len(cache) <= 50
+    assert set(cache.store) == set(cache._index)
+
+
 @pytest.mark.usefixtures("fake_h3")
 def test_build_hex_index(fake_h3) -> None:
     geometries = pd.DataFrame(
@@ -65,17 +150,26 @@ def test_build_hex_index(fake_h3) -> None:
         assert all(child in geometries["hex_id"].values for child in children)
 
 
+@pytest.mark.usefixtures("fake_h3")
+def test_parents_for_resolution_converts_each_cell_once(fake_h3) -> None:
+    parents = hexes.parents_for_resolution(["abc123", "def456", "abc123"], 7)
+    assert parents.tolist() == ["abc123_r7", "def456_r7", "abc123_r7"]
+    assert fake_h3.parent_requests == [("abc123", 7), ("def456", 7)]
+
+
 @pytest.mark.usefixtures("fake_h3")
 def test_hex_spatial_index_bbox_fallback(fake_h3) -> None:
     cache = hexes.HexGeometryCache()
     frame = cache.ensure_geometries(["abc123", "def456"])
     index = hexes.HexSpatialIndex(frame)
-    index._tree = None
-    index._box = None
     lon_min = float(frame["centroid_lon"].min()) - 0.001
     lat_min = float(frame["centroid_lat"].min()) - 0.001
     lon_max = float(frame["centroid_lon"].max()) + 0.001
     lat_max = float(frame["centroid_lat"].max()) + 0.001
+    assert set(index.query_bbox(lon_min, lat_min, lon_max, lat_max)) == set(frame["hex_id"])
+
+    index._tree = None
+    index._box = None
     matches = index.query_bbox(lon_min, lat_min, lon_max, lat_max)
     assert set(matches) == set(frame["hex_id"].astype(str))
 
@@ -11,7 +11,7 @@ class StubContext:
     def __init__(self, overlays: Mapping[str, Mapping[str, object]]) -> None:
         self._overlays = overlays
 
-    def get_overlay(self, key: str) -> Mapping[str, object]:
+    def get_overlay(self, key: str, zoom: float | None = None) -> Mapping[str, object]:
         return self._overlays.get(key, {"type": "FeatureCollection", "features": []})
 
 
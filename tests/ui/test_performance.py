@@ -19,8 +19,8 @@ class FakeTime:
     def __init__(self) -> None:
         self._calls = 0
 
-    def perf_counter(self) -> float:
-        value = self._calls * 0.05
+    def perf_counter_ns(self) -> int:
+        value = self._calls * 50_000_000
         self._calls += 1
         return value
 
@@ -70,3 +70,20 @@ def test_performance_monitor_statistics() -> None:
     assert monitor.get_stats("missing") is None
     all_stats = monitor.get_all_stats()
     assert "load" in all_stats
+
+
+def test_performance_monitor_streaming_percentiles() -> None:
+    monitor = performance.PerformanceMonitor()
+    values = [float((i * 7919) % 1000) for i in range(5000)]
+    for value in values:
+        monitor.record("render", value)
+
+    stats = monitor.get_stats("render")
+    assert stats is not None
+    ordered = sorted(values)
+    assert stats["count"] == 5000
+    assert stats["min"] == ordered[0]
+    assert stats["max"] == ordered[-1]
+    assert stats["p50"] == pytest.approx(ordered[2500], rel=0.05)
+    assert stats["p95"] == pytest.approx(ordered[4750], rel=0.05)
+    assert len(monitor.summaries["render"].quantiles[50]._heights) == 5
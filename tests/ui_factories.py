@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
-import json
 import os
+import shutil
 from collections.abc import Sequence
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from Urban_Amenities2.ui.config import UISettings
 
 
-def make_filter_dataset() -> pd.DataFrame:
-    """Create a deterministic dataset for filter-related tests."""
-
+def _build_filter_dataset() -> pd.DataFrame:
     data = {
         "hex_id": [
             "8928308280fffff",
@@ -33,12 +36,13 @@ def make_filter_dataset() -> pd.DataFrame:
         "lat": [39.7, 39.8, 40.7, 43.6, 43.7],
         "lon": [-104.9, -104.8, -111.8, -116.2, -116.1],
     }
-    return pd.DataFrame(data)
+    # Categorical filter columns let equality and isin checks compare integer codes.
+    return pd.DataFrame(data).astype(
+        {"state": "category", "metro": "category", "county": "category", "land_use": "category"}
+    )
 
 
-def make_export_dataset() -> pd.DataFrame:
-    """Dataset for export-related tests including required columns."""
-
+def _build_export_dataset() -> pd.DataFrame:
     data = {
         "hex_id": ["8928308280fffff", "8928308280bffff"],
         "state": ["CO", "CO"],
@@ -53,11 +57,30 @@ def make_export_dataset() -> pd.DataFrame:
         "cte": [60.0, 30.0],
         "sou": [70.0, 40.0],
     }
-    frame = pd.DataFrame(data)
+    frame = pd.DataFrame(data).astype(
+        {"state": "category", "metro": "category", "county": "category"}
+    )
     frame["hex_id"] = frame["hex_id"].astype(str)
     return frame
 
 
+# Built once per session; callers get their own copy so tests may mutate freely.
+_FILTER_DATASET = _build_filter_dataset()
+_EXPORT_DATASET = _build_export_dataset()
+
+
+def make_filter_dataset() -> pd.DataFrame:
+    """Create a deterministic dataset for filter-related tests."""
+
+    return _FILTER_DATASET.copy()
+
+
+def make_export_dataset() -> pd.DataFrame:
+    """Dataset for export-related tests including required columns."""
+
+    return _EXPORT_DATASET.copy()
+
+
 def make_ui_settings(data_path: Path) -> UISettings:
     """Construct UI settings backed by a deterministic dataset path."""
 
@@ -78,6 +101,35 @@ def make_ui_settings(data_path: Path) -> UISettings:
     )
 
 
+_SCORE_OFFSETS: dict[str, tuple[float, float]] = {
+    "aucs": (60.0, 5.0),
+    "EA": (50.0, 1.0),
+    "LCA": (48.0, 1.0),
+    "MUHAA": (47.0, 1.0),
+    "JEA": (46.0, 1.0),
+    "MORR": (45.0, 1.0),
+    "CTE": (44.0, 1.0),
+    "SOU": (43.0, 1.0),
+}
+_SCORE_SCHEMA = pa.schema(
+    [("hex_id", pa.string()), *((column, pa.float64()) for column in _SCORE_OFFSETS)]
+)
+_METADATA_SCHEMA = pa.schema(
+    [(column, pa.string()) for column in ("hex_id", "state", "metro", "county")]
+)
+
+
+def _write_parquet(table: pa.Table, path: Path, dictionary_columns: Sequence[str]) -> None:
+    pq.write_table(
+        table,
+        path,
+        compression="lz4_raw",
+        use_dictionary=list(dictionary_columns),
+        write_statistics=True,
+        row_group_size=max(table.num_rows, 1),
+    )
+
+
 def write_ui_dataset(
     base_path: Path,
     identifier: str,
@@ -89,20 +141,13 @@ def write_ui_dataset(
 ) -> None:
     """Materialise parquet score and metadata files for UI regression tests."""
 
-    scores = pd.DataFrame(
-        {
-            "hex_id": list(hex_ids),
-            "aucs": [float(60 + index * 5) for index in range(len(hex_ids))],
-            "EA": [float(50 + index) for index in range(len(hex_ids))],
-            "LCA": [float(48 + index) for index in range(len(hex_ids))],
-            "MUHAA": [float(47 + index) for index in range(len(hex_ids))],
-            "JEA": [float(46 + index) for index in range(len(hex_ids))],
-            "MORR": [float(45 + index) for index in range(len(hex_ids))],
-            "CTE": [float(44 + index) for index in range(len(hex_ids))],
-            "SOU": [float(43 + index) for index in range(len(hex_ids))],
-        }
+    count = len(hex_ids)
+    hex_array = pa.array([str(hex_id) for hex_id in hex_ids], pa.string())
+    offsets = np.arange(count, dtype=np.float64)
+    scores = pa.Table.from_arrays(
+        [hex_array, *(pa.array(start + step * offsets) for start, step in _SCORE_OFFSETS.values())],
+        schema=_SCORE_SCHEMA,
     )
-    scores["hex_id"] = scores["hex_id"].astype(str)
     if nested:
         run_dir = base_path / identifier
         run_dir.mkdir(parents=True, exist_ok=True)
@@ -111,29 +156,43 @@ def write_ui_dataset(
     else:
         scores_path = base_path / f"{identifier}_scores.parquet"
         metadata_path = base_path / f"{identifier}_metadata.parquet"
-    scores.to_parquet(scores_path)
-
-    metadata = pd.DataFrame(
-        {
-            "hex_id": list(hex_ids),
-            "state": list(states),
-            "metro": [f"Metro {identifier}"] * len(hex_ids),
-            "county": [f"County {identifier}"] * len(hex_ids),
-        }
+    _write_parquet(scores, scores_path, ["hex_id"])
+
+    metadata = pa.Table.from_arrays(
+        [
+            hex_array,
+            pa.array(list(states), pa.string()),
+            pa.array([f"Metro {identifier}"] * count, pa.string()),
+            pa.array([f"County {identifier}"] * count, pa.string()),
+        ],
+        schema=_METADATA_SCHEMA,
     )
-    metadata["hex_id"] = metadata["hex_id"].astype(str)
-    metadata.to_parquet(metadata_path)
+    _write_parquet(metadata, metadata_path, _METADATA_SCHEMA.names)
 
-    epoch = timestamp.timestamp()
-    scores_path.touch()
-    os.utime(scores_path, (epoch, epoch))
-    os.utime(metadata_path, (epoch, epoch))
+    # Both files share a directory, so resolve it once and stamp the entries relative
+    # to that handle where the platform allows it.
+    times = (timestamp.timestamp(),) * 2
+    if os.utime not in os.supports_dir_fd:
+        for path in (scores_path, metadata_path):
+            os.utime(path, times)
+        return
+    dir_fd = os.open(scores_path.parent, os.O_RDONLY)
+    try:
+        for path in (scores_path, metadata_path):
+            os.utime(path.name, times, dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
 
 
-def write_overlay_file(base: Path, name: str, label: str) -> Path:
-    """Create a simple GeoJSON overlay for regression tests."""
+def copy_ui_dataset(template: Path, destination: Path) -> Path:
+    """Copy a pre-written dataset template into ``destination``, preserving mtimes."""
 
-    base.mkdir(parents=True, exist_ok=True)
+    shutil.copytree(template, destination, dirs_exist_ok=True)
+    return destination
+
+
+@lru_cache(maxsize=32)
+def _overlay_payload(label: str) -> bytes:
     payload = {
         "type": "FeatureCollection",
         "features": [
@@ -155,12 +214,20 @@ def write_overlay_file(base: Path, name: str, label: str) -> Path:
             }
         ],
     }
+    return orjson.dumps(payload)
+
+
+def write_overlay_file(base: Path, name: str, label: str) -> Path:
+    """Create a simple GeoJSON overlay for regression tests."""
+
+    base.mkdir(parents=True, exist_ok=True)
     path = base / f"{name}.geojson"
-    path.write_text(json.dumps(payload))
+    path.write_bytes(_overlay_payload(label))
     return path
 
 
 __all__ = [
+    "copy_ui_dataset",
     "make_export_dataset",
     "make_filter_dataset",
     "make_ui_settings",